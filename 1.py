@@ -1,6 +1,5 @@
 import os
 import sys
-import sqlite3
 import logging
 import io
 import PyPDF2
@@ -9,6 +8,27 @@ import re
 from datetime import datetime
 from flask import Flask, render_template, request, redirect, url_for, session, flash, send_file
 import joblib
+import numpy as np
+from job_vectors import JobVectorStore
+from scoring import similarity_scores, top_k_indices, title_matches
+from skill_matcher import SkillCatalogue, SkillMatcher
+from skills import SkillDictionary
+from prediction_cache import PredictionCache
+from fast_knn import accelerate
+from storage import open_storage
+import recommendation_store
+import deletion
+import insights
+import fragment_cache
+from assets import Assets
+from migrations import migrate
+from task_queue import TaskQueue, Worker
+from admin_api import AdminAPI
+from search import SearchAPI
+from dashboard_api import DashboardAPI
+from catalogue_cache import CatalogueCache
+from records import ScoringProfile, ReportProfile, load_profile, load_jobs
+from course_index import CourseIndex
 
 # Force flush stdout
 sys.stdout.reconfigure(line_buffering=True)
@@ -21,6 +41,8 @@ logger = logging.getLogger(__name__)
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(APP_DIR, "data.db")
 MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+JOB_VECTORS_PATH = os.path.join(APP_DIR, "models", "job_vectors.pkl")
+PREDICTION_CACHE_PATH = os.path.join(APP_DIR, "models", "prediction_cache.db")
 UPLOAD_FOLDER = os.path.join(APP_DIR, "uploads")
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
@@ -28,6 +50,15 @@ app = Flask(__name__)
 app.secret_key = "kkit_career_portal_v3_secret"
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 app.config['TEMPLATES_AUTO_RELOAD'] = True
+
+# Storage: "sqlite" (data.db) or "memory" (the bundled CSVs, for tests and benchmarks),
+# e.g. FLASK_STORAGE=memory FLASK_STORAGE_SCALE=100 python 1.py
+app.config.update(STORAGE="sqlite", STORAGE_SCALE=1)
+app.config.from_prefixed_env()
+storage = open_storage(app.config["STORAGE"], DB_PATH, scale=app.config["STORAGE_SCALE"])
+DB_PATH = storage.db_path
+JOB_VECTORS_PATH, PREDICTION_CACHE_PATH = (storage.artifact_path(p) for p in (JOB_VECTORS_PATH, PREDICTION_CACHE_PATH))
+db_pool = storage.pool
 ALLOWED_EXTENSIONS = {"pdf", "docx"}
 
 # --- Load Pre-trained AI Model (Prediction Only) ---
@@ -35,8 +66,7 @@ model = None
 vectorizer = None
 try:
     if os.path.exists(MODEL_PATH):
-        from sklearn.metrics.pairwise import cosine_similarity
-        model = joblib.load(MODEL_PATH)
+        model = accelerate(joblib.load(MODEL_PATH))  # indexed KNN, same predictions
         logger.info("AI Model loaded successfully")
         try:
             vectorizer = model.named_steps.get("tfidf", None)
@@ -47,232 +77,158 @@ try:
 except Exception as e:
     logger.error(f"Error loading model: {e}")
 
+# Memoized model.predict (LRU in memory, shared with other workers on disk)
+predictions = PredictionCache(model, MODEL_PATH, disk_path=PREDICTION_CACHE_PATH) if model else None
+
 # --- DB Initialization ---
 def init_db():
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        cur.execute("CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, email TEXT UNIQUE NOT NULL, password TEXT NOT NULL, role TEXT DEFAULT 'student', created_at TEXT)")
-        cur.execute("CREATE TABLE IF NOT EXISTS student_profile (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER UNIQUE NOT NULL, full_name TEXT, register_number TEXT, college_name TEXT, batch_year TEXT, current_semester TEXT, skills TEXT, skill_ratings TEXT, experience TEXT, interests TEXT, tech_stack TEXT, location TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id))")
-        cur.execute("CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, required_skills TEXT, posted_by TEXT, application_link TEXT, created_at TEXT)")
-        cur.execute("CREATE TABLE IF NOT EXISTS job_recommendations (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, match_score REAL, match_reason TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id), FOREIGN KEY (job_id) REFERENCES jobs(id))")
-        cur.execute("CREATE TABLE IF NOT EXISTS courses (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, category TEXT, course_link TEXT, added_by TEXT, created_at TEXT)")
-        cur.execute("CREATE TABLE IF NOT EXISTS course_videos (id INTEGER PRIMARY KEY AUTOINCREMENT, course_id INTEGER, video_title TEXT, video_url TEXT, category TEXT, FOREIGN KEY (course_id) REFERENCES courses(id))")
-        cur.execute("CREATE TABLE IF NOT EXISTS job_trends (id INTEGER PRIMARY KEY AUTOINCREMENT, job_role TEXT, industry TEXT, trending_skills TEXT, year TEXT, added_by TEXT, created_at TEXT)")
-        conn.commit()
-        conn.close()
+        migrate(DB_PATH)
     except Exception as e:
         logger.error(f"DB Init Error: {e}")
 
 init_db()
 
+# --- Job Vector Store ---
+job_store = None
+if vectorizer is not None:
+    try:
+        job_store = JobVectorStore(vectorizer, DB_PATH, JOB_VECTORS_PATH, model_path=MODEL_PATH)
+        job_store.load()
+    except Exception as e:
+        logger.error(f"Job vector store unavailable: {e}")
+        job_store = None
+
+# --- Skill Dictionary (canonical skill IDs for jobs, profiles and courses) ---
+skill_dictionary = SkillDictionary(DB_PATH)
+try:
+    skill_dictionary.load()
+    skill_dictionary.backfill()
+except Exception as e:
+    logger.error(f"Skill dictionary unavailable: {e}")
+
+# Required-skills strings compiled once into interned skill IDs
+skill_catalogue = SkillCatalogue()
+
 # --- DB Helpers ---
 def db_fetchall(query, params=()):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params)
-            return cur.fetchall()
+        return db_pool.fetchall(query, params)
     except Exception as e:
         logger.error(f"DB Fetch Error: {e}")
         return []
 
 def db_execute(query, params=()):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params)
-            conn.commit()
-            return cur.lastrowid
+        return db_pool.execute(query, params)
     except Exception as e:
         logger.error(f"DB Execute Error: {e}")
         raise e
 
+admin_api = AdminAPI(db_fetchall)
+app.register_blueprint(admin_api.blueprint)
+app.register_blueprint(SearchAPI(db_fetchall).blueprint)
+
+# Courses, videos and trends only change through admin(); dashboards read them from here
+catalogue = CatalogueCache(db_fetchall)
+# Skill token -> courses, rebuilt from the catalogue when courses change; filters the courses tab
+course_index = CourseIndex(catalogue)
+# Fingerprinted CSS/JS (asset() in templates) and gzip/brotli responses
+static_assets = Assets(app)
+# ETag of the dashboard shell, from the version stamps of what it shows
+dashboard_page = fragment_cache.PageETag(os.path.join(APP_DIR, "templates", "dashboard.html"), assets=static_assets)
+
 # --- ML Logic ---
-def build_student_text(profile_row):
-    if not profile_row: return ""
-    # index 7: skills, 8: skill_ratings, 10: interests, 11: tech_stack, 9: experience
-    parts = [str(profile_row[7]), str(profile_row[10]), str(profile_row[11]), str(profile_row[9])]
+def build_student_text(profile):
+    if not profile: return ""
+    # records.ScoringProfile
+    parts = [str(profile.skills), str(profile.interests), str(profile.tech_stack), str(profile.experience)]
     return " ".join([p for p in parts if p and p != 'None']).lower()
 
-def job_text(job_row):
-    if not job_row: return ""
-    # index 1: title, 2: description, 3: required_skills
-    parts = [str(job_row[1]), str(job_row[2]), str(job_row[3])]
+def job_text(job):
+    if not job: return ""
+    # records.Job
+    parts = [str(job.title), str(job.description), str(job.required_skills)]
     return " ".join([p for p in parts if p and p != 'None']).lower()
 
-def calculate_skill_match_score(profile_skills, profile_ratings, job_skills, experience_years, min_exp_required):
-    """
-    Calculate a realistic skill match score based on:
-    - Individual skill matches with ratings
-    - Skill importance levels
-    - Experience requirements
-    - Skill gaps analysis
-    """
-    if not profile_skills or not job_skills:
-        return 0.0, "Insufficient profile data"
-
-    # Parse profile skills and ratings
-    skill_dict = {}
-    if profile_ratings:
-        ratings_list = [int(r.strip()) for r in profile_ratings.split(',') if r.strip()]
-        skills_list = [s.strip().lower() for s in profile_skills.split(',') if s.strip()]
-
-        for i, skill in enumerate(skills_list):
-            rating = ratings_list[i] if i < len(ratings_list) else 3  # Default rating of 3
-            skill_dict[skill] = rating
-
-    # Parse job required skills
-    job_skill_list = [s.strip().lower() for s in job_skills.split(';') if s.strip()]
-
-    # Categorize skills by importance (technical skills are more critical)
-    technical_keywords = ['python', 'java', 'javascript', 'sql', 'react', 'node', 'aws', 'docker',
-                         'kubernetes', 'git', 'linux', 'tensorflow', 'pytorch', 'ml', 'ai']
-
-    # Calculate skill matches
-    matched_skills = []
-    missing_skills = []
-    skill_score = 0.0
-    total_weight = 0.0
-
-    for job_skill in job_skill_list:
-        job_skill_lower = job_skill.lower()
-        weight = 2.0 if any(keyword in job_skill_lower for keyword in technical_keywords) else 1.0
-        total_weight += weight
-
-        # Find best matching profile skill
-        best_match = None
-        best_rating = 0
-
-        for profile_skill, rating in skill_dict.items():
-            # Exact match gets full credit
-            if profile_skill == job_skill_lower:
-                best_match = profile_skill
-                best_rating = rating
-                break
-            # Partial match (contains) gets partial credit
-            elif job_skill_lower in profile_skill or profile_skill in job_skill_lower:
-                if rating > best_rating:
-                    best_match = profile_skill
-                    best_rating = rating
-
-        if best_match:
-            matched_skills.append(f"{best_match}({best_rating})")
-
-            # Rating-based scoring (1-5 scale)
-            # Convert to 0-1 scale and apply weight
-            normalized_rating = (best_rating - 1) / 4.0  # 0.0 to 1.0
-            skill_score += normalized_rating * weight
-        else:
-            missing_skills.append(job_skill)
-
-    # Experience factor (if experience data available)
-    exp_factor = 1.0
-    if experience_years is not None and min_exp_required is not None:
-        try:
-            exp_years = float(experience_years)
-            min_exp = float(min_exp_required)
-            if exp_years < min_exp:
-                exp_factor = max(0.3, exp_years / min_exp)  # Penalty for insufficient experience
-            elif exp_years > min_exp * 1.5:
-                exp_factor = 1.1  # Bonus for extensive experience
-        except:
-            pass
-
-    # Calculate final score
-    if total_weight > 0:
-        base_score = (skill_score / total_weight) * exp_factor
-
-        # Apply realistic caps based on skill gaps
-        skill_match_ratio = len(matched_skills) / len(job_skill_list)
-
-        if skill_match_ratio >= 0.8:  # 80%+ skills match
-            max_score = 0.85
-        elif skill_match_ratio >= 0.6:  # 60%+ skills match
-            max_score = 0.75
-        elif skill_match_ratio >= 0.4:  # 40%+ skills match
-            max_score = 0.65
-        else:  # Less than 40% skills match
-            max_score = 0.45
-
-        final_score = min(base_score, max_score)
-
-        # Generate detailed reason
-        if len(missing_skills) == 0:
-            reason = f"Excellent match! All {len(matched_skills)} required skills present"
-        elif len(missing_skills) <= 2:
-            reason = f"Good match with {len(missing_skills)} skill gap(s): {', '.join(missing_skills[:2])}"
-        else:
-            reason = f"Moderate match - {len(missing_skills)} missing skills including {', '.join(missing_skills[:3])}"
-
-        return final_score, reason
-    else:
-        return 0.0, "Unable to analyze skills"
-
-def recommend_jobs_logic(profile_row, all_jobs, top_k=10):
+def recommend_jobs_logic(profile, all_jobs, top_k=10):
     """
     Enhanced job recommendation with accurate skill matching
     """
-    from sklearn.metrics.pairwise import cosine_similarity
     recs = []
 
     # Extract profile data
-    profile_skills = profile_row[7] if profile_row else ""  # skills
-    profile_ratings = profile_row[8] if profile_row else ""  # skill_ratings
-    experience_years = profile_row[9] if profile_row else None  # experience
+    profile_skills = profile.skills if profile else ""
+    profile_ratings = profile.skill_ratings if profile else ""
+    experience_years = profile.experience if profile else None
 
     # AI model prediction (for additional insights)
-    profile_text = build_student_text(profile_row)
+    profile_text = build_student_text(profile)
     predicted_label = None
     if model:
         try:
-            predicted_label = str(model.predict([profile_text])[0]).strip().lower()
+            predicted_label = predictions.predict(profile_text).strip().lower()
         except:
             pass
 
-    for idx, job in enumerate(all_jobs):
-        job_title = (job[1] or "").lower()
-        job_description = (job[2] or "")
-        job_required_skills = (job[3] or "")
-        min_exp_required = job[4] if len(job) > 4 else 0  # experience requirement
-
-        # Calculate skill-based match score
-        skill_score, skill_reason = calculate_skill_match_score(
-            profile_skills, profile_ratings, job_required_skills,
-            experience_years, min_exp_required
-        )
-
-        # Boost score slightly if AI prediction matches job title
-        ai_boost = 0.0
-        if predicted_label and (predicted_label in job_title or job_title in predicted_label):
-            ai_boost = 0.08  # Small boost for AI career path alignment
-            skill_reason += f" + AI career alignment bonus"
-
-        # Text similarity as secondary factor (reduced weight)
-        text_sim = 0.0
-        if vectorizer:
-            try:
-                job_text_content = job_text(job)
-                texts = [profile_text, job_text_content]
-                tfidf = vectorizer.transform(texts)
-                text_sim = float(cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0])
-                text_sim *= 0.15  # Much lower weight for text similarity
-            except:
-                pass
-
-        # Combine scores
-        final_score = min(skill_score + ai_boost + text_sim, 0.95)  # Cap at 95% for realism
-
-        # Only include jobs with minimum match threshold
-        if final_score >= 0.25:  # 25% minimum match
-            recs.append({
-                "job_id": job[0],
-                "score": round(final_score, 3),
-                "reason": skill_reason
-            })
-
-    # Sort by score and return top matches
-    return predicted_label, sorted(recs, key=lambda x: x["score"], reverse=True)[:top_k]
+    # Text similarity for every job in one sparse product
+    sims = np.zeros(len(all_jobs))
+    if vectorizer and all_jobs:
+        try:
+            if job_store is not None:
+                job_store.ensure_fresh()
+                job_vecs = job_store.vectors_for(all_jobs)
+            else:
+                job_vecs = vectorizer.transform([job_text(j) for j in all_jobs])
+            sims = similarity_scores(vectorizer.transform([profile_text]), job_vecs)
+        except:
+            pass
+
+    if not all_jobs:
+        return predicted_label, recs
+
+    # Skill scores for the whole catalogue: profile parsed once, jobs compiled once
+    matcher = SkillMatcher(skill_catalogue, profile_skills, profile_ratings)
+    job_skills = skill_catalogue.job_matrix([job.required_skills or "" for job in all_jobs])
+    # jobs has no experience-requirement column (index 4 of the old SELECT * rows was posted_by,
+    # which never parsed as a number), so no job applies an experience factor
+    min_exp_required = [None] * len(all_jobs)
+    skill = matcher.score_all(job_skills, experience_years, min_exp_required)
+
+    # Small boost for AI career path alignment, text similarity as a low-weight secondary factor
+    ai_match = title_matches(predicted_label, [(job.title or "").lower() for job in all_jobs])
+    ai_boost = np.where(ai_match, 0.08, 0.0)
+    final_score = np.minimum(skill.final + ai_boost + sims * 0.15, 0.95)  # Cap at 95% for realism
+
+    # Only include jobs with minimum match threshold
+    eligible = final_score >= 0.25  # 25% minimum match
+    scores = np.round(final_score, 3)
+
+    # Partial top-k selection instead of sorting every match
+    for idx in top_k_indices(scores, top_k, eligible):
+        reason = skill.reason(idx)
+        if ai_match[idx]:
+            reason += f" + AI career alignment bonus"
+        recs.append({
+            "job_id": all_jobs[idx].id,
+            "score": float(scores[idx]),
+            "reason": reason
+        })
+    return predicted_label, recs
+
+# --- Background Recommendation Refresh ---
+def rescore_user(payload):
+    """Task handler: recompute and store one student's recommendations"""
+    uid = payload["user_id"]
+    profile = load_profile(db_fetchall, uid, ScoringProfile)
+    if not profile: return
+    label, results = recommend_jobs_logic(profile, load_jobs(db_fetchall))
+    with db_pool.connection() as conn:
+        recommendation_store.replace_user(conn, uid, results, datetime.now().strftime("%Y-%m-%d %H:%M"))
+
+task_queue = TaskQueue(DB_PATH)
+task_queue.purge()  # finished tasks older than a day
+recommendation_worker = Worker(task_queue, {"rescore_user": rescore_user}, threads=2).start()
 
 # --- Routes ---
 @app.route("/")
@@ -310,67 +266,40 @@ def register():
             except: flash("Error: Username or Email already exists.", "danger")
     return render_template("register.html")
 
+def dashboard_courses(uid):
+    """The courses tab of ``uid``: courses mentioning profile or recommended-job skills, most skills first"""
+    # Student and recommended-job skills as skill ID sets (normalized when they were saved)
+    student_skills = skill_dictionary.profile_skill_ids(uid)
+    recommended_job_skills = set()
+    job_ids = [row[0] for row in db_fetchall("SELECT job_id FROM job_recommendations WHERE user_id=?", (uid,))]
+    for job_skills in skill_dictionary.job_skill_ids(job_ids).values():
+        recommended_job_skills |= job_skills
+
+    wanted_skills = student_skills | recommended_job_skills
+    wanted_names = [skill_dictionary.names[s] for s in wanted_skills if s in skill_dictionary.names]
+    return course_index.match(wanted_names, limit=6)
+
+# The dashboard tabs' lists, fetched by the page when a tab is opened; courses are picked per student
+app.register_blueprint(DashboardAPI(db_fetchall, catalogue, courses_for=dashboard_courses, alphabetical=True).blueprint)
+
 @app.route("/dashboard")
 def dashboard():
     if session.get("role") != "student": return redirect(url_for("login"))
     uid = session.get("user_id")
-    profile = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (uid,))
+    # The page is a shell stamped by the snapshot version; each tab fetches its list from dashboard_api
+    snapshot = insights.get(db_pool, uid)
+    pending = task_queue.pending("rescore_user", uid)
+    tag = None
+    if snapshot and not session.get("_flashes"):
+        tag = dashboard_page.etag(uid, session.get("username"), snapshot.version, pending)
+    unchanged = fragment_cache.not_modified(tag)
+    if unchanged: return unchanged
+
+    profile = load_profile(db_fetchall, uid)
     if not profile: return render_template("dashboard.html", student=None, needs_profile=True)
 
-    recs = db_fetchall("SELECT j.*, r.match_score, r.match_reason FROM job_recommendations r JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC", (uid,))
-    
-    # Dynamic Filtering for Courses and Videos based on matched job skills
-    matched_skills = ""
-    for r in recs: matched_skills += " " + (r[3] or "")
-    
-    all_courses = db_fetchall("SELECT * FROM courses ORDER BY id DESC")
-    filtered_courses = []
-    for c in all_courses:
-        # If course title or category matches profile skills or recommended job skills
-        if any(skill.strip().lower() in (c[1] + " " + c[3]).lower() for skill in (profile[0][7] or "").split(",")) or any(skill.strip().lower() in (c[1] + " " + c[3]).lower() for skill in matched_skills.split(",")):
-            filtered_courses.append(c)
-    
-    all_videos = db_fetchall("SELECT v.*, c.title FROM course_videos v LEFT JOIN courses c ON v.course_id = c.id ORDER BY v.id DESC")
-    filtered_videos = []
-
-    # Get student's skills
-    student_skills = set(skill.strip().lower() for skill in (profile[0][7] or "").split(",") if skill.strip())
-
-    # Get all recommended job skills to identify skill gaps
-    recommended_job_skills = set()
-    for r in recs:
-        job_skills = (r[3] or "").lower().split(";")  # Assuming skills are semicolon-separated in jobs
-        recommended_job_skills.update(skill.strip() for skill in job_skills if skill.strip())
-
-    # Identify skill gaps (skills required by jobs but not possessed by student)
-    skill_gaps = recommended_job_skills - student_skills
-
-    for v in all_videos:
-        video_title = (v[2] or "").lower()
-        video_category = (v[4] or "").lower()
-
-        # Always include Communication Training and Placement Preparation videos
-        if video_category in ["Communication Training", "Placement Preparation"]:
-            filtered_videos.append(v)
-        # Filter Recommended Videos based on skill gaps (missing skills from job matches)
-        elif video_category == "Recommended Videos":
-            # Show videos that help fill skill gaps
-            if any(gap_skill in video_title for gap_skill in skill_gaps):
-                filtered_videos.append(v)
-            # Also show videos related to recommended job skills that student doesn't have
-            elif any(job_skill in video_title for job_skill in recommended_job_skills if job_skill not in student_skills):
-                filtered_videos.append(v)
-            # If no skills profile yet or no job recommendations, show some videos
-            elif not profile[0][7] or not recs:
-                filtered_videos.append(v)
-
-    # Get all unique course categories for dynamic tabs
-    all_course_categories = db_fetchall("SELECT DISTINCT category FROM courses ORDER BY category")
-
-    return render_template("dashboard.html", student=profile[0], recommendations=recs,
-                           trends=db_fetchall("SELECT * FROM job_trends ORDER BY id DESC"),
-                           courses=filtered_courses[:6], videos=all_videos,
-                           course_categories=all_course_categories, needs_profile=False)
+    return fragment_cache.conditional(render_template("dashboard.html", student=profile, match_confidence=snapshot.confidence,
+                           needs_profile=False, recs_pending=pending), tag)
 
 @app.route("/save_profile", methods=["POST"])
 def save_profile():
@@ -383,25 +312,42 @@ def save_profile():
 
     if db_fetchall("SELECT id FROM student_profile WHERE user_id=?", (uid,)):
         db_execute("UPDATE student_profile SET full_name=?, register_number=?, college_name=?, batch_year=?, current_semester=?, skills=?, skill_ratings=?, experience=?, interests=?, tech_stack=?, location=?, created_at=? WHERE user_id=?", data[1:] + (uid,))
-        db_execute("DELETE FROM job_recommendations WHERE user_id=?", (uid,))
     else:
         db_execute("INSERT INTO student_profile (user_id, full_name, register_number, college_name, batch_year, current_semester, skills, skill_ratings, experience, interests, tech_stack, location, created_at) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)", data)
 
-    prof = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (uid,))[0]
-    label, results = recommend_jobs_logic(prof, db_fetchall("SELECT * FROM jobs"))
-    for r in results:
-        db_execute("INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason, created_at) VALUES (?,?,?,?,?)", (uid, r["job_id"], r["score"], r["reason"], now))
-    
-    flash("Profile saved and recommendations updated!", "success")
+    skill_dictionary.index_profile(uid, f.get("skills"), f.get("skill_ratings"))
+    with db_pool.connection() as conn:
+        insights.refresh(conn, [uid])
+
+    # Rescoring runs on the background worker; the dashboard shows it as pending until it lands
+    try:
+        task_queue.enqueue("rescore_user", uid, {"user_id": uid})
+        recommendation_worker.notify()
+    except Exception as e:
+        logger.error(f"Could not queue recommendations for user {uid}, computing inline: {e}")
+        rescore_user({"user_id": uid})
+
+    flash("Profile saved! Your recommendations are being refreshed.", "success")
     return redirect(url_for("dashboard") + "#jobs")
 
+@app.route("/recommendations/status")
+def recommendations_status():
+    if session.get("role") != "student": return {"pending": False}, 401
+    return {"pending": task_queue.pending("rescore_user", session.get("user_id"))}
+
 @app.route("/admin", methods=["GET", "POST"])
 def admin():
     if session.get("role") != "admin": return redirect(url_for("login"))
     if request.method == "POST":
         act, f, now = request.form.get("action"), request.form, datetime.now().strftime("%Y-%m-%d")
-        if act == "add_job": db_execute("INSERT INTO jobs (title, application_link, required_skills, description, posted_by, created_at) VALUES (?,?,?,?,'admin',?)", (f.get("title"), f.get("application_link"), f.get("required_skills"), f.get("description"), now))
-        elif act == "add_course": db_execute("INSERT INTO courses (title, category, description, course_link, added_by, created_at) VALUES (?,?,?,?,'admin',?)", (f.get("title"), f.get("category"), f.get("description"), f.get("course_link"), now))
+        if act == "add_job":
+            job_id = db_execute("INSERT INTO jobs (title, application_link, required_skills, description, posted_by, created_at) VALUES (?,?,?,?,'admin',?)", (f.get("title"), f.get("application_link"), f.get("required_skills"), f.get("description"), now))
+            if job_store: job_store.upsert(job_id)
+            skill_dictionary.index_job(job_id, f.get("required_skills"))
+            skill_catalogue.compile(f.get("required_skills"))
+        elif act == "add_course":
+            course_id = db_execute("INSERT INTO courses (title, category, description, course_link, added_by, created_at) VALUES (?,?,?,?,'admin',?)", (f.get("title"), f.get("category"), f.get("description"), f.get("course_link"), now))
+            skill_dictionary.index_course(course_id, f.get("title"), f.get("category"))
         elif act == "add_video": 
             course_id = f.get("course_id")
             if not course_id: course_id = None
@@ -411,42 +357,43 @@ def admin():
         # New Edit Logic
         elif act == "edit_course":
             db_execute("UPDATE courses SET title=?, category=?, description=?, course_link=? WHERE id=?", (f.get("title"), f.get("category"), f.get("description"), f.get("course_link"), f.get("course_id")))
+            skill_dictionary.index_course(int(f.get("course_id")), f.get("title"), f.get("category"))
             flash("Course updated successfully!", "success")
         elif act == "edit_job":
             db_execute("UPDATE jobs SET title=?, application_link=?, required_skills=?, description=? WHERE id=?", (f.get("title"), f.get("application_link"), f.get("required_skills"), f.get("description"), f.get("job_id")))
+            if job_store: job_store.upsert(f.get("job_id"))
+            skill_dictionary.index_job(int(f.get("job_id")), f.get("required_skills"))
+            skill_catalogue.compile(f.get("required_skills"))
             flash("Job updated successfully!", "success")
             
+        admin_api.invalidate()
+        catalogue.invalidate()
+        course_index.invalidate()
         flash("Action completed successfully!", "success")
         return redirect(url_for("admin"))
     
-    return render_template("admin_dashboard.html", 
-                           jobs=db_fetchall("SELECT * FROM jobs ORDER BY id DESC"), 
-                           courses=db_fetchall("SELECT * FROM courses ORDER BY id DESC"), 
-                           videos=db_fetchall("SELECT v.*, c.title FROM course_videos v LEFT JOIN courses c ON v.course_id = c.id ORDER BY v.id DESC"), 
-                           trends=db_fetchall("SELECT * FROM job_trends ORDER BY id DESC"), 
-                           students=db_fetchall("SELECT * FROM student_profile ORDER BY id DESC"), 
-                           users=db_fetchall("SELECT * FROM users WHERE role='student' ORDER BY id DESC"))
+    # Tabs fetch their rows page by page from /admin/api/<collection>
+    return render_template("admin_dashboard.html")
 
 @app.route("/download_report")
 def download_report():
     if session.get("role") != "student": return redirect(url_for("login"))
     uid = session.get("user_id")
-    profile = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (uid,))
-    if not profile: return redirect(url_for("dashboard"))
-    p = profile[0]
+    p = load_profile(db_fetchall, uid, ReportProfile)
+    if not p: return redirect(url_for("dashboard"))
     from reportlab.lib.pagesizes import letter
     from reportlab.pdfgen import canvas
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
     c.setFont("Helvetica-Bold", 22); c.drawCentredString(300, 750, "AI CAREER REPORT")
-    c.setFont("Helvetica", 12); c.drawString(50, 700, f"Name: {p[2]}"); c.drawString(50, 680, f"College: {p[4]}"); c.drawString(50, 660, f"Skills: {p[7]}")
+    c.setFont("Helvetica", 12); c.drawString(50, 700, f"Name: {p.full_name}"); c.drawString(50, 680, f"College: {p.college_name}"); c.drawString(50, 660, f"Skills: {p.skills}")
     c.setFont("Helvetica-Bold", 14); c.drawString(50, 620, "Matched Job Recommendations (>75% Match):")
     recs, y = db_fetchall("SELECT j.title, r.match_score FROM job_recommendations r JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? AND r.match_score >= 0.15 ORDER BY r.match_score DESC", (uid,)), 600
     for r in recs:
         score_pct = int(r[1]*100) if r[1] < 1 else 100
         c.setFont("Helvetica", 11); c.drawString(70, y, f"- {r[0]} ({score_pct}% Match)"); y -= 20
     c.showPage(); c.save(); buffer.seek(0)
-    return send_file(buffer, as_attachment=True, download_name=f"Career_Report_{p[2]}.pdf", mimetype='application/pdf')
+    return send_file(buffer, as_attachment=True, download_name=f"Career_Report_{p.full_name}.pdf", mimetype='application/pdf')
 
 @app.route("/chat", methods=["POST"])
 def chat():
@@ -456,38 +403,61 @@ def chat():
     elif "skill" in m: r = "Updating skills in your profile will refresh your matches!"
     return {"response": r}
 
+@app.route("/admin/stats")
+def admin_stats():
+    if session.get("role") != "admin": return {"error": "admin login required"}, 401
+    return {"catalogue_cache": catalogue.stats(),
+            "prediction_cache": predictions.stats() if predictions else None,
+            "course_index": course_index.stats(),
+            "db_pool": db_pool.stats()}
+
+def delete_records(kind, ids):
+    """Delete ``ids`` of ``kind`` in one transaction (dependent rows cascade), then drop derived state"""
+    with db_pool.connection() as conn:
+        deleted, _ = deletion.delete_ids(conn, kind, ids)
+    if kind == "job" and job_store:
+        for job_id in deletion.parse_ids(ids): job_store.remove(job_id)
+    admin_api.invalidate()
+    catalogue.invalidate()
+    course_index.invalidate()
+    return deleted
+
 @app.route("/delete/<kind>/<int:oid>")
 def delete(kind, oid):
     if session.get("role") != "admin": return redirect(url_for("login"))
-    table_map = {
-        "job": "jobs",
-        "student": "student_profile",
-        "user": "users",
-        "course": "courses",
-        "video": "course_videos",
-        "trend": "job_trends"
-    }
-    table = table_map.get(kind)
-    if table:
+    if kind in deletion.TABLES:
         try:
-            db_execute(f"DELETE FROM {table} WHERE id=?", (oid,))
-            if kind == "user":
-                db_execute("DELETE FROM student_profile WHERE user_id=?", (oid,))
-                db_execute("DELETE FROM job_recommendations WHERE user_id=?", (oid,))
+            delete_records(kind, [oid])
             flash(f"{kind.capitalize()} deleted successfully!", "info")
         except Exception as e:
             logger.error(f"Delete Error: {e}")
             flash("Error deleting record.", "danger")
     return redirect(url_for("admin"))
 
+@app.route("/admin/delete/<kind>", methods=["POST"])
+def bulk_delete(kind):
+    """Delete many rows at once: JSON {"ids": [1, 2, 3]} or form field ids=1,2,3"""
+    if session.get("role") != "admin": return {"error": "admin login required"}, 401
+    if kind not in deletion.TABLES: return {"error": f"Unknown kind '{kind}'"}, 404
+    data = request.get_json(silent=True) or {}
+    try:
+        ids = deletion.parse_ids(data.get("ids", request.form.get("ids", "")))
+    except (TypeError, ValueError):
+        return {"error": "ids must be integers"}, 400
+    if not ids: return {"error": "no ids given"}, 400
+    try:
+        return {"deleted": delete_records(kind, ids)}
+    except Exception as e:
+        logger.error(f"Bulk Delete Error: {e}")
+        return {"error": "delete failed, nothing was removed"}, 500
+
 @app.route("/delete_account", methods=["POST"])
 def delete_account():
     uid = session.get("user_id")
     if uid:
         try:
-            db_execute("DELETE FROM users WHERE id=?", (uid,))
-            db_execute("DELETE FROM student_profile WHERE user_id=?", (uid,))
-            db_execute("DELETE FROM job_recommendations WHERE user_id=?", (uid,))
+            # The profile and recommendations go with the user (ON DELETE CASCADE)
+            delete_records("user", [uid])
             session.clear()
             flash("Account permanently deleted.", "info")
         except Exception as e:
@@ -1,16 +1,29 @@
 import os
-import sqlite3
 from flask import Flask, render_template, request, redirect, url_for, session, send_from_directory
 
 from flask import Flask, render_template, request, redirect, url_for, session, flash
 from werkzeug.utils import secure_filename
 import joblib
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from scoring import similarity_scores, top_k_indices
+from prediction_cache import PredictionCache
+from fast_knn import accelerate
+from db import connect
+from migrations import migrate
+from storage import open_storage
+from admin_api import AdminAPI, COLLECTIONS as ADMIN_COLLECTIONS
+from search import SearchAPI, search, match_any
+from dashboard_api import DashboardAPI
+from catalogue_cache import CatalogueCache
+from assets import Assets
 import PyPDF2
 import docx2txt
 import re
+import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # ------------------- CONFIG -------------------
 APP_DIR = os.path.dirname(__file__)
 UPLOAD_FOLDER = os.path.join(APP_DIR, "uploads")
@@ -18,16 +31,27 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 DB_PATH = os.path.join(APP_DIR, "data.db")
 MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+PREDICTION_CACHE_PATH = os.path.join(APP_DIR, "models", "prediction_cache.db")
 
 app = Flask(__name__)
 app.secret_key = "change_this_secret"
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+
+# Storage: "sqlite" (data.db) or "memory" (the bundled CSVs, for tests and benchmarks)
+app.config.update(STORAGE="sqlite", STORAGE_SCALE=1)
+app.config.from_prefixed_env()
+storage = open_storage(app.config["STORAGE"], DB_PATH, scale=app.config["STORAGE_SCALE"])
+DB_PATH = storage.db_path
+PREDICTION_CACHE_PATH = storage.artifact_path(PREDICTION_CACHE_PATH)
+db_pool = storage.pool
 ALLOWED_EXTENSIONS = {"pdf", "docx"}
 
 # ------------------- MODEL -------------------
 if not os.path.exists(MODEL_PATH):
     raise FileNotFoundError(f"Model file not found: {MODEL_PATH}")
-model = joblib.load(MODEL_PATH)
+model = accelerate(joblib.load(MODEL_PATH))  # indexed KNN, same predictions
+# /dashboard re-predicts on every view; unchanged profiles are served from here
+predictions = PredictionCache(model, MODEL_PATH, disk_path=PREDICTION_CACHE_PATH)
 
 try:
     vectorizer = model.named_steps.get("tfidf", None)
@@ -36,7 +60,7 @@ except Exception:
 
 # ------------------- DB INIT -------------------
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect(DB_PATH)
     cur = conn.cursor()
     cur.execute("""
         CREATE TABLE IF NOT EXISTS students (
@@ -84,6 +108,12 @@ def init_db():
     """)
     conn.commit()
     conn.close()
+    # Shared schema, including the courses_fts index recommend_courses searches. A database created by
+    # 2.py alone has its own courses columns, so this can stop early; recommend_courses then falls back
+    try:
+        migrate(DB_PATH)
+    except Exception as e:
+        logger.error(f"Migrations stopped early: {e}")
 
 init_db()
 
@@ -143,17 +173,26 @@ def generate_ats_report(student, predicted_job_type, recs, courses, resume_filen
 
 # ------------------- HELPERS -------------------
 def db_fetchall(query, params=()):
-    with sqlite3.connect(DB_PATH) as conn:
-        cur = conn.cursor()
-        cur.execute(query, params)
-        return cur.fetchall()
+    return db_pool.fetchall(query, params)
 
 def db_execute(query, params=()):
-    with sqlite3.connect(DB_PATH) as conn:
-        cur = conn.cursor()
-        cur.execute(query, params)
-        conn.commit()
-        return cur.lastrowid
+    return db_pool.execute(query, params)
+
+# The students tab lists this app's own students table (what delete_student removes), under the
+# field names admin.js asks for; password is never projected
+admin_api = AdminAPI(db_fetchall, collections={**ADMIN_COLLECTIONS, "students": {
+    "source": "students", "key": "id", "where": None,
+    "columns": {"id": "id", "username": "username", "full_name": "full_name", "register_number": "register_number",
+                "college_name": "college", "batch_year": "batch_year", "current_semester": "semester",
+                "skills": "skills", "experience": "experience", "location": "location", "created_at": "created_at"},
+    "default": ["id", "full_name", "college_name", "skills"],
+    "search": ["full_name", "college", "skills"], "filters": {"batch_year": "batch_year", "college_name": "college"},
+}})
+app.register_blueprint(admin_api.blueprint)
+app.register_blueprint(SearchAPI(db_fetchall).blueprint)
+# dashboard.html fetches its tab lists from dashboard_api
+app.register_blueprint(DashboardAPI(db_fetchall, CatalogueCache(db_fetchall)).blueprint)
+Assets(app)
 
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -191,7 +230,7 @@ def recommend_jobs(student_row, all_jobs, top_k=5):
     profile_text = build_student_text(student_row)
     recs = []
     try:
-        predicted_label = str(model.predict([profile_text])[0]).strip().lower()
+        predicted_label = predictions.predict(profile_text).strip().lower()
     except Exception:
         predicted_label = None
 
@@ -199,31 +238,32 @@ def recommend_jobs(student_row, all_jobs, top_k=5):
         try:
             texts = [profile_text] + [job_text(j) for j in all_jobs]
             tfidf = vectorizer.transform(texts)
-            sim_scores = cosine_similarity(tfidf[0:1], tfidf[1:])[0]
-            for idx, job in enumerate(all_jobs):
+            sim_scores = similarity_scores(tfidf[0:1], tfidf[1:])
+            pct = np.round(sim_scores * 100, 2)
+            for idx in top_k_indices(pct, top_k):
                 recs.append({
-                    "job": job,
+                    "job": all_jobs[idx],
                     "score": round(float(sim_scores[idx])*100, 2)
                 })
         except Exception:
             pass
-    recs_sorted = sorted(recs, key=lambda x: x["score"], reverse=True)
-    return predicted_label, recs_sorted[:top_k]
+    return predicted_label, recs
 
 def recommend_courses(predicted_job_type):
     if not predicted_job_type:
         return []
 
-    # convert predicted job type into keywords
+    # convert predicted job type into keywords, matched against the courses full-text index (best first)
     keywords = predicted_job_type.replace("-", " ").split()
 
+    if db_fetchall("SELECT 1 FROM sqlite_master WHERE type='table' AND name='courses_fts'"):
+        return search(db_fetchall, "courses", match_any(keywords), limit=20, select="t.*")
+
+    # No full-text index (migrations did not get that far): the recommended_for scan
     q = "SELECT * FROM courses WHERE " + " OR ".join(
         ["LOWER(recommended_for) LIKE LOWER(?)"] * len(keywords)
     )
-
-    params = [f"%{k}%" for k in keywords]
-
-    return db_fetchall(q, params)
+    return db_fetchall(q, [f"%{k}%" for k in keywords])
 
 
 
@@ -319,9 +359,6 @@ def upload_resume():
         predicted_job_type, recs = recommend_jobs(student, jobs, top_k=10)
         courses = recommend_courses(predicted_job_type)
 
-        # Get Recommended Courses
-        courses = db_fetchall("SELECT * FROM courses WHERE recommended_for LIKE ?", (f"%{predicted_job_type}%",))
-
         # ✅ Generate ATS Report PDF
         report_path = generate_ats_report(student, predicted_job_type, recs, courses, filename)
 
@@ -359,9 +396,6 @@ def admin_dashboard():
         flash("Unauthorized access!")
         return redirect(url_for("login"))
 
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-
     # Add Job
     if request.method == "POST":
         title = request.form.get("title")
@@ -372,12 +406,11 @@ def admin_dashboard():
 
         # Job posting
         if title and required_skills:
-            c.execute("""
+            db_execute("""
             INSERT INTO jobs (title, description, required_skills, application_link, posted_by, created_at)
             VALUES (?, ?, ?, ?, ?, ?)
             """, (title, description, required_skills, application_link, session.get("username"),
             datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-            conn.commit()
             flash("Job opportunity added successfully!", "success")
 
         # Course addition
@@ -385,32 +418,21 @@ def admin_dashboard():
             platform = request.form.get("platform")
             link = request.form.get("link")
             recommended_for = request.form.get("recommended_for")
-            c.execute("INSERT INTO courses (course_name, platform, link, recommended_for) VALUES (?, ?, ?, ?)",
-                      (course_name, platform, link, recommended_for))
-            conn.commit()
+            db_execute("INSERT INTO courses (course_name, platform, link, recommended_for) VALUES (?, ?, ?, ?)",
+                       (course_name, platform, link, recommended_for))
             flash("Course added successfully!", "success")
+        admin_api.invalidate()
 
-    # Fetch all data
-    c.execute("SELECT * FROM jobs ORDER BY id DESC")
-    jobs = c.fetchall()
-    c.execute("SELECT * FROM courses ORDER BY id DESC")
-    courses = c.fetchall()
-    c.execute("SELECT * FROM students ORDER BY id DESC")
-    students = c.fetchall()
-
-    conn.close()
-    return render_template("admin_dashboard.html", jobs=jobs, courses=courses, students=students)
+    # Tabs fetch their rows page by page from /admin/api/<collection>
+    return render_template("admin_dashboard.html")
 
 
 
 # --- Delete Job ---
 @app.route("/delete/job/<int:job_id>")
 def delete_job(job_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM jobs WHERE id=?", (job_id,))
-    conn.commit()
-    conn.close()
+    db_execute("DELETE FROM jobs WHERE id=?", (job_id,))
+    admin_api.invalidate()
     flash("Job deleted successfully!", "info")
     return redirect(url_for("admin_dashboard"))
 
@@ -418,11 +440,8 @@ def delete_job(job_id):
 # --- Delete Course ---
 @app.route("/delete/course/<int:course_id>")
 def delete_course(course_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM courses WHERE id=?", (course_id,))
-    conn.commit()
-    conn.close()
+    db_execute("DELETE FROM courses WHERE id=?", (course_id,))
+    admin_api.invalidate()
     flash("Course deleted successfully!", "info")
     return redirect(url_for("admin_dashboard"))
 
@@ -430,11 +449,8 @@ def delete_course(course_id):
 # --- Delete Student ---
 @app.route("/delete/student/<int:student_id>")
 def delete_student(student_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM students WHERE id=?", (student_id,))
-    conn.commit()
-    conn.close()
+    db_execute("DELETE FROM students WHERE id=?", (student_id,))
+    admin_api.invalidate()
     flash("Student profile deleted successfully!", "info")
     return redirect(url_for("admin_dashboard"))
 
@@ -450,6 +466,7 @@ def delete(kind, obj_id):
         db_execute("DELETE FROM students WHERE id=?", (obj_id,))
     elif kind == "course":
         db_execute("DELETE FROM courses WHERE id=?", (obj_id,))
+    admin_api.invalidate()
     flash(f"{kind.capitalize()} deleted.", "info")
     return redirect(url_for("admin_dashboard"))
 
@@ -460,6 +477,7 @@ def delete_profile():
         return redirect(url_for("login"))
     sid = session.get("student_id")
     db_execute("DELETE FROM students WHERE id=?", (sid,))
+    admin_api.invalidate()
     session.clear()
     flash("Profile deleted successfully.", "info")
     return redirect(url_for("register"))
@@ -0,0 +1,162 @@
+"""
+Admin Data API
+Paginated JSON endpoints behind the admin dashboard tabs, shared by app.py,
+1.py and 2.py (which passes its own ``students`` collection). Instead of rendering every row of six tables into the page, each
+tab fetches ``/admin/api/<collection>`` on demand:
+
+    ?limit=50          rows per page (max 500)
+    ?after=<id>        keyset cursor: rows with a smaller id (newest first)
+    ?fields=id,title   column projection
+    ?q=python          substring filter on the collection's search columns
+    ?<filter>=<value>  exact-match filters listed per collection
+
+Keyset pagination is an index range scan on the primary key, so page 2000
+costs the same as page 1. Totals are counted once per filter and cached for
+``count_ttl`` seconds or until ``invalidate()`` after a write; only the
+``max_counts`` most recently used filters are kept.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from flask import Blueprint, request, session
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# name -> FROM clause, key column, exposed columns (name -> SQL), default fields, search and exact filters
+COLLECTIONS = {
+    "jobs": {
+        "source": "jobs", "key": "id", "where": None,
+        "columns": {"id": "id", "title": "title", "description": "description", "required_skills": "required_skills",
+                    "posted_by": "posted_by", "application_link": "application_link", "created_at": "created_at"},
+        "default": ["id", "title", "posted_by", "required_skills", "application_link", "description"],
+        "search": ["title", "required_skills"], "filters": {"posted_by": "posted_by"},
+    },
+    "courses": {
+        "source": "courses", "key": "id", "where": None,
+        "columns": {"id": "id", "title": "title", "description": "description", "category": "category",
+                    "course_link": "course_link", "added_by": "added_by", "created_at": "created_at"},
+        "default": ["id", "title", "category", "course_link", "description"],
+        "search": ["title", "category"], "filters": {"category": "category"},
+    },
+    "videos": {
+        "source": "course_videos v LEFT JOIN courses c ON v.course_id = c.id", "key": "v.id", "where": None,
+        "columns": {"id": "v.id", "course_id": "v.course_id", "video_title": "v.video_title", "video_url": "v.video_url",
+                    "category": "v.category", "course_title": "c.title"},
+        "default": ["id", "video_title", "course_title", "video_url"],
+        "search": ["v.video_title"], "filters": {"category": "v.category", "course_id": "v.course_id"},
+    },
+    "trends": {
+        "source": "job_trends", "key": "id", "where": None,
+        "columns": {"id": "id", "job_role": "job_role", "industry": "industry", "trending_skills": "trending_skills",
+                    "year": "year", "added_by": "added_by", "created_at": "created_at"},
+        "default": ["id", "job_role", "industry", "trending_skills", "year"],
+        "search": ["job_role", "industry", "trending_skills"], "filters": {"year": "year", "industry": "industry"},
+    },
+    "students": {
+        "source": "student_profile", "key": "id", "where": None,
+        "columns": {"id": "id", "user_id": "user_id", "full_name": "full_name", "register_number": "register_number",
+                    "college_name": "college_name", "batch_year": "batch_year", "current_semester": "current_semester",
+                    "skills": "skills", "experience": "experience", "location": "location", "created_at": "created_at"},
+        "default": ["id", "full_name", "college_name", "skills"],
+        "search": ["full_name", "college_name", "skills"], "filters": {"batch_year": "batch_year", "college_name": "college_name"},
+    },
+    "users": {
+        # Password columns are never projected
+        "source": "users", "key": "id", "where": "role = 'student'",
+        "columns": {"id": "id", "username": "username", "email": "email", "role": "role", "created_at": "created_at"},
+        "default": ["id", "username", "email"],
+        "search": ["username", "email"], "filters": {},
+    },
+}
+
+
+class AdminAPI:
+    """
+    ``AdminAPI(fetchall).blueprint`` is registered on the app; ``fetchall(query, params)`` runs reads
+    and ``collections`` maps tab names to specs shaped like ``COLLECTIONS``
+    """
+
+    def __init__(self, fetchall, count_ttl=30.0, max_counts=256, collections=COLLECTIONS):
+        self.fetchall = fetchall
+        self.collections = collections
+        self.count_ttl = count_ttl
+        self.max_counts = max_counts
+        self._counts = OrderedDict()
+        self._lock = threading.Lock()
+        self.blueprint = Blueprint("admin_api", __name__, url_prefix="/admin/api")
+        self.blueprint.add_url_rule("/<collection>", "collection", self.collection_view)
+
+    def invalidate(self):
+        """Drop cached totals (call after an admin write)"""
+        with self._lock:
+            self._counts.clear()
+
+    def count(self, name, where_sql, params):
+        key = (name, where_sql, tuple(params))
+        now = time.time()
+        with self._lock:
+            hit = self._counts.get(key)
+            if hit and now - hit[1] < self.count_ttl:
+                self._counts.move_to_end(key)
+                return hit[0]
+        spec = self.collections[name]
+        rows = self.fetchall(f"SELECT COUNT(*) FROM {spec['source']}{where_sql}", params)
+        total = rows[0][0] if rows else 0
+        with self._lock:
+            self._counts[key] = (total, now)
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.max_counts:
+                self._counts.popitem(last=False)
+        return total
+
+    def page(self, name, args):
+        """Rows, cursor and total for one request; raises ValueError on a bad parameter"""
+        spec = self.collections[name]
+        fields = [f for f in args.get("fields", "").split(",") if f] or spec["default"]
+        unknown = [f for f in fields if f not in spec["columns"]]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        if "id" not in fields:
+            fields = ["id"] + fields
+        limit = min(max(int(args.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+
+        # Filters shared by the page query and the count
+        clauses, params = ([spec["where"]] if spec["where"] else []), []
+        q = args.get("q", "").strip()
+        if q:
+            clauses.append("(" + " OR ".join(f"{col} LIKE ?" for col in spec["search"]) + ")")
+            params.extend([f"%{q}%"] * len(spec["search"]))
+        for arg, col in spec["filters"].items():
+            if args.get(arg):
+                clauses.append(f"{col} = ?")
+                params.append(args[arg])
+        where_sql = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+
+        page_clauses, page_params = list(clauses), list(params)
+        if args.get("after"):
+            page_clauses.append(f"{spec['key']} < ?")
+            page_params.append(int(args["after"]))
+        page_where = (" WHERE " + " AND ".join(page_clauses)) if page_clauses else ""
+
+        select = ", ".join(spec["columns"][f] for f in fields)
+        rows = self.fetchall(f"SELECT {select} FROM {spec['source']}{page_where} ORDER BY {spec['key']} DESC LIMIT ?",
+                             page_params + [limit + 1])
+        more = len(rows) > limit
+        items = [dict(zip(fields, row)) for row in rows[:limit]]
+        return {
+            "items": items,
+            "next_after": items[-1]["id"] if more else None,
+            "total": self.count(name, where_sql, params),
+        }
+
+    def collection_view(self, collection):
+        if session.get("role") != "admin":
+            return {"error": "admin login required"}, 401
+        if collection not in self.collections:
+            return {"error": f"Unknown collection '{collection}'"}, 404
+        try:
+            return self.page(collection, request.args)
+        except ValueError as e:
+            return {"error": str(e)}, 400
@@ -0,0 +1,222 @@
+"""
+Approximate Nearest-Neighbour Job Index
+Inverted-file (IVF) index over the TF-IDF job vectors held by JobVectorStore.
+Jobs are bucketed under k-means centroids; a query only scores the jobs in
+its ``n_probe`` closest buckets. ``n_probe`` is the recall/latency knob:
+n_probe == n_lists is an exact search.
+
+The index follows JobVectorStore snapshots: each build produces a new
+IVFState that is swapped in with one assignment, and the positions a search
+returns are rows of that state's snapshot, so callers read ``keys`` and
+``matrix`` from the same version the lists were built over.
+
+Usage: python ann_index.py [--jobs 100000] [--probes 1,2,4,8,16]
+       (recall@10 and latency against exact search on synthetic jobs)
+"""
+
+import os
+import time
+import logging
+import argparse
+import threading
+from collections import namedtuple
+import numpy as np
+import scipy.sparse as sp
+import joblib
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import normalize
+from job_vectors import Snapshot, file_version
+from scoring import similarity_scores, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+# Inverted lists over one store snapshot; replaced whole, never modified
+IVFState = namedtuple("IVFState", ["snapshot", "centroids", "matrix", "list_rows", "offsets"])
+
+
+class ExactIndex:
+    """Brute-force search over every job; the reference the IVF index is checked against"""
+
+    def __init__(self):
+        self.matrix = None
+
+    def sync(self, snapshot):
+        self.matrix = normalize(snapshot.matrix)
+
+    def candidates(self, query_vec, k):
+        sims = similarity_scores(query_vec, self.matrix)
+        return top_k_indices(sims, k)
+
+
+class IVFIndex:
+    """
+    Inverted lists over k-means centroids of the normalized job vectors.
+
+    Only the centroids are persisted; list membership is re-derived with one
+    sparse product whenever the job store's version moves, so admin edits
+    never require re-training. Builds run one at a time under a lock while
+    searches keep using the last ``state``.
+    """
+
+    def __init__(self, path=None, n_lists=None, n_probe=8, model_path=None):
+        self.path = path
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.model_version = file_version(model_path) if model_path else None
+        self.centroids = None
+        self.trained_rows = 0
+        self.state = None
+        self._lock = threading.Lock()
+
+    # --- Training / assignment ---
+    def train(self, matrix, seed=42):
+        vecs = normalize(sp.csr_matrix(matrix))
+        n_lists = self.n_lists or int(np.clip(np.sqrt(vecs.shape[0]), 1, 1024))
+        n_lists = max(1, min(n_lists, vecs.shape[0]))
+        km = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init=3,
+                             batch_size=min(4096, vecs.shape[0]))
+        km.fit(vecs)
+        self.centroids = normalize(km.cluster_centers_).astype(np.float32)
+        self.trained_rows = vecs.shape[0]
+        self._save()
+
+    def assign(self, snapshot):
+        """Bucket the snapshot's rows under the current centroids and publish the result as ``state``"""
+        centroids = self.centroids
+        matrix = normalize(sp.csr_matrix(snapshot.matrix))
+        if matrix.shape[0] == 0:
+            list_rows = np.zeros(0, dtype=np.int64)
+            offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+        else:
+            nearest = np.asarray(matrix @ centroids.T).argmax(axis=1)
+            list_rows = np.argsort(nearest, kind="stable")
+            counts = np.bincount(nearest, minlength=len(centroids))
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.state = IVFState(snapshot, centroids, matrix, list_rows, offsets)
+
+    def current(self, snapshot):
+        state = self.state
+        return state is not None and state.snapshot.matrix is snapshot.matrix
+
+    def sync(self, snapshot, background=False):
+        """
+        Follow the job store: re-train if stale or the catalogue doubled,
+        re-assign on any change. With ``background`` the work runs on a
+        daemon thread (request handlers); searches meanwhile use the
+        previous state, and a call while a build is running is a no-op.
+        """
+        if self.current(snapshot):
+            return
+        if not background:
+            with self._lock:
+                self._build(snapshot)
+        elif self._lock.acquire(blocking=False):
+            threading.Thread(target=self._build_in_background, args=(snapshot,),
+                             name="ann-index-sync", daemon=True).start()
+
+    def _build_in_background(self, snapshot):
+        try:
+            self._build(snapshot)
+        except Exception as e:
+            logger.error(f"ANN index build failed: {e}")
+        finally:
+            self._lock.release()
+
+    def _build(self, snapshot):
+        if self.current(snapshot):
+            return
+        if self.centroids is None:
+            self._load()
+        rows = snapshot.matrix.shape[0]
+        if rows and (self.centroids is None or rows > 2 * self.trained_rows):
+            self.train(snapshot.matrix)
+        if self.centroids is not None:
+            self.assign(snapshot)
+
+    # --- Search ---
+    def candidates(self, query_vec, k, n_probe=None, state=None):
+        """Positions (rows of ``state.snapshot``, default the current state) of the best ``k`` jobs in the probed lists"""
+        state = state or self.state
+        n_probe = min(n_probe or self.n_probe, len(state.centroids))
+        q = normalize(sp.csr_matrix(query_vec))
+        centroid_sims = np.asarray(q @ state.centroids.T).ravel()
+        probed = np.argpartition(-centroid_sims, n_probe - 1)[:n_probe]
+        rows = np.concatenate([state.list_rows[state.offsets[c]:state.offsets[c + 1]] for c in probed])
+        if len(rows) == 0:
+            return rows
+        rows.sort()
+        sims = np.asarray((state.matrix[rows] @ q.T).todense()).ravel()
+        return rows[top_k_indices(sims, k)]
+
+    # --- Persistence ---
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            snap = joblib.load(self.path)
+        except Exception as e:
+            logger.error(f"ANN index unreadable: {e}")
+            return
+        if snap.get("model_version") != self.model_version:
+            return
+        self.centroids = snap["centroids"]
+        self.trained_rows = snap["trained_rows"]
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + ".tmp"
+        try:
+            joblib.dump({"model_version": self.model_version, "centroids": self.centroids,
+                         "trained_rows": self.trained_rows}, tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Could not persist ANN index: {e}")
+
+
+def recall_at_k(index, exact, queries, k=10, n_probe=None):
+    """Mean fraction of the exact top-k that the approximate search also returns"""
+    hits = 0
+    for i in range(queries.shape[0]):
+        truth = set(exact.candidates(queries[i], k).tolist())
+        approx = set(index.candidates(queries[i], k, n_probe).tolist())
+        hits += len(truth & approx) / max(1, len(truth))
+    return hits / queries.shape[0]
+
+
+def main():
+    from bench_scoring import synthetic_jobs, MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="recall@10 / latency of the IVF job index")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--probes", default="1,2,4,8,16")
+    args = parser.parse_args()
+
+    vectorizer = joblib.load(MODEL_PATH).named_steps["tfidf"]
+    store = Snapshot(1, tuple(range(args.jobs)), (), vectorizer.transform(synthetic_jobs(args.jobs)))
+    queries = vectorizer.transform(synthetic_jobs(args.queries, seed=7))
+
+    exact = ExactIndex()
+    exact.sync(store)
+    ivf = IVFIndex()
+    start = time.perf_counter()
+    ivf.sync(store)
+    print(f"Built IVF index: {args.jobs} jobs, {len(ivf.centroids)} lists in {time.perf_counter() - start:.2f}s")
+
+    def latency(idx, **kw):
+        start = time.perf_counter()
+        for i in range(queries.shape[0]):
+            idx.candidates(queries[i], 10, **kw)
+        return (time.perf_counter() - start) / queries.shape[0] * 1000
+
+    print(f"{'n_probe':>8} | {'recall@10':>9} | {'ms/query':>8}")
+    print("-" * 32)
+    print(f"{'exact':>8} | {1.0:>9.3f} | {latency(exact):>8.3f}")
+    for n_probe in [int(p) for p in args.probes.split(",")]:
+        recall = recall_at_k(ivf, exact, queries, 10, n_probe)
+        print(f"{n_probe:>8} | {recall:>9.3f} | {latency(ivf, n_probe=n_probe):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
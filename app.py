@@ -1,13 +1,33 @@
 import os
-import sqlite3
 import logging
 import io
+import threading
 from datetime import datetime
 from flask import Flask, render_template, request, redirect, url_for, session, flash, send_file
 import joblib
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from job_vectors import JobVectorStore, ProfileVectorStore
+from skills import SkillDictionary
+from prediction_cache import PredictionCache
+from fast_knn import accelerate
+from storage import open_storage
+import recommendation_store
+import deletion
+import insights
+import fragment_cache
+from assets import Assets
+from migrations import migrate
+from task_queue import TaskQueue, Worker
+from admin_api import AdminAPI
+from search import SearchAPI
+from dashboard_api import DashboardAPI
+from catalogue_cache import CatalogueCache
+from records import ScoringProfile, ReportProfile, load_profile, load_jobs
+from ann_index import IVFIndex
+from scoring import similarity_scores, title_matches, rank_matches
+import batch_recommend
 
 # --- Logging Configuration ---
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,16 +36,34 @@ logger = logging.getLogger(__name__)
 APP_DIR = os.path.dirname(__file__)
 DB_PATH = os.path.join(APP_DIR, "data.db")
 MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+JOB_VECTORS_PATH = os.path.join(APP_DIR, "models", "job_vectors.pkl")
+ANN_INDEX_PATH = os.path.join(APP_DIR, "models", "job_ann_index.pkl")
+PROFILE_VECTORS_PATH = os.path.join(APP_DIR, "models", "profile_vectors.pkl")
+PREDICTION_CACHE_PATH = os.path.join(APP_DIR, "models", "prediction_cache.db")
+ANN_MIN_JOBS = 20000  # below this, exhaustive scoring is already cheap
+ANN_N_PROBE = 8       # lists probed per query; raise for recall, lower for latency
 
 app = Flask(__name__)
 app.secret_key = "kkit_secret_key_123" # Use a stable secret key
 
+# Storage: "sqlite" (data.db) or "memory" (the bundled CSVs, for tests and benchmarks),
+# e.g. FLASK_STORAGE=memory FLASK_STORAGE_SCALE=100 python app.py
+app.config.update(STORAGE="sqlite", STORAGE_SCALE=1)
+app.config.from_prefixed_env()
+storage = open_storage(app.config["STORAGE"], DB_PATH, scale=app.config["STORAGE_SCALE"])
+DB_PATH = storage.db_path
+JOB_VECTORS_PATH, ANN_INDEX_PATH, PROFILE_VECTORS_PATH, PREDICTION_CACHE_PATH = (
+    storage.artifact_path(p) for p in (JOB_VECTORS_PATH, ANN_INDEX_PATH, PROFILE_VECTORS_PATH, PREDICTION_CACHE_PATH))
+
+# One pool of long-lived WAL connections shared by every request thread
+db_pool = storage.pool
+
 # --- Load Model ---
 model = None
 vectorizer = None
 try:
     if os.path.exists(MODEL_PATH):
-        model = joblib.load(MODEL_PATH)
+        model = accelerate(joblib.load(MODEL_PATH))  # indexed KNN, same predictions
         logger.info("AI Model loaded successfully")
         try:
             vectorizer = model.named_steps.get("tfidf", None)
@@ -36,190 +74,177 @@ try:
 except Exception as e:
     logger.error(f"Error loading model: {e}")
 
+# Memoized model.predict (LRU in memory, shared with other workers on disk)
+predictions = PredictionCache(model, MODEL_PATH, disk_path=PREDICTION_CACHE_PATH) if model else None
+
 # --- DB Initialization ---
 def init_db():
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cur = conn.cursor()
-        
-        # Users Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL,
-                role TEXT DEFAULT 'student',
-                created_at TEXT
-            )
-        """)
-        
-        # Student Profile Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS student_profile (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER UNIQUE NOT NULL,
-                full_name TEXT,
-                register_number TEXT,
-                college_name TEXT,
-                batch_year TEXT,
-                current_semester TEXT,
-                skills TEXT,
-                skill_ratings TEXT,
-                experience TEXT,
-                interests TEXT,
-                tech_stack TEXT,
-                location TEXT,
-                created_at TEXT,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        """)
-        
-        # Jobs Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                description TEXT,
-                required_skills TEXT,
-                posted_by TEXT,
-                application_link TEXT,
-                created_at TEXT
-            )
-        """)
-
-        # Job Recommendations Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS job_recommendations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                job_id INTEGER NOT NULL,
-                match_score REAL,
-                match_reason TEXT,
-                created_at TEXT,
-                FOREIGN KEY (user_id) REFERENCES users(id),
-                FOREIGN KEY (job_id) REFERENCES jobs(id)
-            )
-        """)
-
-        # Courses Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS courses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT,
-                description TEXT,
-                category TEXT,
-                added_by TEXT,
-                created_at TEXT
-            )
-        """)
-
-        # Course Videos Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS course_videos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                course_id INTEGER,
-                video_title TEXT,
-                video_url TEXT,
-                category TEXT,
-                FOREIGN KEY (course_id) REFERENCES courses(id)
-            )
-        """)
-
-        # Job Trends Table
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS job_trends (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_role TEXT,
-                industry TEXT,
-                trending_skills TEXT,
-                year TEXT,
-                added_by TEXT,
-                created_at TEXT
-            )
-        """)
-
-        conn.commit()
-        conn.close()
-        logger.info("Database checked/initialized")
+        applied = migrate(DB_PATH)
+        logger.info(f"Database checked/initialized (migrations applied: {applied or 'none'})")
     except Exception as e:
         logger.error(f"DB Init Error: {e}")
 
 init_db()
 
+# --- Job Vector Store ---
+job_store = None
+if vectorizer is not None:
+    try:
+        job_store = JobVectorStore(vectorizer, DB_PATH, JOB_VECTORS_PATH, model_path=MODEL_PATH)
+        job_store.load()
+    except Exception as e:
+        logger.error(f"Job vector store unavailable: {e}")
+        job_store = None
+
+# --- Profile Vector Store (new jobs are fanned out against it) ---
+profile_store = None
+if model is not None:
+    try:
+        profile_store = ProfileVectorStore(model, DB_PATH, PROFILE_VECTORS_PATH, model_path=MODEL_PATH)
+        profile_store.load()
+    except Exception as e:
+        logger.error(f"Profile vector store unavailable: {e}")
+        profile_store = None
+
+# --- Skill Dictionary (canonical skill IDs shared with 1.py) ---
+skill_dictionary = SkillDictionary(DB_PATH)
+try:
+    skill_dictionary.load()
+    skill_dictionary.backfill()
+except Exception as e:
+    logger.error(f"Skill dictionary unavailable: {e}")
+
+ann_index = IVFIndex(ANN_INDEX_PATH, n_probe=ANN_N_PROBE, model_path=MODEL_PATH) if job_store else None
+
+def use_ann():
+    """Large catalogue and an index to search; later builds and re-training run off the request thread"""
+    if ann_index is None or len(job_store.job_ids) < ANN_MIN_JOBS:
+        return False
+    ann_index.sync(job_store.snapshot(), background=True)
+    return ann_index.state is not None
+
+if ann_index is not None and len(job_store.job_ids) >= ANN_MIN_JOBS:
+    ann_index.sync(job_store.snapshot())
+
 # --- DB Helpers ---
 def db_fetchall(query, params=()):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params)
-            return cur.fetchall()
+        return db_pool.fetchall(query, params)
     except Exception as e:
         logger.error(f"DB Fetch Error: {e} | Query: {query}")
         return []
 
 def db_execute(query, params=()):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params)
-            conn.commit()
-            return cur.lastrowid
+        return db_pool.execute(query, params)
     except Exception as e:
         logger.error(f"DB Execute Error: {e} | Query: {query}")
         raise e
 
+admin_api = AdminAPI(db_fetchall)
+app.register_blueprint(admin_api.blueprint)
+app.register_blueprint(SearchAPI(db_fetchall).blueprint)
+
+# Courses, videos and trends only change through admin(); dashboards read them from here
+catalogue = CatalogueCache(db_fetchall)
+# The dashboard tabs' lists, fetched by the page when a tab is opened
+app.register_blueprint(DashboardAPI(db_fetchall, catalogue).blueprint)
+# Fingerprinted CSS/JS (asset() in templates) and gzip/brotli responses
+static_assets = Assets(app)
+# ETag of the dashboard shell, from the version stamps of what it shows
+dashboard_page = fragment_cache.PageETag(os.path.join(APP_DIR, "templates", "dashboard.html"), assets=static_assets)
+
 # --- ML Logic ---
-def build_student_text(profile_row):
-    # (id, user_id, name, reg, coll, batch, sem, skills, ratings, exp, ints, stack, loc, date)
-    if not profile_row: return ""
-    parts = [str(profile_row[7]), str(profile_row[8]), str(profile_row[10]), str(profile_row[11]), str(profile_row[9])]
+def build_student_text(profile):
+    # records.ScoringProfile
+    if not profile: return ""
+    parts = [str(profile.skills), str(profile.skill_ratings), str(profile.interests), str(profile.tech_stack), str(profile.experience)]
     return " ".join([p for p in parts if p and p != 'None'])
 
-def job_text(job_row):
-    # (id, title, desc, skills, posted, link, date)
-    if not job_row: return ""
-    parts = [str(job_row[1]), str(job_row[2]), str(job_row[3])]
+def job_text(job):
+    # records.Job
+    if not job: return ""
+    parts = [str(job.title), str(job.description), str(job.required_skills)]
     return " ".join([p for p in parts if p and p != 'None'])
 
-def recommend_jobs_logic(profile_row, all_jobs, top_k=10):
-    profile_text = build_student_text(profile_row)
-    recs = []
+def ann_recommend(profile_vec, predicted_label, top_k=10):
+    # Every position below is a row of the one store snapshot the index state was built over
+    state = ann_index.state
+    jobs = state.snapshot
+    # Candidates: title matches (they score 1.0) plus the index's best similarity hits
+    ai_rows = jobs.title_positions(predicted_label) if predicted_label else np.zeros(0, dtype=int)
+    rows = np.union1d(ai_rows[:top_k], ann_index.candidates(profile_vec, top_k, state=state))
+    sims = similarity_scores(profile_vec, jobs.matrix[rows])
+    ai_match = np.isin(rows, ai_rows)
+    return rank_matches(sims, ai_match, predicted_label, [jobs.keys[r] for r in rows], top_k)
+
+def recommend_jobs_logic(profile, all_jobs, top_k=10, use_index=None):
+    # use_index: the caller's use_ann() answer, so it picked all_jobs under the same decision
+    if use_index is None:
+        use_index = use_ann()
+    profile_text = build_student_text(profile)
     predicted_label = None
 
     if model:
         try:
-            predicted_label = str(model.predict([profile_text])[0]).strip().lower()
+            predicted_label = predictions.predict(profile_text).strip().lower()
         except:
             pass
 
+    # Large catalogues: score only the probed IVF lists instead of every job
+    if use_index:
+        job_store.ensure_fresh()
+        ann_index.sync(job_store.snapshot(), background=True)
+        return predicted_label, ann_recommend(vectorizer.transform([profile_text]), predicted_label, top_k)
+
     tfidf_profile, tfidf_jobs = None, None
     if vectorizer and all_jobs:
         try:
-            texts = [profile_text] + [job_text(j) for j in all_jobs]
-            tfidf = vectorizer.transform(texts)
-            tfidf_profile = tfidf[0:1]
-            tfidf_jobs = tfidf[1:]
+            if job_store is not None:
+                job_store.ensure_fresh()
+                tfidf_profile = vectorizer.transform([profile_text])
+                tfidf_jobs = job_store.vectors_for(all_jobs)
+            else:
+                texts = [profile_text] + [job_text(j) for j in all_jobs]
+                tfidf = vectorizer.transform(texts)
+                tfidf_profile = tfidf[0:1]
+                tfidf_jobs = tfidf[1:]
         except:
             pass
 
-    for idx, job in enumerate(all_jobs):
-        jtxt = job_text(job)
-        eligible, reason, score = False, "", 0.0
-        job_title = (job[1] or "").lower()
-
-        if predicted_label and (predicted_label in job_title or job_title in predicted_label):
-            eligible, reason, score = True, f"AI Match: {predicted_label}", 1.0
+    # One sparse product for every job, then only the top_k rows are materialized
+    sims = np.zeros(len(all_jobs))
+    if tfidf_profile is not None and tfidf_jobs is not None:
+        sims = similarity_scores(tfidf_profile, tfidf_jobs)
 
-        if not eligible and tfidf_profile is not None and tfidf_jobs is not None:
-            sim = float(cosine_similarity(tfidf_profile, tfidf_jobs[idx:idx+1])[0][0])
-            if sim >= 0.2:
-                eligible, reason, score = True, f"Similarity: {sim:.2f}", sim
+    ai_match = title_matches(predicted_label, [(job.title or "").lower() for job in all_jobs])
+    recs = rank_matches(sims, ai_match, predicted_label, [job.id for job in all_jobs], top_k)
 
-        if eligible:
-            recs.append({"job_id": job[0], "score": round(score, 3), "reason": reason})
+    return predicted_label, recs
 
-    return predicted_label, sorted(recs, key=lambda x: x["score"], reverse=True)[:top_k]
+# --- Background Recommendation Refresh ---
+def rescore_user(payload):
+    """Task handler: recompute and store one student's recommendations"""
+    uid = payload["user_id"]
+    profile = load_profile(db_fetchall, uid, ScoringProfile)
+    if not profile:
+        return
+    # Decided once: an empty job list is only valid on the ANN path
+    ann = use_ann()
+    jobs = [] if ann else load_jobs(db_fetchall)
+    logger.info(f"Generating recommendations for user {uid} with {len(jobs)} jobs")
+    logger.info(f"Student text for user {uid}: '{build_student_text(profile)}'")
+
+    label, results = recommend_jobs_logic(profile, jobs, use_index=ann)
+    # Swap the old set for the new one in a single transaction
+    with db_pool.connection() as conn:
+        inserted_count = recommendation_store.replace_user(conn, uid, results)
+    logger.info(f"Successfully inserted {inserted_count} new recommendations for user {uid}")
+
+task_queue = TaskQueue(DB_PATH)
+task_queue.purge()  # finished tasks older than a day
+recommendation_worker = Worker(task_queue, {"rescore_user": rescore_user}, threads=2).start()
 
 # --- Error Handlers ---
 @app.errorhandler(404)
@@ -296,79 +321,26 @@ def dashboard():
         return redirect(url_for("login"))
     
     user_id = session.get("user_id")
-    profile = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (user_id,))
-    
+    # The page is a shell: profile, report and ATS insights (precomputed when the profile or
+    # recommendations last changed); each tab fetches its list from dashboard_api when opened
+    snapshot = insights.get(db_pool, user_id)
+    pending = task_queue.pending("rescore_user", user_id)
+    tag = None
+    # A page carrying a flash message must not be revalidated later as the plain page
+    if snapshot and not session.get("_flashes"):
+        tag = dashboard_page.etag(user_id, session.get("username"), snapshot.version, pending)
+    unchanged = fragment_cache.not_modified(tag)
+    if unchanged:
+        return unchanged
+
+    profile = load_profile(db_fetchall, user_id)
     if not profile:
         return render_template("dashboard.html", student=None, needs_profile=True)
 
-    recs = db_fetchall("""
-        SELECT j.*, r.match_score, r.match_reason FROM job_recommendations r
-        JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC
-    """, (user_id,))
-
-    # Calculate ATS compatibility insights
-    profile_completeness = 0
-    ats_insights = []
-
-    if profile and profile[0]:
-        p = profile[0]
-        # Check profile completeness
-        fields = [p[2], p[3], p[4], p[5], p[6], p[7], p[8], p[9], p[10], p[11], p[12]]
-        filled_fields = sum(1 for f in fields if f and str(f).strip() and str(f) != 'None')
-        profile_completeness = int((filled_fields / len(fields)) * 100)
-
-        # Generate insights based on profile
-        if p[7] and len(str(p[7]).split(',')) >= 3:  # Skills
-            ats_insights.append("✓ Strong skills profile with multiple technologies")
-        elif p[7]:
-            ats_insights.append("⚠ Add more skills to improve ATS matching")
-
-        if p[11] and len(str(p[11]).split(',')) >= 2:  # Tech stack
-            ats_insights.append("✓ Diverse tech stack increases job opportunities")
-        elif p[11]:
-            ats_insights.append("⚠ Expand your tech stack for better matches")
-
-        if p[9] and len(str(p[9]).split()) >= 10:  # Experience
-            ats_insights.append("✓ Detailed experience description helps ATS parsing")
-        elif p[9]:
-            ats_insights.append("⚠ Add more details to your experience section")
-
-        if recs and len(recs) >= 5:
-            ats_insights.append("✓ Multiple job matches found - good profile strength")
-        elif recs and len(recs) >= 2:
-            ats_insights.append("✓ Some job matches generated")
-        elif recs:
-            ats_insights.append("⚠ Limited job matches - consider broadening skills")
-
-        # Default insights if profile is incomplete
-        if not ats_insights:
-            ats_insights = [
-                "Complete your profile for better recommendations",
-                "Add skills, experience, and tech stack details",
-                "Include specific technologies and tools you know"
-            ]
-
-    else:
-        profile_completeness = 0
-        ats_insights = ["Complete your profile to get personalized insights"]
-
-    # Get unique course categories
-    all_courses = db_fetchall("SELECT * FROM courses ORDER BY id DESC")
-    course_categories = []
-    seen_categories = set()
-    for course in all_courses:
-        category = course[3]  # category is at index 3 (id, title, description, category, added_by, created_at)
-        if category and category not in seen_categories:
-            seen_categories.add(category)
-            course_categories.append((category,))
-
-    return render_template("dashboard.html", student=profile[0], recommendations=recs,
-                           trends=db_fetchall("SELECT * FROM job_trends ORDER BY id DESC"),
-                           courses=all_courses,
-                           course_categories=course_categories,
-                           videos=db_fetchall("SELECT * FROM course_videos ORDER BY id DESC"),
-                           profile_completeness=profile_completeness, ats_insights=ats_insights,
-                           needs_profile=False)
+    return fragment_cache.conditional(render_template("dashboard.html", student=profile,
+                           profile_completeness=snapshot.completeness, ats_insights=insights.marked(snapshot),
+                           match_confidence=snapshot.confidence, recs_pending=pending,
+                           needs_profile=False), tag)
 
 @app.route("/save_profile", methods=["POST"])
 def save_profile():
@@ -391,50 +363,37 @@ def save_profile():
         db_execute("""UPDATE student_profile SET full_name=?, register_number=?, college_name=?, batch_year=?, 
                    current_semester=?, skills=?, skill_ratings=?, experience=?, interests=?, tech_stack=?, 
                    location=?, created_at=? WHERE user_id=?""", data[1:] + (uid,))
-        db_execute("DELETE FROM job_recommendations WHERE user_id=?", (uid,))
     else:
         db_execute("""INSERT INTO student_profile (user_id, full_name, register_number, college_name, batch_year, 
                    current_semester, skills, skill_ratings, experience, interests, tech_stack, location, created_at) 
                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)""", data)
+    if profile_store: profile_store.upsert(uid)
+    skill_dictionary.index_profile(uid, f.get("skills"), f.get("skill_ratings"))
+    with db_pool.connection() as conn:
+        insights.refresh(conn, [uid])
 
-    # Trigger Recs
+    # Rescoring runs on the background worker; the dashboard shows it as pending until it lands
     try:
-        prof = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (uid,))[0]
-        jobs = db_fetchall("SELECT * FROM jobs")
-        logger.info(f"Generating recommendations for user {uid} with {len(jobs)} jobs")
-
-        # Build student text for debugging
-        from app import build_student_text
-        student_text = build_student_text(prof)
-        logger.info(f"Student text for user {uid}: '{student_text}'")
-
-        label, results = recommend_jobs_logic(prof, jobs)
-        logger.info(f"Generated {len(results)} recommendations for user {uid}")
-
-        # Delete old recommendations
-        db_execute("DELETE FROM job_recommendations WHERE user_id=?", (uid,))
-
-        # Insert new recommendations
-        inserted_count = 0
-        for r in results:
-            try:
-                db_execute("INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason, created_at) VALUES (?,?,?,?,?)",
-                           (uid, r["job_id"], r["score"], r["reason"], datetime.now().strftime("%Y-%m-%d")))
-                inserted_count += 1
-            except Exception as e:
-                logger.error(f"Error inserting recommendation for user {uid}: {e}")
-
-        logger.info(f"Successfully inserted {inserted_count} new recommendations for user {uid}")
-
+        task_queue.enqueue("rescore_user", uid, {"user_id": uid})
+        recommendation_worker.notify()
     except Exception as e:
-        logger.error(f"Error generating recommendations for user {uid}: {e}")
-        # Don't fail the profile update if recommendations fail
-        flash("Profile updated! (Note: Recommendations may take a moment to update)", "warning")
-        return redirect(url_for("dashboard"))
+        logger.error(f"Could not queue recommendations for user {uid}, computing inline: {e}")
+        try:
+            rescore_user({"user_id": uid})
+        except Exception as e:
+            logger.error(f"Error generating recommendations for user {uid}: {e}")
+            # Don't fail the profile update if recommendations fail
+            flash("Profile updated! (Note: Recommendations may take a moment to update)", "warning")
+            return redirect(url_for("dashboard"))
 
-    flash("Profile updated and recommendations refreshed!", "success")
+    flash("Profile updated! Your recommendations are being refreshed.", "success")
     return redirect(url_for("dashboard"))
 
+@app.route("/recommendations/status")
+def recommendations_status():
+    if session.get("role") != "student": return {"pending": False}, 401
+    return {"pending": task_queue.pending("rescore_user", session.get("user_id"))}
+
 @app.route("/admin", methods=["GET", "POST"])
 def admin():
     if session.get("role") != "admin": return redirect(url_for("login"))
@@ -442,97 +401,93 @@ def admin():
         act = request.form.get("action")
         f = request.form
         if act == "add_job":
-            db_execute("INSERT INTO jobs (title, application_link, required_skills, description, posted_by, created_at) VALUES (?,?,?,?,'admin',?)",
+            job_id = db_execute("INSERT INTO jobs (title, application_link, required_skills, description, posted_by, created_at) VALUES (?,?,?,?,'admin',?)",
                        (f.get("title"), f.get("application_link"), f.get("required_skills"), f.get("description"), datetime.now().strftime("%Y-%m-%d")))
+            if job_store: job_store.upsert(job_id)
+            skill_dictionary.index_job(job_id, f.get("required_skills"))
+            if job_store and profile_store:
+                try:
+                    profile_store.ensure_fresh()
+                    batch_recommend.fan_out_job(job_id, job_store, profile_store, DB_PATH)
+                except Exception as e:
+                    logger.error(f"Fan-out of job {job_id} failed: {e}")
         elif act == "add_course":
-            db_execute("INSERT INTO courses (title, category, description, added_by, created_at) VALUES (?,?,?,'admin',?)",
+            course_id = db_execute("INSERT INTO courses (title, category, description, added_by, created_at) VALUES (?,?,?,'admin',?)",
                        (f.get("title"), f.get("category"), f.get("description"), datetime.now().strftime("%Y-%m-%d")))
+            skill_dictionary.index_course(course_id, f.get("title"), f.get("category"))
         elif act == "add_video":
             db_execute("INSERT INTO course_videos (course_id, video_title, video_url, category) VALUES (?,?,?,?)",
                        (f.get("course_id"), f.get("video_title"), f.get("video_url"), f.get("category")))
         elif act == "add_trend":
             db_execute("INSERT INTO job_trends (job_role, industry, trending_skills, year, added_by, created_at) VALUES (?,?,?,?,'admin',?)",
                        (f.get("job_role"), f.get("industry"), f.get("trending_skills"), f.get("year"), datetime.now().strftime("%Y-%m-%d")))
+        elif act == "recompute_recommendations":
+            # Runs in the background, in its own interpreter; throughput is logged when it finishes
+            threading.Thread(target=batch_recommend.recompute_in_subprocess,
+                             kwargs={"db_path": DB_PATH, "model_path": MODEL_PATH, "cache_path": JOB_VECTORS_PATH},
+                             daemon=True).start()
+            flash("Recomputing recommendations for all students in the background", "success")
+        admin_api.invalidate()
+        catalogue.invalidate()
         return redirect(url_for("admin"))
 
-    return render_template("admin_dashboard.html", 
-                           jobs=db_fetchall("SELECT * FROM jobs ORDER BY id DESC"),
-                           courses=db_fetchall("SELECT * FROM courses ORDER BY id DESC"),
-                           videos=db_fetchall("SELECT v.*, c.title FROM course_videos v LEFT JOIN courses c ON v.course_id = c.id ORDER BY v.id DESC"),
-                           trends=db_fetchall("SELECT * FROM job_trends ORDER BY id DESC"),
-                           students=db_fetchall("SELECT * FROM student_profile ORDER BY id DESC"),
-                           users=db_fetchall("SELECT * FROM users WHERE role='student' ORDER BY id DESC"))
+    # Tabs fetch their rows page by page from /admin/api/<collection>
+    return render_template("admin_dashboard.html")
+
+@app.route("/admin/stats")
+def admin_stats():
+    if session.get("role") != "admin": return {"error": "admin login required"}, 401
+    return {"catalogue_cache": catalogue.stats(),
+            "prediction_cache": predictions.stats() if predictions else None,
+            "db_pool": db_pool.stats()}
+
+def delete_records(kind, ids):
+    """Delete ``ids`` of ``kind`` in one transaction (dependent rows cascade), then drop derived state"""
+    with db_pool.connection() as conn:
+        deleted, user_ids = deletion.delete_ids(conn, kind, ids)
+    if kind == "job" and job_store:
+        for job_id in deletion.parse_ids(ids): job_store.remove(job_id)
+    if profile_store:
+        for uid in user_ids: profile_store.remove(uid)
+    admin_api.invalidate()
+    catalogue.invalidate()
+    return deleted
 
 @app.route("/delete/<kind>/<int:oid>")
 def delete(kind, oid):
     if session.get("role") != "admin": return redirect(url_for("login"))
-    tables = {"job":"jobs", "student":"student_profile", "user":"users", "course":"courses", "video":"course_videos", "trend":"job_trends"}
-    if kind in tables:
-        db_execute(f"DELETE FROM {tables[kind]} WHERE id=?", (oid,))
-        if kind == "user": 
-            db_execute("DELETE FROM student_profile WHERE user_id=?", (oid,))
-            db_execute("DELETE FROM job_recommendations WHERE user_id=?", (oid,))
+    if kind in deletion.TABLES:
+        try:
+            delete_records(kind, [oid])
+        except Exception as e:
+            logger.error(f"Delete Error: {e}")
     return redirect(url_for("admin"))
 
+@app.route("/admin/delete/<kind>", methods=["POST"])
+def bulk_delete(kind):
+    """Delete many rows at once: JSON {"ids": [1, 2, 3]} or form field ids=1,2,3"""
+    if session.get("role") != "admin": return {"error": "admin login required"}, 401
+    if kind not in deletion.TABLES: return {"error": f"Unknown kind '{kind}'"}, 404
+    data = request.get_json(silent=True) or {}
+    try:
+        ids = deletion.parse_ids(data.get("ids", request.form.get("ids", "")))
+    except (TypeError, ValueError):
+        return {"error": "ids must be integers"}, 400
+    if not ids: return {"error": "no ids given"}, 400
+    try:
+        return {"deleted": delete_records(kind, ids)}
+    except Exception as e:
+        logger.error(f"Bulk Delete Error: {e}")
+        return {"error": "delete failed, nothing was removed"}, 500
+
 @app.route("/download_report")
 def download_report():
     if session.get("role") != "student": return redirect(url_for("login"))
     uid = session.get("user_id")
-    profile = db_fetchall("SELECT * FROM student_profile WHERE user_id=?", (uid,))
-    if not profile: return redirect(url_for("dashboard"))
-    p = profile[0]
-
-    # Calculate ATS compatibility insights (same logic as dashboard)
-    profile_completeness = 0
-    ats_insights = []
-
-    if profile and profile[0]:
-        p = profile[0]
-        # Check profile completeness
-        fields = [p[2], p[3], p[4], p[5], p[6], p[7], p[8], p[9], p[10], p[11], p[12]]
-        filled_fields = sum(1 for f in fields if f and str(f).strip() and str(f) != 'None')
-        profile_completeness = int((filled_fields / len(fields)) * 100)
-
-        # Generate insights based on profile
-        if p[7] and len(str(p[7]).split(',')) >= 3:  # Skills
-            ats_insights.append("Strong skills profile with multiple technologies")
-        elif p[7]:
-            ats_insights.append("Add more skills to improve ATS matching")
-
-        if p[11] and len(str(p[11]).split(',')) >= 2:  # Tech stack
-            ats_insights.append("Diverse tech stack increases job opportunities")
-        elif p[11]:
-            ats_insights.append("Expand your tech stack for better matches")
-
-        if p[9] and len(str(p[9]).split()) >= 10:  # Experience
-            ats_insights.append("Detailed experience description helps ATS parsing")
-        elif p[9]:
-            ats_insights.append("Add more details to your experience section")
-
-        recs = db_fetchall("""
-            SELECT j.*, r.match_score, r.match_reason FROM job_recommendations r
-            JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC
-        """, (uid,))
-
-        if recs and len(recs) >= 5:
-            ats_insights.append("Multiple job matches found - good profile strength")
-        elif recs and len(recs) >= 2:
-            ats_insights.append("Some job matches generated")
-        elif recs:
-            ats_insights.append("Limited job matches - consider broadening skills")
-
-        # Default insights if profile is incomplete
-        if not ats_insights:
-            ats_insights = [
-                "Complete your profile for better recommendations",
-                "Add skills, experience, and tech stack details",
-                "Include specific technologies and tools you know"
-            ]
-
-    else:
-        profile_completeness = 0
-        ats_insights = ["Complete your profile to get personalized insights"]
-        recs = []
+    p = load_profile(db_fetchall, uid, ReportProfile)
+    if not p: return redirect(url_for("dashboard"))
+    # Completeness, insights, confidence and top jobs: the same snapshot row the dashboard reads
+    snapshot = insights.get(db_pool, uid)
 
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
@@ -544,27 +499,27 @@ def download_report():
     c.setFont("Helvetica-Bold", 14)
     c.drawString(50, 700, "PROFILE SUMMARY")
     c.setFont("Helvetica", 12)
-    c.drawString(50, 675, f"Name: {p[2] or 'N/A'}")
-    c.drawString(50, 655, f"Register Number: {p[3] or 'N/A'}")
-    c.drawString(50, 635, f"College: {p[4] or 'N/A'}")
-    c.drawString(50, 615, f"Batch Year: {p[5] or 'N/A'}")
-    c.drawString(50, 595, f"Current Semester: {p[6] or 'N/A'}")
-    c.drawString(50, 575, f"Skills: {p[7] or 'N/A'}")
-    c.drawString(50, 555, f"Tech Stack: {p[11] or 'N/A'}")
-    c.drawString(50, 535, f"Interests: {p[10] or 'N/A'}")
-    c.drawString(50, 515, f"Location: {p[12] or 'N/A'}")
+    c.drawString(50, 675, f"Name: {p.full_name or 'N/A'}")
+    c.drawString(50, 655, f"Register Number: {p.register_number or 'N/A'}")
+    c.drawString(50, 635, f"College: {p.college_name or 'N/A'}")
+    c.drawString(50, 615, f"Batch Year: {p.batch_year or 'N/A'}")
+    c.drawString(50, 595, f"Current Semester: {p.current_semester or 'N/A'}")
+    c.drawString(50, 575, f"Skills: {p.skills or 'N/A'}")
+    c.drawString(50, 555, f"Tech Stack: {p.tech_stack or 'N/A'}")
+    c.drawString(50, 535, f"Interests: {p.interests or 'N/A'}")
+    c.drawString(50, 515, f"Location: {p.location or 'N/A'}")
 
     # ATS Compatibility Insights
     c.setFont("Helvetica-Bold", 14)
     c.drawString(50, 480, "ATS COMPATIBILITY INSIGHTS")
     c.setFont("Helvetica", 12)
-    c.drawString(50, 460, f"Profile Completeness: {profile_completeness}%")
+    c.drawString(50, 460, f"Profile Completeness: {snapshot.completeness}%")
     y_pos = 440
     c.setFont("Helvetica-Bold", 11)
     c.drawString(50, y_pos, "Optimization Tips:")
     y_pos -= 20
     c.setFont("Helvetica", 10)
-    for i, insight in enumerate(ats_insights[:4]):  # Show top 4 insights
+    for i, insight in enumerate(insights.plain(snapshot)[:4]):  # Show top 4 insights
         c.drawString(50, y_pos, f"• {insight}")
         y_pos -= 15
 
@@ -572,10 +527,8 @@ def download_report():
     c.setFont("Helvetica-Bold", 14)
     c.drawString(50, 400, "SKILL ANALYSIS")
     c.setFont("Helvetica", 12)
-    recs = db_fetchall("SELECT j.title, r.match_score FROM job_recommendations r JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC LIMIT 1", (uid,))
-    if recs:
-        skill_confidence = int(recs[0][1] * 100)
-        c.drawString(50, 380, f"Skill Match Confidence: {skill_confidence}%")
+    if snapshot.top_jobs:
+        c.drawString(50, 380, f"Skill Match Confidence: {snapshot.confidence}%")
         c.drawString(50, 360, "Analysis: Generated by comparing your profile with job descriptions")
     else:
         c.drawString(50, 380, "Skill Match Confidence: 0%")
@@ -585,12 +538,11 @@ def download_report():
     c.setFont("Helvetica-Bold", 14)
     c.drawString(50, 320, "TOP JOB RECOMMENDATIONS")
     c.setFont("Helvetica", 12)
-    recs = db_fetchall("SELECT j.title, r.match_score FROM job_recommendations r JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC LIMIT 5", (uid,))
     y = 295
-    if recs:
-        for i, r in enumerate(recs, 1):
-            c.drawString(50, y, f"{i}. {r[0]}")
-            c.drawString(400, y, f"{int(r[1]*100)}% match")
+    if snapshot.top_jobs:
+        for i, (title, percent) in enumerate(snapshot.top_jobs, 1):
+            c.drawString(50, y, f"{i}. {title}")
+            c.drawString(400, y, f"{percent}% match")
             y -= 20
     else:
         c.drawString(50, y, "No job recommendations available yet.")
@@ -603,7 +555,7 @@ def download_report():
     c.showPage()
     c.save()
     buffer.seek(0)
-    return send_file(buffer, as_attachment=True, download_name=f"AI_Career_Report_{p[2] or 'Student'}.pdf", mimetype='application/pdf')
+    return send_file(buffer, as_attachment=True, download_name=f"AI_Career_Report_{p.full_name or 'Student'}.pdf", mimetype='application/pdf')
 
 @app.route("/chat", methods=["POST"])
 def chat():
@@ -0,0 +1,241 @@
+"""
+Static Assets and Response Compression
+The pages' stylesheets and scripts live in static/css and static/js instead
+of inline <style>/<script> blocks (login.html and register.html share
+auth.css), so a browser downloads them once rather than with every HTML
+response. Scripts that need Jinja values stay inline.
+
+Build step (run on deploy, after any change under static/css or static/js):
+
+    python assets.py            copy each file to static/assets/<name>.<hash>.<ext>,
+                                write .gz (and .br, if brotli is installed)
+                                siblings and static/assets/manifest.json
+    python assets.py --report   also print bytes on the wire per page, before and after
+
+``Assets(app)`` wires it into an app:
+
+* ``{{ asset('css/dashboard.css') }}`` resolves to the fingerprinted URL, or
+  to the plain static file when the build has not been run;
+* fingerprinted files are served with a one-year ``immutable`` Cache-Control
+  (a changed file gets a new name), precompressed to the client's
+  Accept-Encoding;
+* HTML and JSON responses are compressed on the fly. A strong ETag gets the
+  encoding appended (``"<tag>-gzip"``), as each encoding is a distinct
+  representation; fragment_cache.not_modified matches either form.
+
+A page links fingerprinted names, so ``version()`` (a hash of the manifest)
+is part of its ETag, and the manifest is re-read when a build replaces it.
+A build keeps the previous build's files, which pages still cached by
+browsers link to, and deletes anything older.
+"""
+
+import os
+import re
+import gzip
+import json
+import hashlib
+import argparse
+from flask import request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, "static")
+TEMPLATE_DIR = os.path.join(APP_DIR, "templates")
+SOURCES = ("css", "js")            # folders under static/ that are fingerprinted
+BUILD = "assets"                   # static/assets/, generated; not kept in git
+MANIFEST = "manifest.json"
+ONE_YEAR = 365 * 24 * 3600
+MIN_SIZE = 500                     # smaller bodies are not worth a compression pass
+COMPRESSIBLE = {"text/html", "text/css", "text/plain", "application/json", "application/javascript", "text/javascript"}
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# The tags templates use to pull in an asset; --report inlines them again for the "before" size
+ASSET_TAG = re.compile(r"""<link rel="stylesheet" href="\{\{ asset\('([^']+)'\) \}\}">|<script src="\{\{ asset\('([^']+)'\) \}\}"></script>""")
+
+
+def encodings():
+    return ["br", "gzip"] if brotli else ["gzip"]
+
+
+def compress(data, encoding, best=False):
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if best else 5)
+    return gzip.compress(data, compresslevel=9 if best else 6, mtime=0)
+
+
+class Assets:
+    """Fingerprinted static files and response compression for one Flask app"""
+
+    def __init__(self, app, static_dir=STATIC_DIR):
+        self.build_dir = os.path.join(static_dir, BUILD)
+        self.manifest_path = os.path.join(self.build_dir, MANIFEST)
+        self.manifest = {}
+        self._loaded = None
+        self._version = ""
+        self._reload()
+        app.jinja_env.globals["asset"] = self.url
+        app.add_url_rule(f"/static/{BUILD}/<path:filename>", "built_asset", self.serve)
+        app.after_request(self.compress_response)
+
+    def _reload(self):
+        """Pick up a manifest written by a build since the last look"""
+        try:
+            st = os.stat(self.manifest_path)
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            stamp = None
+        if stamp == self._loaded:
+            return
+        manifest = {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            pass  # not built: templates link the plain files
+        self.manifest, self._loaded = manifest, stamp
+        self._version = hashlib.sha1(json.dumps(manifest, sort_keys=True).encode()).hexdigest()[:10]
+
+    def version(self):
+        """Identity of the asset URLs pages link to right now (part of their ETags)"""
+        self._reload()
+        return self._version
+
+    def url(self, path):
+        self._reload()
+        built = self.manifest.get(path)
+        if built:
+            return url_for("built_asset", filename=built)
+        return url_for("static", filename=path)
+
+    def serve(self, filename):
+        encoding = request.accept_encodings.best_match(encodings())
+        name = filename
+        if encoding and os.path.isfile(os.path.join(self.build_dir, filename + SUFFIXES[encoding])):
+            name = filename + SUFFIXES[encoding]
+        else:
+            encoding = None
+        response = send_from_directory(self.build_dir, name, max_age=ONE_YEAR)
+        if encoding:
+            # send_file types "x.css.gz" as CSS with the matching Content-Encoding; be explicit anyway
+            response.mimetype = "text/css" if filename.endswith(".css") else "application/javascript"
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Cache-Control"] = f"public, max-age={ONE_YEAR}, immutable"
+        response.vary.add("Accept-Encoding")
+        return response
+
+    def compress_response(self, response):
+        """after_request: compress text bodies the client accepts compressed"""
+        if response.status_code == 304:
+            # Answer with the representation's tag the client sent (``"<tag>-gzip"``)
+            tag, weak = response.get_etag()
+            sent = [t for t in request.if_none_match.as_set() if tag and t.startswith(tag + "-")]
+            if sent:
+                response.set_etag(sent[0], weak)
+            return response
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or "Content-Encoding" in response.headers
+                or response.mimetype not in COMPRESSIBLE):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = request.accept_encodings.best_match(encodings())
+        data = response.get_data()
+        if not encoding or len(data) < MIN_SIZE:
+            return response
+        response.set_data(compress(data, encoding))
+        response.headers["Content-Encoding"] = encoding
+        tag, weak = response.get_etag()
+        if tag:
+            response.set_etag(f"{tag}-{encoding}", weak)
+        return response
+
+
+# --- Build ---
+def build(static_dir=STATIC_DIR):
+    """Fingerprint and precompress every file under static/css and static/js; returns the manifest"""
+    build_dir = os.path.join(static_dir, BUILD)
+    os.makedirs(build_dir, exist_ok=True)
+    try:
+        with open(os.path.join(build_dir, MANIFEST), encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+    manifest = {}
+    for folder in SOURCES:
+        source_dir = os.path.join(static_dir, folder)
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            with open(os.path.join(source_dir, name), "rb") as f:
+                data = f.read()
+            stem, ext = os.path.splitext(name)
+            built = f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
+            with open(os.path.join(build_dir, built), "wb") as f:
+                f.write(data)
+            for encoding in encodings():
+                with open(os.path.join(build_dir, built + SUFFIXES[encoding]), "wb") as f:
+                    f.write(compress(data, encoding, best=True))
+            manifest[f"{folder}/{name}"] = built
+    tmp_path = os.path.join(build_dir, MANIFEST + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(build_dir, MANIFEST))
+
+    # Keep this build's and the previous build's files (and their compressed siblings)
+    keep = {MANIFEST} | {built + suffix for built in set(manifest.values()) | set(previous.values())
+                         for suffix in ("",) + tuple(SUFFIXES.values())}
+    for name in os.listdir(build_dir):
+        if name not in keep:
+            os.remove(os.path.join(build_dir, name))
+    return manifest
+
+
+def wire_sizes(template, static_dir=STATIC_DIR):
+    """
+    Bytes a page costs: ``before`` with its assets inlined and sent
+    uncompressed (as the templates used to be served), ``first`` for the
+    compressed HTML plus its precompressed assets, ``repeat`` once the
+    assets are cached. Measured on the template source, before rendering.
+    """
+    with open(os.path.join(TEMPLATE_DIR, template), "rb") as f:
+        html = f.read().decode("utf-8")
+    assets = [css or js for css, js in ASSET_TAG.findall(html)]
+    contents = {}
+    for path in assets:
+        with open(os.path.join(static_dir, path), "rb") as f:
+            contents[path] = f.read()
+
+    def inline(match):
+        path = match.group(1) or match.group(2)
+        kind = "style" if match.group(1) else "script"
+        return f"<{kind}>\n{contents[path].decode('utf-8')}</{kind}>"
+
+    before = len(ASSET_TAG.sub(inline, html).encode("utf-8"))
+    encoding = encodings()[0]
+    repeat = len(compress(html.encode("utf-8"), encoding))
+    first = repeat + sum(len(compress(data, encoding, best=True)) for data in set(contents.values()))
+    return {"before": before, "first": first, "repeat": repeat, "assets": assets}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress static/css and static/js")
+    parser.add_argument("--report", action="store_true", help="print bytes on the wire per page")
+    args = parser.parse_args()
+
+    manifest = build()
+    for source, built in sorted(manifest.items()):
+        print(f"{source:<22} -> {BUILD}/{built}")
+    if args.report:
+        print(f"\n{'page':<22} | {'before':>9} | {'first visit':>11} | {'repeat visit':>12}   ({encodings()[0]})")
+        print("-" * 66)
+        for template in sorted(os.listdir(TEMPLATE_DIR)):
+            sizes = wire_sizes(template)
+            if sizes["assets"]:
+                print(f"{template:<22} | {sizes['before']:>9,} | {sizes['first']:>11,} | {sizes['repeat']:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Bulk Recommendation Recompute
+Rescores every student_profile row against the whole jobs table and writes
+the results back to job_recommendations. Used after large catalogue changes
+(e.g. an admin posting many jobs) so no student is left with a stale list.
+A single new job is pushed into existing lists with ``fan_out_job`` instead.
+A web server starts it with ``recompute_in_subprocess``, so the worker pool
+is forked from a fresh interpreter rather than from the threaded server.
+
+Usage: python batch_recommend.py [--workers N] [--chunk-size N] [--top-k 10]
+       python batch_recommend.py --storage memory --scale 100   (benchmark on generated data, data.db untouched)
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import subprocess
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+from db import connect
+from job_vectors import JobVectorStore, JOB_COLUMNS, PROFILE_COLUMNS, profile_text
+from fast_knn import accelerate
+from scoring import SIMILARITY_THRESHOLD, similarity_scores, title_matches, rank_matches_many
+from recommendation_store import INSERT_SQL, replace_rows
+import insights
+from storage import open_storage
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(APP_DIR, "data.db")
+MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+JOB_VECTORS_PATH = os.path.join(APP_DIR, "models", "job_vectors.pkl")
+
+# Upper bound on the dense students x jobs score block held per chunk
+CELL_BUDGET = 20_000_000
+# Students per fan-out lookup, well under SQLite's bound-parameter limit
+FAN_OUT_BATCH = 500
+
+
+# --- Worker state (set once per process by _init_worker) ---
+_state = {}
+
+
+def _init_worker(model_path, job_matrix, job_ids, titles, top_k):
+    model = accelerate(joblib.load(model_path))
+    _state.update({
+        "model": model,
+        "vectorizer": model.named_steps["tfidf"],
+        "jobs": normalize(sp.csr_matrix(job_matrix)).T.tocsc(),
+        "job_ids": job_ids,
+        "titles": titles,
+        "top_k": top_k,
+        "masks": {},
+    })
+
+
+def _title_mask(label):
+    masks = _state["masks"]
+    if label not in masks:
+        masks[label] = title_matches(label, _state["titles"])
+    return masks[label]
+
+
+def score_chunk(chunk):
+    """Score a chunk of (user_id, text) pairs; returns (user_ids, rows to insert)"""
+    user_ids = [uid for uid, _ in chunk]
+    texts = [text for _, text in chunk]
+    try:
+        labels = [str(l).strip().lower() for l in _state["model"].predict(texts)]
+    except Exception as e:
+        logger.error(f"Batch predict failed: {e}")
+        labels = [None] * len(texts)
+
+    profiles = normalize(sp.csr_matrix(_state["vectorizer"].transform(texts)))
+    sims = (profiles @ _state["jobs"]).toarray()
+
+    ai_match = np.stack([_title_mask(label) for label in labels])
+    ranked = rank_matches_many(sims, ai_match, labels, _state["job_ids"], _state["top_k"])
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    rows = []
+    for uid, recs in zip(user_ids, ranked):
+        rows.extend((uid, r["job_id"], r["score"], r["reason"], today) for r in recs)
+    return user_ids, rows
+
+
+def write_chunk(conn, user_ids, rows):
+    """Replace the recommendation sets of a chunk of students in one transaction"""
+    # One set-based delete per chunk: a single table pass instead of one per student
+    replace_rows(conn, user_ids, rows)
+
+
+def recompute_all(db_path=DB_PATH, model_path=MODEL_PATH, cache_path=JOB_VECTORS_PATH,
+                  workers=None, chunk_size=None, top_k=10):
+    """
+    Recompute recommendations for every student. Returns a stats dict with
+    ``students``, ``jobs``, ``rows``, ``seconds`` and ``students_per_sec``.
+    """
+    start = time.perf_counter()
+    model = joblib.load(model_path)
+    store = JobVectorStore(model.named_steps["tfidf"], db_path, cache_path, model_path=model_path)
+    store.load()
+
+    with connect(db_path) as conn:
+        jobs = conn.execute(f"SELECT {JOB_COLUMNS} FROM jobs ORDER BY id").fetchall()
+        profiles = conn.execute(f"SELECT {PROFILE_COLUMNS} FROM student_profile ORDER BY user_id").fetchall()
+
+    stats = {"students": len(profiles), "jobs": len(jobs), "rows": 0}
+    if profiles and jobs:
+        job_matrix = store.vectors_for(jobs)
+        job_ids = [j[0] for j in jobs]
+        titles = [(j[1] or "").lower() for j in jobs]
+        if not chunk_size:
+            chunk_size = max(1, min(1000, CELL_BUDGET // len(jobs)))
+        items = [(p[0], profile_text(p)) for p in profiles]
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        init_args = (model_path, job_matrix, job_ids, titles, top_k)
+        workers = workers or os.cpu_count() or 1
+
+        pool = None
+        if workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args)
+            results = pool.map(score_chunk, chunks)
+        else:
+            _init_worker(*init_args)
+            results = map(score_chunk, chunks)
+
+        # Workers score, this process owns the single writer connection
+        conn = connect(db_path)
+        try:
+            for user_ids, rows in results:
+                write_chunk(conn, user_ids, rows)
+                stats["rows"] += len(rows)
+        finally:
+            conn.close()
+            if pool:
+                pool.shutdown()
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    stats["students_per_sec"] = round(stats["students"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+    logger.info(f"Recomputed {stats['students']} students x {stats['jobs']} jobs in {stats['seconds']}s "
+                f"({stats['students_per_sec']} students/s, {stats['rows']} rows)")
+    return stats
+
+
+def recompute_in_subprocess(db_path=DB_PATH, model_path=MODEL_PATH, cache_path=JOB_VECTORS_PATH, workers=None, top_k=10):
+    """
+    ``recompute_all`` run by this module's CLI in a new interpreter; returns its exit code.
+    Forking the worker pool inside a server with live threads, pool connections and locks can deadlock.
+    """
+    cmd = [sys.executable, os.path.abspath(__file__), "--db", db_path, "--model", model_path, "--cache", cache_path,
+           "--top-k", str(top_k)]
+    if workers:
+        cmd += ["--workers", str(workers)]
+    return subprocess.run(cmd).returncode
+
+
+def fan_out_job(job_id, job_store, profile_store, db_path=DB_PATH, top_k=10):
+    """
+    Push a newly posted job into the lists of the students it would rank for.
+
+    The job is scored against the cached matrix of every profile in one
+    product; a row is only written for students with fewer than ``top_k``
+    recommendations or whose current k-th score the job strictly beats
+    (a tie loses, as the newest job ranks last among equal scores).
+    Both stores are read through one snapshot each, so a concurrent write
+    cannot misalign scores, labels and user IDs.
+    Returns the number of students updated.
+    """
+    jobs, profiles = job_store.snapshot(), profile_store.snapshot()
+    pos = jobs.position(job_id)
+    if pos is None or profiles.matrix is None or profiles.matrix.shape[0] == 0:
+        return 0
+    sims = similarity_scores(jobs.matrix[pos], profiles.matrix)
+    title = jobs.meta[pos]
+    labels = profiles.meta
+    # Title match per distinct predicted label, not per student
+    label_match = {l: bool(l) and (l in title or title in l) for l in set(labels)}
+    ai_match = np.array([label_match[l] for l in labels], dtype=bool)
+    scores = np.round(np.where(ai_match, 1.0, sims), 3)
+    candidates = np.flatnonzero(ai_match | (sims >= SIMILARITY_THRESHOLD))
+    if len(candidates) == 0:
+        return 0
+
+    conn = connect(db_path)
+    try:
+        # The candidates' k-th scores and the rows that fall off if the job gets in, read from
+        # the (user_id, match_score DESC, job_id) index for those students only
+        candidate_ids = [profiles.keys[i] for i in candidates]
+        kth, overflow = {}, {}
+        for start in range(0, len(candidate_ids), FAN_OUT_BATCH):
+            chunk = candidate_ids[start:start + FAN_OUT_BATCH]
+            ranked = conn.execute(f"""
+                SELECT user_id, id, match_score, rnk FROM (
+                    SELECT user_id, id, match_score,
+                           ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY match_score DESC, job_id ASC) AS rnk
+                    FROM job_recommendations WHERE user_id IN ({",".join("?" * len(chunk))}))
+                WHERE rnk >= ?""", chunk + [top_k]).fetchall()
+            for uid, rec_id, score, rnk in ranked:
+                if rnk == top_k:
+                    kth[uid] = score
+                overflow.setdefault(uid, []).append(rec_id)
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        inserts, deletes = [], []
+        for i in candidates:
+            uid = profiles.keys[i]
+            if uid in kth and not scores[i] > kth[uid]:
+                continue
+            deletes.extend((rec_id,) for rec_id in overflow.get(uid, []))
+            reason = f"AI Match: {labels[i]}" if ai_match[i] else f"Similarity: {sims[i]:.2f}"
+            inserts.append((uid, int(job_id), round(float(scores[i]), 3), reason, today))
+
+        with conn:
+            conn.executemany("DELETE FROM job_recommendations WHERE id=?", deletes)
+            conn.executemany(INSERT_SQL, inserts)
+            insights.refresh(conn, [row[0] for row in inserts])
+    finally:
+        conn.close()
+    logger.info(f"Fan-out of job {job_id}: {len(inserts)} of {len(labels)} students updated")
+    return len(inserts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute job recommendations for every student")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--cache", default=None, help="job vector cache (default: models/job_vectors.pkl)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="students per sparse product")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--storage", default="sqlite", help="sqlite (--db) or memory (the bundled CSVs)")
+    parser.add_argument("--scale", type=int, default=1, help="copies of every CSV row with --storage memory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    storage = open_storage(args.storage, args.db, scale=args.scale)
+    try:
+        stats = recompute_all(storage.db_path, args.model, args.cache or storage.artifact_path(JOB_VECTORS_PATH),
+                              workers=args.workers, chunk_size=args.chunk_size, top_k=args.top_k)
+    finally:
+        storage.close()
+    print(f"Students: {stats['students']}  Jobs: {stats['jobs']}  Rows written: {stats['rows']}")
+    print(f"Elapsed: {stats['seconds']}s  Throughput: {stats['students_per_sec']} students/s")
+
+
+if __name__ == "__main__":
+    main()
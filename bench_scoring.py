@@ -0,0 +1,87 @@
+"""
+Scoring Micro-benchmark
+Compares the per-job cosine_similarity loop with the vectorized engine in
+scoring.py at 50, 10k and 100k synthetic jobs.
+
+Usage: python bench_scoring.py [--sizes 50,10000,100000] [--legacy-max 10000]
+"""
+
+import os
+import time
+import random
+import argparse
+import warnings
+import joblib
+from sklearn.metrics.pairwise import cosine_similarity
+from scoring import similarity_scores, top_k_indices
+
+warnings.filterwarnings("ignore")
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+
+SKILLS = ["Python", "SQL", "Java", "Docker", "React", "Linux", "Git", "AWS", "TensorFlow", "HTML",
+          "CSS", "Flask", "Django", "Pandas", "C++", "Node.js", "Kubernetes", "MongoDB", "GraphQL",
+          "TypeScript", "Azure", "PyTorch", "REST", "NumPy"]
+TITLES = ["Backend Developer", "Data Scientist", "DevOps Engineer", "Frontend Developer",
+          "ML Engineer", "Cloud Engineer", "QA Engineer", "Full Stack Developer"]
+
+
+def synthetic_jobs(n, seed=42):
+    rnd = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        skills = rnd.sample(SKILLS, rnd.randint(3, 6))
+        title = rnd.choice(TITLES)
+        texts.append(f"{title} Looking for engineers with experience in {', '.join(skills)} {';'.join(skills)}")
+    return texts
+
+
+def legacy_top_k(profile_vec, job_matrix, k):
+    recs = []
+    for idx in range(job_matrix.shape[0]):
+        sim = float(cosine_similarity(profile_vec, job_matrix[idx:idx+1])[0][0])
+        if sim >= 0.2:
+            recs.append((idx, round(sim, 3)))
+    return sorted(recs, key=lambda x: x[1], reverse=True)[:k]
+
+
+def engine_top_k(profile_vec, job_matrix, k):
+    sims = similarity_scores(profile_vec, job_matrix)
+    return top_k_indices(sims.round(3), k, sims >= 0.2)
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job scoring latency")
+    parser.add_argument("--sizes", default="50,10000,100000")
+    parser.add_argument("--legacy-max", type=int, default=10000,
+                        help="skip the per-job loop above this many jobs")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    vectorizer = joblib.load(MODEL_PATH).named_steps["tfidf"]
+    profile = vectorizer.transform(["python sql docker linux flask backend developer"])
+
+    print(f"{'jobs':>8} | {'legacy loop (ms)':>17} | {'engine (ms)':>12} | speedup")
+    print("-" * 56)
+    for n in [int(s) for s in args.sizes.split(",")]:
+        jobs = vectorizer.transform(synthetic_jobs(n))
+        engine_ms = timed(lambda: engine_top_k(profile, jobs, 10), args.repeat)
+        if n <= args.legacy_max:
+            legacy_ms = timed(lambda: legacy_top_k(profile, jobs, 10), 1)
+            print(f"{n:>8} | {legacy_ms:>17.2f} | {engine_ms:>12.3f} | {legacy_ms / engine_ms:>6.0f}x")
+        else:
+            print(f"{n:>8} | {'skipped':>17} | {engine_ms:>12.3f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Catalogue Cache
+Read-through cache for the catalogue content every student dashboard shows
+(courses, course_videos, job_trends). Only admin writes change these tables,
+so each query result is kept in memory until:
+
+* the admin paths call ``invalidate()`` after a write (this process), or
+* the table's counter in ``table_versions`` moves -- the same trigger-kept
+  counters job_vectors.py uses, so writes made by another worker process or
+  by populate_data.py are noticed within ``check_interval`` seconds, or
+* ``ttl`` seconds pass, as a safety net.
+
+Cached row lists are shared between requests; callers must not mutate them.
+"""
+
+import time
+import threading
+
+
+class CatalogueCache:
+    """``get(query, params, tables)`` returns ``fetchall(query, params)``, cached"""
+
+    def __init__(self, fetchall, ttl=300.0, check_interval=1.0):
+        self.fetchall = fetchall
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = {}
+        self._versions = {}
+        self._versions_checked = 0.0
+        self._lock = threading.Lock()
+
+    def _table_versions(self, tables):
+        """Current counters of ``tables``, re-read from the DB at most every ``check_interval`` seconds"""
+        now = time.time()
+        with self._lock:
+            fresh = now - self._versions_checked < self.check_interval
+            if fresh and all(t in self._versions for t in tables):
+                return tuple(self._versions[t] for t in tables)
+        rows = self.fetchall("SELECT name, version FROM table_versions")
+        with self._lock:
+            self._versions = dict(rows)
+            self._versions_checked = now
+            return tuple(self._versions.get(t, 0) for t in tables)
+
+    def versions(self, tables):
+        """Counters of ``tables``, as recently as ``check_interval`` allows (cache stamps for rendered pages)"""
+        return self._table_versions(tuple(tables))
+
+    def get(self, query, params=(), tables=(), record=None):
+        """Cached rows of ``query``; with ``record`` (a NamedTuple class) rows are built into records once, on a miss"""
+        key = (query, tuple(params), record)
+        tables = tuple(tables)
+        versions = self._table_versions(tables) if tables else ()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] == versions and now - entry[2] < self.ttl:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        rows = self.fetchall(query, params)
+        if record is not None:
+            rows = list(map(record._make, rows))
+        with self._lock:
+            self._entries[key] = (rows, versions, now, tables)
+        return rows
+
+    def invalidate(self, *tables):
+        """Drop entries that read any of ``tables`` (all entries if none given)"""
+        with self._lock:
+            if tables:
+                self._entries = {k: e for k, e in self._entries.items() if not set(e[3]) & set(tables)}
+            else:
+                self._entries.clear()
+            self._versions_checked = 0.0
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations,
+                    "entries": len(self._entries),
+                    "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0}
@@ -0,0 +1,95 @@
+"""
+Database Compaction
+One-off maintenance for data.db: brings the schema up to date, deletes rows
+left orphaned by deletes made before the ON DELETE actions of migration 6
+(recommendations of deleted users or jobs, profiles of deleted users, skill
+links of deleted rows), then rebuilds the file with VACUUM and refreshes the
+planner statistics with ANALYZE.
+
+Usage: python compact_db.py [--db data.db] [--dry-run]
+"""
+
+import os
+import logging
+import argparse
+from db import connect
+from migrations import migrate
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(APP_DIR, "data.db")
+
+# (child table, column, parent table, action) -- the same ON DELETE action migration 6 declares.
+# NULL references are not orphans.
+ORPHANS = [
+    ("student_profile", "user_id", "users", "delete"),
+    ("job_recommendations", "user_id", "users", "delete"),
+    ("job_recommendations", "job_id", "jobs", "delete"),
+    ("course_videos", "course_id", "courses", "unlink"),
+    ("job_skills", "job_id", "jobs", "delete"),
+    ("profile_skills", "user_id", "users", "delete"),
+    ("course_skills", "course_id", "courses", "delete"),
+]
+
+
+def _orphaned(column, parent):
+    return f"{column} IS NOT NULL AND {column} NOT IN (SELECT id FROM {parent})"
+
+
+def orphan_counts(conn):
+    tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return {(child, column): conn.execute(f"SELECT COUNT(*) FROM {child} WHERE {_orphaned(column, parent)}").fetchone()[0]
+            for child, column, parent, _ in ORPHANS if child in tables and parent in tables}
+
+
+def purge_orphans(conn):
+    """Delete (or unlink) orphaned rows in one transaction; returns the rows changed per reference"""
+    changed = orphan_counts(conn)
+    for child, column, parent, action in ORPHANS:
+        if not changed.get((child, column)):
+            continue
+        if action == "unlink":
+            sql = f"UPDATE {child} SET {column} = NULL WHERE {_orphaned(column, parent)}"
+        else:
+            sql = f"DELETE FROM {child} WHERE {_orphaned(column, parent)}"
+        changed[(child, column)] = conn.execute(sql).rowcount
+    conn.commit()
+    return changed
+
+
+def file_size(conn):
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    return conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+
+
+def compact(db_path=DB_PATH, dry_run=False):
+    """Returns ``{"orphans": {...}, "bytes_before": n, "bytes_after": n}``"""
+    migrate(db_path)
+    conn = connect(db_path, timeout=30)
+    try:
+        before = file_size(conn)
+        if dry_run:
+            return {"orphans": orphan_counts(conn), "bytes_before": before, "bytes_after": before}
+        orphans = purge_orphans(conn)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+        return {"orphans": orphans, "bytes_before": before, "bytes_after": file_size(conn)}
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Purge orphaned rows, VACUUM and ANALYZE data.db")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="only count orphans")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    result = compact(args.db, args.dry_run)
+    for (table, column), n in result["orphans"].items():
+        print(f"{table + '.' + column:<30} {n:>6} orphaned{' (would fix)' if args.dry_run and n else ''}")
+    print(f"Size: {result['bytes_before'] / 1024:.0f} KB -> {result['bytes_after'] / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Course Skill Index
+In-memory inverted index behind the 1.py courses tab: every word of a
+course's title, description and category maps to the set of course IDs it
+appears in. The tab shows the courses mentioning any of the student's and
+recommended jobs' skills, so a filter is
+
+* per skill: the intersection of its words' course sets ("machine learning"
+  also has to appear as a phrase in one field);
+* the union of those sets over all the skills;
+* ranked by how many of the skills a course mentions, then by course ID.
+
+A course qualifies exactly when the FTS5 query ``search.match_any(skills)``
+would return it; only the ranking is simpler than BM25. The index is built on
+first use from the catalogue cache and rebuilt when the ``courses`` counter in
+``table_versions`` moves or after ``invalidate()`` (admin writes).
+
+Usage: python course_index.py [--courses 5000] [--queries 200]
+       (filter latency vs the FTS5 query on synthetic courses)
+"""
+
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+import search
+from records import Course, COURSES_QUERY, as_records, columns
+
+
+def words(text):
+    """Lower-cased words of ``text``, split like search.match_any splits skill names"""
+    return search.TOKEN.findall(str(text or "").lower())
+
+
+class CourseIndex:
+    """``match(skills, limit)`` -> Course records mentioning any of ``skills``, most skills first"""
+
+    def __init__(self, catalogue):
+        self.catalogue = catalogue
+        self.builds = 0
+        self._version = None
+        self._index = self.build([])
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Rebuild on next use (call after an admin write to courses)"""
+        with self._lock:
+            self._version = None
+
+    def _current(self):
+        version = self.catalogue.versions(["courses"])
+        with self._lock:
+            if version == self._version:
+                return self._index
+        index = self.build(self.catalogue.get(COURSES_QUERY, tables=["courses"], record=Course))
+        with self._lock:
+            self._index, self._version = index, version
+            self.builds += 1
+        return index
+
+    @staticmethod
+    def build(courses):
+        """(courses by ID, word -> set of course IDs, field text per course for phrase checks)"""
+        postings, fields = {}, {}
+        for course in courses:
+            texts = [" ".join(words(text)) for text in (course.title, course.description, course.category)]
+            fields[course.id] = texts
+            for text in texts:
+                for word in text.split():
+                    postings.setdefault(word, set()).add(course.id)
+        return {c.id: c for c in courses}, postings, fields
+
+    def match(self, skills, limit=search.DEFAULT_LIMIT):
+        courses, postings, fields = self._current()
+        overlap = {}
+        for phrase in {" ".join(words(s)) for s in skills} - {""}:
+            sets = [postings.get(word, set()) for word in phrase.split()]
+            hits = set.intersection(*sets)
+            if " " in phrase:
+                hits = {cid for cid in hits if any(f" {phrase} " in f" {text} " for text in fields[cid])}
+            for cid in hits:
+                overlap[cid] = overlap.get(cid, 0) + 1
+        ranked = sorted(overlap, key=lambda cid: (-overlap[cid], cid))
+        return [courses[cid] for cid in ranked[:limit]]
+
+    def stats(self):
+        with self._lock:
+            return {"builds": self.builds, "courses": len(self._index[0]), "words": len(self._index[1])}
+
+
+# --- Benchmark ---
+SKILLS = ["python", "sql", "docker", "react", "aws", "machine learning", "data science", "java", "c++", "c#",
+          "node.js", "kubernetes", "linux", "rest", "html", "css", "deep learning", "flask", "spark", "git"]
+FILLER = ["course", "learn", "build", "projects", "hands", "on", "advanced", "beginner", "guide", "complete",
+          "with", "and", "for", "modern", "practical", "development", "fundamentals", "masterclass"]
+CATEGORIES = ["Programming Languages", "Web Development", "Data Science & ML", "Databases", "DevOps & Cloud",
+              "Mobile Development"]
+
+
+def synthetic_db(path, n, seed=42):
+    """A migrated database at ``path`` holding ``n`` courses that each mention a few SKILLS"""
+    from migrations import migrate
+    rnd = random.Random(seed)
+    migrate(path)
+
+    def text(k):
+        picked = rnd.choices(FILLER, k=k) + rnd.sample(SKILLS, 2)
+        rnd.shuffle(picked)
+        return " ".join(picked)
+
+    with sqlite3.connect(path) as conn:
+        conn.executemany("INSERT INTO courses (title, description, category) VALUES (?,?,?)",
+                         ((text(4).title(), text(30), rnd.choice(CATEGORIES)) for _ in range(n)))
+
+
+class _Catalogue:
+    """Just enough of CatalogueCache for the benchmark: a fixed table version"""
+
+    def __init__(self, fetchall):
+        self.fetchall = fetchall
+
+    def versions(self, tables):
+        return (0,) * len(tables)
+
+    def get(self, query, params=(), tables=(), record=None):
+        return as_records(record, self.fetchall(query, params))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Course skill filter: FTS5 query vs in-memory index")
+    parser.add_argument("--courses", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    queries = [rnd.sample(SKILLS, rnd.randint(1, 8)) for _ in range(args.queries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        synthetic_db(path, args.courses)
+        conn = sqlite3.connect(path)
+
+        def fetchall(query, params=()):
+            return conn.execute(query, params).fetchall()
+
+        index = CourseIndex(_Catalogue(fetchall))
+        start = time.perf_counter()
+        index.match([])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for q in queries:
+            search.search(fetchall, "courses", search.match_any(q), limit=6, select=columns(Course, "t"))
+        fts_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        start = time.perf_counter()
+        for q in queries:
+            index.match(q, limit=6)
+        index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        conn.close()
+
+    print(f"{args.courses} courses, index built in {build_ms:.0f} ms")
+    print(f"{'filter':<12} | {'ms/query':>8}")
+    print("-" * 23)
+    print(f"{'FTS5 query':<12} | {fts_ms:>8.2f}")
+    print(f"{'CourseIndex':<12} | {index_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
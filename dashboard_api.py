@@ -0,0 +1,149 @@
+"""
+Dashboard Tab API
+JSON endpoints behind the student dashboard tabs, shared by app.py and 1.py.
+/dashboard renders only the shell -- profile form, career report, ATS
+insights from the snapshot -- and static/js/dashboard_tabs.js fetches a tab's
+list the first time the tab is opened, so a page view no longer reads
+recommendations, trends, courses and videos the student may never look at:
+
+    GET /api/me/recommendations   the student's job matches, best first (?min_score=0.25)
+    GET /api/trends               job market trends, newest first
+    GET /api/courses              courses (?category=...) and the course categories the tabs are built from
+    GET /api/videos               course videos (?category=...) and the same categories
+
+    ?fields=title,match_score     projection onto the record's fields (records.py)
+    ?limit=50&offset=0            one page (max 200); "next_offset" is null on the last page
+
+Catalogue lists come from the CatalogueCache. Each response carries a strong
+ETag built from the version stamps of what it shows (the student's insight
+snapshot version, ``table_versions`` counters), so a tab reopened on a later
+visit is answered ``304 Not Modified`` without reading the rows.
+"""
+
+import hashlib
+from flask import Blueprint, request, session
+import fragment_cache
+from records import Course, Recommendation, Trend, Video, COURSES_QUERY, TRENDS_QUERY, VIDEOS_QUERY, load_recommendations
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def course_categories(courses, alphabetical=False):
+    """Distinct course categories in catalogue order (newest course first), or sorted"""
+    seen = []
+    for course in courses:
+        if course.category and course.category not in seen:
+            seen.append(course.category)
+    return sorted(seen) if alphabetical else seen
+
+
+def page(records, record, args):
+    """One page of ``records`` projected onto ``?fields``; raises ValueError on a bad parameter"""
+    fields = [f for f in args.get("fields", "").split(",") if f] or list(record._fields)
+    unknown = [f for f in fields if f not in record._fields]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    limit = min(max(int(args.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    offset = max(int(args.get("offset", 0)), 0)
+    end = offset + limit
+    return {
+        "items": [{f: getattr(r, f) for f in fields} for r in records[offset:end]],
+        "total": len(records),
+        "offset": offset,
+        "next_offset": end if end < len(records) else None,
+    }
+
+
+class DashboardAPI:
+    """
+    ``DashboardAPI(fetchall, catalogue).blueprint`` is registered on the app.
+    ``courses_for(user_id)``, if given, returns the Course records a student's
+    courses tab shows (1.py filters them by skill); otherwise every course.
+    ``alphabetical`` orders the category tabs by name instead of newest first.
+    """
+
+    def __init__(self, fetchall, catalogue, courses_for=None, alphabetical=False):
+        self.fetchall = fetchall
+        self.catalogue = catalogue
+        self.courses_for = courses_for
+        self.alphabetical = alphabetical
+        self.blueprint = Blueprint("dashboard_api", __name__, url_prefix="/api")
+        self.blueprint.add_url_rule("/me/recommendations", "recommendations", self.recommendations_view)
+        self.blueprint.add_url_rule("/trends", "trends", self.trends_view)
+        self.blueprint.add_url_rule("/courses", "courses", self.courses_view)
+        self.blueprint.add_url_rule("/videos", "videos", self.videos_view)
+
+    def snapshot_version(self, user_id):
+        rows = self.fetchall("SELECT version FROM insight_snapshots WHERE user_id=?", (user_id,))
+        return rows[0][0] if rows else None
+
+    def respond(self, stamps, build):
+        """``build()`` -> (records, record, extra), answered as a page; 304 if the client holds ``stamps``' tag"""
+        tag = None
+        if None not in stamps:
+            key = (request.path, sorted(request.args.items(multi=True))) + tuple(stamps)
+            tag = hashlib.sha1(repr(key).encode()).hexdigest()
+        unchanged = fragment_cache.not_modified(tag)
+        if unchanged:
+            return unchanged
+        records, record, extra = build()
+        try:
+            result = page(records, record, request.args)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        result.update(extra)
+        return fragment_cache.conditional(result, tag)
+
+    def recommendations_view(self):
+        if session.get("role") != "student":
+            return {"error": "student login required"}, 401
+        uid = session.get("user_id")
+        try:
+            min_score = float(request.args.get("min_score", 0))
+        except ValueError:
+            return {"error": "min_score must be a number"}, 400
+
+        def build():
+            recs = [r for r in load_recommendations(self.fetchall, uid) if r.match_score >= min_score]
+            return recs, Recommendation, {}
+
+        # The snapshot version moves with every write to the student's recommendations
+        return self.respond((uid, self.snapshot_version(uid)) + self.catalogue.versions(["jobs"]), build)
+
+    def trends_view(self):
+        if not session.get("role"):
+            return {"error": "login required"}, 401
+        return self.respond(self.catalogue.versions(["job_trends"]),
+                            lambda: (self.catalogue.get(TRENDS_QUERY, tables=["job_trends"], record=Trend), Trend, {}))
+
+    def courses_view(self):
+        if not session.get("role"):
+            return {"error": "login required"}, 401
+        per_student = self.courses_for is not None and session.get("role") == "student"
+        stamps = self.catalogue.versions(["courses"])
+        if per_student:
+            uid = session.get("user_id")
+            stamps += (uid, self.snapshot_version(uid)) + self.catalogue.versions(["jobs"])
+
+        def build():
+            courses = self.catalogue.get(COURSES_QUERY, tables=["courses"], record=Course)
+            shown = self.courses_for(uid) if per_student else courses
+            if request.args.get("category"):
+                shown = [c for c in shown if c.category == request.args["category"]]
+            return shown, Course, {"categories": course_categories(courses, self.alphabetical)}
+
+        return self.respond(stamps, build)
+
+    def videos_view(self):
+        if not session.get("role"):
+            return {"error": "login required"}, 401
+
+        def build():
+            videos = self.catalogue.get(VIDEOS_QUERY, tables=["course_videos", "courses"], record=Video)
+            if request.args.get("category"):
+                videos = [v for v in videos if v.category == request.args["category"]]
+            courses = self.catalogue.get(COURSES_QUERY, tables=["courses"], record=Course)
+            return videos, Video, {"categories": course_categories(courses, self.alphabetical)}
+
+        return self.respond(self.catalogue.versions(["course_videos", "courses"]), build)
@@ -0,0 +1,170 @@
+"""
+Pooled SQLite Connections
+Long-lived connections shared by the db_fetchall/db_execute helpers of
+app.py, 1.py and 2.py instead of a fresh sqlite3.connect per query.
+
+Every connection runs in WAL mode (readers no longer block the writer) with
+synchronous=NORMAL, a memory-mapped read window, a busy timeout instead of
+an immediate "database is locked", and sqlite3's prepared-statement cache.
+``stats()`` reports checkouts, waits for a free connection and statement
+timings.
+
+``connect()`` is the one place sqlite3 connections are opened, so a
+``file:`` URI from storage.py works wherever a path does, and every
+connection enforces foreign keys (the ON DELETE actions of migration 6).
+"""
+
+import time
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+def connect(db_path, **kwargs):
+    """sqlite3.connect that also accepts ``file:`` URIs (e.g. an in-memory database) and enforces foreign keys"""
+    conn = sqlite3.connect(db_path, uri=str(db_path).startswith("file:"), **kwargs)
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+class ConnectionPool:
+    """
+    At most ``size`` connections; a thread checks one out per call and waits
+    (counted in ``waits``) when all are busy.
+    """
+
+    def __init__(self, db_path, size=8, busy_timeout_ms=5000, cached_statements=256, pragmas=None):
+        self.db_path = db_path
+        self.size = size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self.pragmas = dict(PRAGMAS, **(pragmas or {}))
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.statements = 0
+        self.statement_seconds = 0.0
+        self._per_query = {}
+
+    def _connect(self):
+        conn = connect(self.db_path, timeout=self.busy_timeout_ms / 1000,
+                       check_same_thread=False, cached_statements=self.cached_statements)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    # --- Checkout ---
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except sqlite3.Error:
+                    self._created -= 1
+                    raise
+        start = time.perf_counter()
+        conn = self._idle.get()
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += time.perf_counter() - start
+        return conn
+
+    def _release(self, conn, broken=False):
+        if broken:
+            with self._lock:
+                self._created -= 1
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """A pooled connection; the transaction is committed on success, rolled back on error"""
+        conn = self._acquire()
+        with self._lock:
+            self.checkouts += 1
+        broken = False
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.ProgrammingError:
+            broken = True
+            raise
+        except Exception:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                broken = True
+            raise
+        finally:
+            self._release(conn, broken)
+
+    # --- Statements ---
+    def _timed(self, conn, query, params, many=False, fetch=False):
+        start = time.perf_counter()
+        cur = conn.executemany(query, params) if many else conn.execute(query, params)
+        result = cur.fetchall() if fetch else cur
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.statements += 1
+            self.statement_seconds += elapsed
+            count, total = self._per_query.get(query, (0, 0.0))
+            self._per_query[query] = (count + 1, total + elapsed)
+        return result
+
+    def fetchall(self, query, params=()):
+        with self.connection() as conn:
+            return self._timed(conn, query, params, fetch=True)
+
+    def execute(self, query, params=()):
+        """Run one write and commit it; returns lastrowid"""
+        with self.connection() as conn:
+            return self._timed(conn, query, params).lastrowid
+
+    def executemany(self, query, seq_of_params):
+        with self.connection() as conn:
+            return self._timed(conn, query, seq_of_params, many=True).rowcount
+
+    # --- Introspection ---
+    def stats(self, top=5):
+        with self._lock:
+            slowest = sorted(self._per_query.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+            return {
+                "connections": self._created, "idle": self._idle.qsize(), "size": self.size,
+                "checkouts": self.checkouts, "waits": self.waits,
+                "wait_ms": round(self.wait_seconds * 1000, 3),
+                "statements": self.statements,
+                "statement_ms": round(self.statement_seconds * 1000, 3),
+                "slowest": [{"query": " ".join(q.split())[:120], "count": c, "total_ms": round(t * 1000, 3)}
+                            for q, (c, t) in slowest],
+            }
+
+    def close(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
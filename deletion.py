@@ -0,0 +1,44 @@
+"""
+Record Deletion
+Admin deletes (one ID or many) and account deletion for app.py and 1.py.
+Every ID of a request is removed in one transaction on the caller's
+connection; the ON DELETE actions of migration 6 take the dependent rows
+with them (a user's profile and recommendations, a job's recommendations),
+so there is one statement per batch and nothing is left orphaned. Students
+who lose recommendations with a deleted job get their insight snapshots
+rebuilt in the same transaction.
+"""
+
+import insights
+
+TABLES = {"job": "jobs", "student": "student_profile", "user": "users",
+          "course": "courses", "video": "course_videos", "trend": "job_trends"}
+BATCH = 500  # IDs per statement, well under SQLite's bound-parameter limit
+
+
+def parse_ids(value):
+    """Distinct integer IDs from a JSON list or a comma-separated string; raises ValueError"""
+    if isinstance(value, str):
+        value = [v for v in value.split(",") if v.strip()]
+    return sorted({int(v) for v in value or []})
+
+
+def delete_ids(conn, kind, ids):
+    """
+    Delete the ``kind`` rows with these IDs. Returns ``(deleted, user_ids)``:
+    the number of rows removed and the users whose profiles went with them.
+    """
+    table = TABLES[kind]
+    ids = parse_ids(ids)
+    deleted, user_ids, affected = 0, [], set()
+    for start in range(0, len(ids), BATCH):
+        chunk = ids[start:start + BATCH]
+        marks = ",".join("?" * len(chunk))
+        if kind in ("student", "user"):
+            key = "id" if kind == "student" else "user_id"
+            user_ids.extend(r[0] for r in conn.execute(f"SELECT user_id FROM student_profile WHERE {key} IN ({marks})", chunk))
+        elif kind == "job":
+            affected.update(r[0] for r in conn.execute(f"SELECT DISTINCT user_id FROM job_recommendations WHERE job_id IN ({marks})", chunk))
+        deleted += conn.execute(f"DELETE FROM {table} WHERE id IN ({marks})", chunk).rowcount
+    insights.refresh(conn, affected)
+    return deleted, user_ids
@@ -0,0 +1,130 @@
+"""
+Fast KNN Predictor
+Serving-side replacement for the ``knn`` step of the job-type model trained
+by train.py. Per prediction, the fitted KNeighborsClassifier re-validates
+its inputs, recomputes the norms of every training row and runs a chunked
+distance pass. This keeps the (already L2-normalized) TF-IDF training rows
+once as a term -> rows inverted index with their squared norms, so a query
+is one sparse product over the posting lists of its own terms, one
+argpartition and a NumPy vote.
+
+Usage: python fast_knn.py [--sizes 240,10000,100000] [--queries 200]
+       (predict latency and agreement vs the sklearn step on synthetic data)
+"""
+
+import time
+import argparse
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.utils.extmath import row_norms
+from sklearn.pipeline import Pipeline
+
+# Upper bound on the dense distance block scored per chunk of queries
+CHUNK_CELLS = 16_000_000
+
+
+class FastKNN(ClassifierMixin, BaseEstimator):
+    """
+    Same ``predict`` output as a fitted uniform-weight Euclidean
+    KNeighborsClassifier over L2-normalized rows.
+
+    For unit vectors ||q - x||^2 = 2 - 2 q.x, so the nearest rows are the
+    highest cosines. The squared distance is still assembled exactly as
+    sklearn does (float64, -2 q.x + ||q||^2 + ||x||^2, then argpartition):
+    the training set has many duplicate rows, and float32 rounding would
+    change which of the tied rows get picked.
+    """
+
+    def __init__(self, knn):
+        self.knn = knn
+        train = sp.csr_matrix(knn._fit_X, dtype=np.float64)
+        self.n_neighbors = knn.n_neighbors
+        self.classes_ = knn.classes_
+        self.labels = np.asarray(knn._y, dtype=np.int64)
+        self.sq_norms = row_norms(train, squared=True)
+        # terms x rows: row t lists the training rows containing term t
+        self.postings = sp.csr_matrix(train.T)
+        self.n_rows = train.shape[0]
+
+    def fit(self, X, y):
+        raise NotImplementedError("FastKNN serves an already fitted KNeighborsClassifier; retrain with train.py")
+
+    def __sklearn_is_fitted__(self):
+        return True
+
+    def kneighbors(self, X):
+        """Indices of the ``n_neighbors`` nearest training rows per query, nearest first"""
+        q = sp.csr_matrix(X, dtype=np.float64)
+        # Bound the dense queries x training-rows distance block, like sklearn's chunking
+        step = max(1, CHUNK_CELLS // max(1, self.n_rows))
+        return np.vstack([self._kneighbors_chunk(q[i:i + step]) for i in range(0, q.shape[0], step)])
+
+    def _kneighbors_chunk(self, q):
+        if q.shape[0] == 1:
+            # Single profile: gather only the posting lists of its terms, no sparse result to build
+            dots = (self.postings[q.indices].T @ q.data)[None, :]
+        else:
+            dots = (q @ self.postings).toarray()
+        dist = -2 * dots
+        dist += row_norms(q, squared=True)[:, None]
+        dist += self.sq_norms[None, :]
+        np.maximum(dist, 0, out=dist)
+        k = min(self.n_neighbors, self.n_rows)
+        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(dist, nearest, axis=1), axis=1)
+        return np.take_along_axis(nearest, order, axis=1)
+
+    def predict(self, X):
+        nearest = self.kneighbors(X)
+        votes = np.zeros((nearest.shape[0], len(self.classes_)), dtype=np.int64)
+        np.add.at(votes, (np.arange(nearest.shape[0])[:, None], self.labels[nearest]), 1)
+        # argmax keeps the first (lowest) class on a tied vote, as sklearn's mode does
+        return self.classes_[votes.argmax(axis=1)]
+
+
+def accelerate(model):
+    """Copy of a tfidf+knn Pipeline with the knn step swapped for FastKNN (model returned as-is otherwise)"""
+    try:
+        knn = model.named_steps["knn"]
+        if getattr(knn, "weights", "uniform") != "uniform" or getattr(knn, "effective_metric_", "euclidean") != "euclidean":
+            return model
+        return Pipeline([(name, step) for name, step in model.steps[:-1]] + [("knn", FastKNN(knn))])
+    except (AttributeError, KeyError, TypeError):
+        return model
+
+
+def main():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.neighbors import KNeighborsClassifier
+    from bench_scoring import synthetic_jobs
+
+    parser = argparse.ArgumentParser(description="KNN predict latency vs training-set size")
+    parser.add_argument("--sizes", default="240,10000,100000")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    queries = [t.split(" Looking for")[1] for t in synthetic_jobs(args.queries, seed=7)]
+    print(f"{'train rows':>10} | {'sklearn (ms)':>12} | {'fast (ms)':>9} | speedup | agreement")
+    print("-" * 60)
+    for n in [int(s) for s in args.sizes.split(",")]:
+        texts = synthetic_jobs(n)
+        titles = [t.split(" Looking for")[0] for t in texts]
+        bodies = [t.split(" Looking for")[1] for t in texts]
+        model = Pipeline([("tfidf", TfidfVectorizer(max_features=4000)), ("knn", KNeighborsClassifier(n_neighbors=5))])
+        model.fit(bodies, titles)
+        fast = accelerate(model)
+
+        def per_query(m):
+            start = time.perf_counter()
+            out = [m.predict([q])[0] for q in queries]
+            return (time.perf_counter() - start) / len(queries) * 1000, out
+
+        slow_ms, expected = per_query(model)
+        fast_ms, got = per_query(fast)
+        agreement = np.mean([a == b for a, b in zip(expected, got)])
+        print(f"{n:>10} | {slow_ms:>12.3f} | {fast_ms:>9.3f} | {slow_ms / fast_ms:>6.1f}x | {agreement:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Dashboard Page ETags
+Version stamps (such as the student's insight snapshot version, bumped by
+every write to the profile or its recommendations, and ``table_versions``
+counters) give a rendered page a strong ETag, so a repeat visit sending
+``If-None-Match`` gets ``304 Not Modified`` after a version check, without a
+render. The student dashboard is a shell stamped by the snapshot version; its
+tab lists are JSON from dashboard_api.py, which uses the same helpers.
+"""
+
+import hashlib
+from flask import Response, make_response, request
+from job_vectors import file_version
+
+
+class PageETag:
+    """ETags for pages rendered from one template"""
+
+    def __init__(self, template_path, assets=None):
+        self.template_path = template_path
+        self.assets = assets
+
+    def etag(self, *stamps):
+        """Strong ETag of a page rendered from ``stamps``, the template and the asset build it links"""
+        assets = self.assets.version() if self.assets else None
+        return hashlib.sha1(repr((file_version(self.template_path), assets) + stamps).encode()).hexdigest()
+
+
+def _revalidate(response, tag):
+    # Per-user page: browsers may keep it but must ask before reusing it
+    response.set_etag(tag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.vary.add("Cookie")
+    return response
+
+
+def not_modified(tag):
+    """A 304 response if the request's If-None-Match already holds ``tag``, else None"""
+    if tag is None:
+        return None
+    # A compressed page was tagged "<tag>-gzip" / "<tag>-br" by assets.py
+    sent = request.if_none_match
+    if not sent.contains(tag) and not any(t.startswith(tag + "-") for t in sent.as_set()):
+        return None
+    return _revalidate(Response(status=304), tag)
+
+
+def conditional(body, tag):
+    """Response for a rendered page, carrying ``tag`` as its ETag (no validators if ``tag`` is None)"""
+    response = make_response(body)
+    return _revalidate(response, tag) if tag else response
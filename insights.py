@@ -0,0 +1,146 @@
+"""
+ATS Insight Snapshots
+Profile completeness, the ATS insight list, the skill-match confidence (top
+recommendation score) and the top-5 job list of each student, computed once
+when the profile or its recommendations change and kept as one
+``insight_snapshots`` row (migration 8), which the dashboard and the PDF
+report both read.
+
+``refresh`` runs on the writer's connection, in the same transaction as the
+rows it summarises: the recommendation writer and the job fan-out call it for
+the students they touch, job deletes for the students whose recommendations
+went with the job, and save_profile after a profile write. A deleted profile
+takes its snapshot with it (ON DELETE CASCADE).
+"""
+
+import json
+from datetime import datetime
+from typing import NamedTuple
+from records import StudentProfile, columns
+
+TOP_JOBS = 5
+BATCH = 500  # students per query, well under SQLite's bound-parameter limit
+
+# Insight kinds and the mark the dashboard shows in front of them
+MARKS = {"ok": "✓ ", "warn": "⚠ ", "tip": ""}
+
+# ``version`` counts a student's refreshes: the dashboard's cache stamp for the profile and recommendations
+UPSERT_SQL = """INSERT INTO insight_snapshots (user_id, completeness, insights, confidence, top_jobs, rec_count, updated_at)
+                VALUES (?,?,?,?,?,?,?)
+                ON CONFLICT (user_id) DO UPDATE SET completeness = excluded.completeness, insights = excluded.insights,
+                    confidence = excluded.confidence, top_jobs = excluded.top_jobs, rec_count = excluded.rec_count,
+                    updated_at = excluded.updated_at, version = insight_snapshots.version + 1"""
+
+
+class Snapshot(NamedTuple):
+    user_id: int
+    completeness: int       # % of the profile fields filled in
+    insights: list          # [(kind, text)], kind in MARKS
+    confidence: int         # best match score as a %
+    top_jobs: list          # [(title, match %)], best first
+    rec_count: int
+    version: int = 0
+
+
+def compute(profile, rec_count, top_jobs):
+    """Snapshot of a StudentProfile with ``rec_count`` recommendations, ``top_jobs`` [(title, score)] best first"""
+    p = profile
+    fields = [p.full_name, p.register_number, p.college_name, p.batch_year, p.current_semester, p.skills,
+              p.skill_ratings, p.experience, p.interests, p.tech_stack, p.location]
+    filled_fields = sum(1 for f in fields if f and str(f).strip() and str(f) != 'None')
+    completeness = int((filled_fields / len(fields)) * 100)
+
+    insights = []
+    if p.skills and len(str(p.skills).split(',')) >= 3:
+        insights.append(("ok", "Strong skills profile with multiple technologies"))
+    elif p.skills:
+        insights.append(("warn", "Add more skills to improve ATS matching"))
+
+    if p.tech_stack and len(str(p.tech_stack).split(',')) >= 2:
+        insights.append(("ok", "Diverse tech stack increases job opportunities"))
+    elif p.tech_stack:
+        insights.append(("warn", "Expand your tech stack for better matches"))
+
+    if p.experience and len(str(p.experience).split()) >= 10:
+        insights.append(("ok", "Detailed experience description helps ATS parsing"))
+    elif p.experience:
+        insights.append(("warn", "Add more details to your experience section"))
+
+    if rec_count >= 5:
+        insights.append(("ok", "Multiple job matches found - good profile strength"))
+    elif rec_count >= 2:
+        insights.append(("ok", "Some job matches generated"))
+    elif rec_count:
+        insights.append(("warn", "Limited job matches - consider broadening skills"))
+
+    # Default insights if profile is incomplete
+    if not insights:
+        insights = [("tip", "Complete your profile for better recommendations"),
+                    ("tip", "Add skills, experience, and tech stack details"),
+                    ("tip", "Include specific technologies and tools you know")]
+
+    top = [(title, int((score or 0) * 100)) for title, score in top_jobs[:TOP_JOBS]]
+    return Snapshot(p.user_id, completeness, insights, top[0][1] if top else 0, top, rec_count)
+
+
+def refresh(conn, user_ids):
+    """Recompute and store the snapshots of ``user_ids``; returns the number written"""
+    user_ids = sorted(set(user_ids))
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    written = 0
+    for start in range(0, len(user_ids), BATCH):
+        chunk = user_ids[start:start + BATCH]
+        marks = ",".join("?" * len(chunk))
+        profiles = conn.execute(f"SELECT {columns(StudentProfile)} FROM student_profile WHERE user_id IN ({marks})", chunk).fetchall()
+        # Every student's recommendation count and best TOP_JOBS, in one pass over the (user_id, match_score) index
+        ranked = conn.execute(f"""
+            SELECT user_id, title, match_score, n FROM (
+                SELECT r.user_id, j.title, r.match_score, COUNT(*) OVER (PARTITION BY r.user_id) AS n,
+                       ROW_NUMBER() OVER (PARTITION BY r.user_id ORDER BY r.match_score DESC, r.job_id) AS rnk
+                FROM job_recommendations r JOIN jobs j ON j.id = r.job_id
+                WHERE r.user_id IN ({marks}))
+            WHERE rnk <= ? ORDER BY user_id, rnk""", chunk + [TOP_JOBS]).fetchall()
+        counts, top = {}, {}
+        for uid, title, score, n in ranked:
+            counts[uid] = n
+            top.setdefault(uid, []).append((title, score))
+
+        rows = []
+        for profile in map(StudentProfile._make, profiles):
+            s = compute(profile, counts.get(profile.user_id, 0), top.get(profile.user_id, []))
+            rows.append((s.user_id, s.completeness, json.dumps(s.insights), s.confidence,
+                         json.dumps(s.top_jobs), s.rec_count, now))
+        conn.executemany(UPSERT_SQL, rows)
+        written += len(rows)
+    return written
+
+
+def load(fetchall, user_id):
+    """The stored Snapshot of ``user_id``, or None if it has none (no profile, or not built yet)"""
+    rows = fetchall("SELECT user_id, completeness, insights, confidence, top_jobs, rec_count, version "
+                    "FROM insight_snapshots WHERE user_id=?", (user_id,))
+    if not rows:
+        return None
+    uid, completeness, insights, confidence, top_jobs, rec_count, version = rows[0]
+    return Snapshot(uid, completeness, [tuple(i) for i in json.loads(insights)], confidence,
+                    [tuple(j) for j in json.loads(top_jobs)], rec_count, version)
+
+
+def get(pool, user_id):
+    """``load`` through a ConnectionPool, building the snapshot first if the student has none yet"""
+    snapshot = load(pool.fetchall, user_id)
+    if snapshot is None:
+        with pool.connection() as conn:
+            refresh(conn, [user_id])
+        snapshot = load(pool.fetchall, user_id)
+    return snapshot
+
+
+def marked(snapshot):
+    """Insight lines with their ✓ / ⚠ marks, as the dashboard lists them"""
+    return [MARKS[kind] + text for kind, text in snapshot.insights]
+
+
+def plain(snapshot):
+    """Insight lines without marks, for the PDF report (its font has no ✓ / ⚠ glyphs)"""
+    return [text for _, text in snapshot.insights]
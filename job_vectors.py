@@ -0,0 +1,431 @@
+"""
+Job & Profile Vector Stores
+Keep the TF-IDF matrices of the jobs and student_profile tables in memory
+(and on disk) so scoring only transforms the text that actually changed.
+"""
+
+import os
+import time
+import logging
+import threading
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from db import connect
+from scoring import title_matches
+
+logger = logging.getLogger(__name__)
+
+JOB_COLUMNS = "id, title, description, required_skills"
+PROFILE_COLUMNS = "user_id, skills, skill_ratings, interests, tech_stack, experience"
+
+
+def version_ddl(table):
+    """
+    Statements giving ``table`` a version counter that every insert/update/
+    delete bumps, no matter which app (app.py, 1.py, 2.py, populate_data.py)
+    wrote it.
+    """
+    stmts = [
+        "CREATE TABLE IF NOT EXISTS table_versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)",
+        f"INSERT OR IGNORE INTO table_versions (name, version) VALUES ('{table}', 0)",
+    ]
+    for event in ("insert", "update", "delete"):
+        stmts.append(f"""CREATE TRIGGER IF NOT EXISTS {table}_version_{event} AFTER {event.upper()} ON {table}
+       BEGIN UPDATE table_versions SET version = version + 1 WHERE name = '{table}'; END""")
+    return stmts
+
+
+def job_text(job_row):
+    # (id, title, desc, skills)
+    if not job_row: return ""
+    parts = [str(job_row[1]), str(job_row[2]), str(job_row[3])]
+    return " ".join([p for p in parts if p and p != 'None'])
+
+
+def profile_text(row):
+    # (user_id, skills, ratings, ints, stack, exp) -- same fields and order as app.build_student_text
+    parts = [str(p) for p in row[1:]]
+    return " ".join([p for p in parts if p and p != 'None'])
+
+
+def replace_row(matrix, idx, vec):
+    """
+    CSR ``matrix`` with row ``idx`` replaced by the one-row ``vec`` (dropped
+    if None): one splice of the data/indices arrays instead of slicing and
+    re-stacking the whole matrix.
+    """
+    start, end = matrix.indptr[idx], matrix.indptr[idx + 1]
+    if vec is None:
+        data, indices, lengths = [], [], []
+    else:
+        vec = sp.csr_matrix(vec)
+        data, indices, lengths = vec.data, vec.indices, [vec.nnz]
+    data = np.concatenate([matrix.data[:start], data, matrix.data[end:]]).astype(matrix.dtype, copy=False)
+    indices = np.concatenate([matrix.indices[:start], indices, matrix.indices[end:]]).astype(matrix.indices.dtype, copy=False)
+    row_nnz = np.diff(matrix.indptr)
+    row_nnz = np.concatenate([row_nnz[:idx], lengths, row_nnz[idx + 1:]]).astype(matrix.indptr.dtype, copy=False)
+    indptr = np.concatenate([[0], np.cumsum(row_nnz)]).astype(matrix.indptr.dtype, copy=False)
+    return sp.csr_matrix((data, indices, indptr), shape=(len(row_nnz), matrix.shape[1]))
+
+
+def file_version(path):
+    """Cheap identity of a file on disk (mtime + size), None if missing"""
+    try:
+        st = os.stat(path)
+        return f"{int(st.st_mtime)}-{st.st_size}"
+    except OSError:
+        return None
+
+
+class Snapshot:
+    """
+    One version of a store's rows. ``keys``, ``meta`` and ``matrix`` always
+    belong together, so row positions taken from a snapshot stay valid after
+    later writes to the store.
+    """
+
+    def __init__(self, version, keys, meta, matrix):
+        self.version = version
+        self.keys = keys
+        self.meta = meta
+        self.matrix = matrix
+        self._positions = None
+        self._titles = {}
+
+    def position(self, key):
+        """Row of ``key`` in this snapshot, None if it has none"""
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self.keys)}
+        return self._positions.get(int(key))
+
+    def title_positions(self, label):
+        """Row positions whose title contains (or is contained in) ``label``; for JobVectorStore snapshots"""
+        if label not in self._titles:
+            self._titles[label] = np.flatnonzero(title_matches(label, self.meta))
+        return self._titles[label]
+
+
+class VectorStore:
+    """
+    Transformed rows of one table, keyed by that table's version.
+
+    Rows are aligned with ``keys`` (plus one ``meta`` entry per row that
+    subclasses derive from the row). Writers call ``upsert``/``remove`` after
+    their write so only the touched row is re-vectorized; each call accounts
+    for one version step. A write the store did not see (another process,
+    populate_data.py) leaves ``version`` behind the table's counter, and
+    ``refresh_in_background`` rebuilds the whole store on a daemon thread
+    while requests keep using the current rows.
+
+    Deltas are persisted lazily: the disk snapshot is rewritten at most once
+    per ``save_delay`` seconds, and after every full rebuild.
+    """
+
+    table = None
+    key_column = None
+    columns = None
+
+    def __init__(self, vectorizer, db_path, cache_path, model_path=None, text_fn=None,
+                 save_delay=30.0, rebuild_delay=1.0):
+        self.vectorizer = vectorizer
+        self.db_path = db_path
+        self.cache_path = cache_path
+        self.model_version = file_version(model_path) if model_path else None
+        self.text_fn = text_fn or self.text
+        self.save_delay = save_delay
+        self.rebuild_delay = rebuild_delay
+        self.version = None
+        self.keys = []
+        self.meta = []
+        self.matrix = None
+        self._index = {}
+        self._snapshot = None
+        self._touched = None  # keys written while a rebuild runs, re-applied once it is swapped in
+        self._save_timer = None
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def text(self, row):
+        raise NotImplementedError
+
+    def row_meta(self, rows, texts):
+        return [None] * len(rows)
+
+    # --- DB helpers ---
+    def _connect(self):
+        return connect(self.db_path)
+
+    def ensure_schema(self):
+        # Migration 11 creates the same counter; this covers a database no app has migrated yet
+        with self._connect() as conn:
+            for stmt in version_ddl(self.table):
+                conn.execute(stmt)
+            conn.commit()
+
+    def db_version(self):
+        with self._connect() as conn:
+            row = conn.execute("SELECT version FROM table_versions WHERE name=?", (self.table,)).fetchone()
+            return row[0] if row else 0
+
+    def _fetch(self, key=None):
+        with self._connect() as conn:
+            if key is None:
+                # Counter and rows from one read transaction, so they describe the same table state
+                conn.execute("BEGIN")
+                row = conn.execute("SELECT version FROM table_versions WHERE name=?", (self.table,)).fetchone()
+                rows = conn.execute(f"SELECT {self.columns} FROM {self.table} ORDER BY {self.key_column}").fetchall()
+                return (row[0] if row else 0), rows
+            return conn.execute(f"SELECT {self.columns} FROM {self.table} WHERE {self.key_column}=?", (key,)).fetchall()
+
+    # --- Lifecycle ---
+    def load(self):
+        """Attach to the DB, then use the disk snapshot if it is still current"""
+        self.ensure_schema()
+        with self._lock:
+            version = self.db_version()
+            if self._load_snapshot(version):
+                logger.info(f"{self.table} vectors loaded from cache (version {version}, {len(self.keys)} rows)")
+                return
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-vectorize every row; the current rows stay readable until the new ones are swapped in"""
+        with self._build_lock:
+            with self._lock:
+                self._touched = []
+            try:
+                version, rows = self._fetch()
+                texts = [self.text_fn(r) for r in rows]
+                meta = self.row_meta(rows, texts)
+                if rows:
+                    matrix = sp.csr_matrix(self.vectorizer.transform(texts))
+                else:
+                    matrix = sp.csr_matrix((0, len(self.vectorizer.vocabulary_)))
+                with self._lock:
+                    self.keys = [r[0] for r in rows]
+                    self.meta = meta
+                    self._index = {k: i for i, k in enumerate(self.keys)}
+                    self.matrix = matrix
+                    # Writes that landed during the build: re-read their rows, count their versions
+                    for key in set(self._touched):
+                        self._apply(key)
+                    self.version = version + len(self._touched)
+            finally:
+                with self._lock:
+                    self._touched = None
+        self._save_snapshot()
+        logger.info(f"{self.table} vectors rebuilt (version {version}, {len(rows)} rows)")
+
+    def ensure_fresh(self):
+        """Rebuild inline only before the first load; later gaps are closed in the background"""
+        if self.version is None:
+            self.rebuild()
+        elif self.db_version() != self.version:
+            self.refresh_in_background()
+
+    def refresh_in_background(self):
+        """
+        Rebuild on a daemon thread if the store is still behind the table
+        after ``rebuild_delay`` seconds (two concurrent writers briefly look
+        like a gap). A call while a rebuild is pending is a no-op.
+        """
+        if self._refresh_lock.acquire(blocking=False):
+            threading.Thread(target=self._refresh, name=f"{self.table}-vectors-rebuild", daemon=True).start()
+
+    def _refresh(self):
+        try:
+            time.sleep(self.rebuild_delay)
+            if self.db_version() != self.version:
+                self.rebuild()
+        except Exception as e:
+            logger.error(f"{self.table} vector rebuild failed: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    # --- Row deltas ---
+    def upsert(self, key):
+        """Re-vectorize a single row after it was inserted or edited"""
+        self._write(int(key))
+
+    def remove(self, key):
+        """Drop a deleted row"""
+        self._write(int(key))
+
+    def _write(self, key):
+        with self._lock:
+            if self.version is None:
+                return
+            if not self._apply(key):
+                return  # neither stored nor in the table: the caller's write changed nothing here
+            self.version += 1
+            if self._touched is not None:
+                self._touched.append(key)
+        if self.db_version() != self.version:
+            self.refresh_in_background()
+        self._schedule_save()
+
+    def _apply(self, key):
+        """Make ``key``'s row match the table (re-vectorize or drop it); False if there was nothing to do"""
+        rows = self._fetch(key)
+        idx = self._index.get(key)
+        if rows:
+            texts = [self.text_fn(rows[0])]
+            vec = sp.csr_matrix(self.vectorizer.transform(texts))
+            meta = self.row_meta(rows, texts)[0]
+            if idx is None:
+                self.matrix = sp.vstack([self.matrix, vec], format="csr")
+                self._index[key] = len(self.keys)
+                self.keys.append(key)
+                self.meta.append(meta)
+            else:
+                self.matrix = replace_row(self.matrix, idx, vec)
+                self.meta[idx] = meta
+        elif idx is not None:
+            self.matrix = replace_row(self.matrix, idx, None)
+            del self.keys[idx]
+            del self.meta[idx]
+            self._index = {k: i for i, k in enumerate(self.keys)}
+        else:
+            return False
+        return True
+
+
+    # --- Lookup ---
+    def snapshot(self):
+        """The current rows as a Snapshot; every write replaces ``matrix``, which retires the old one"""
+        with self._lock:
+            if self._snapshot is None or self._snapshot.matrix is not self.matrix:
+                self._snapshot = Snapshot(self.version, tuple(self.keys), tuple(self.meta), self.matrix)
+            return self._snapshot
+
+    def position(self, key):
+        return self._index.get(int(key))
+
+    def vectors_for(self, rows):
+        """
+        Matrix aligned with ``rows``. Rows the store does not know yet
+        (e.g. written by another process since the last sync) are transformed
+        on the fly instead of failing the request.
+        """
+        with self._lock:
+            positions = [self._index.get(r[0]) for r in rows]
+            missing = [i for i, p in enumerate(positions) if p is None]
+            if not missing:
+                return self.matrix[positions]
+            extra = sp.csr_matrix(self.vectorizer.transform([self.text_fn(rows[i]) for i in missing]))
+            stacked = sp.vstack([self.matrix, extra], format="csr")
+            base = self.matrix.shape[0]
+            for n, i in enumerate(missing):
+                positions[i] = base + n
+            return stacked[positions]
+
+    # --- Persistence ---
+    def _load_snapshot(self, version):
+        if not os.path.exists(self.cache_path):
+            return False
+        try:
+            snap = joblib.load(self.cache_path)
+        except Exception as e:
+            logger.error(f"{self.table} vector cache unreadable: {e}")
+            return False
+        if snap.get("version") != version or snap.get("model_version") != self.model_version or "meta" not in snap:
+            return False
+        self.version = version
+        self.keys = list(snap["keys"])
+        self.meta = list(snap["meta"])
+        self._index = {k: i for i, k in enumerate(self.keys)}
+        self.matrix = snap["matrix"]
+        return True
+
+    def _schedule_save(self):
+        """Persist the deltas of the next ``save_delay`` seconds in one write"""
+        with self._lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write the current rows to the disk snapshot now"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._save_snapshot()
+
+    def _save_snapshot(self):
+        snap = self.snapshot()
+        tmp_path = f"{self.cache_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            joblib.dump({"version": snap.version, "model_version": self.model_version,
+                         "keys": list(snap.keys), "meta": list(snap.meta), "matrix": snap.matrix}, tmp_path)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.error(f"Could not persist {self.table} vectors: {e}")
+
+class JobVectorStore(VectorStore):
+    """Job matrix plus lower-cased titles for the predicted-label title match"""
+
+    table = "jobs"
+    key_column = "id"
+    columns = JOB_COLUMNS
+
+    def __init__(self, vectorizer, db_path, cache_path, model_path=None, text_fn=job_text, **kwargs):
+        super().__init__(vectorizer, db_path, cache_path, model_path, text_fn, **kwargs)
+
+    def text(self, row):
+        return job_text(row)
+
+    def row_meta(self, rows, texts):
+        return [(r[1] or "").lower() for r in rows]
+
+    @property
+    def job_ids(self):
+        return self.keys
+
+    @property
+    def titles(self):
+        return self.meta
+
+    def title_positions(self, label):
+        """Row positions whose title contains (or is contained in) ``label``, cached per version"""
+        return self.snapshot().title_positions(label)
+
+
+class ProfileVectorStore(VectorStore):
+    """
+    Every student's profile vector plus the model's predicted job label,
+    so a new job can be scored against all students in one product.
+    """
+
+    table = "student_profile"
+    key_column = "user_id"
+    columns = PROFILE_COLUMNS
+
+    def __init__(self, model, db_path, cache_path, model_path=None, **kwargs):
+        self.model = model
+        super().__init__(model.named_steps["tfidf"], db_path, cache_path, model_path, profile_text, **kwargs)
+
+    def text(self, row):
+        return profile_text(row)
+
+    def row_meta(self, rows, texts):
+        if not texts:
+            return []
+        try:
+            return [str(l).strip().lower() for l in self.model.predict(texts)]
+        except Exception as e:
+            logger.error(f"Profile label prediction failed: {e}")
+            return [None] * len(texts)
+
+    @property
+    def user_ids(self):
+        return self.keys
+
+    @property
+    def labels(self):
+        return self.meta
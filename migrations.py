@@ -0,0 +1,241 @@
+"""
+Schema Migrations
+Versioned schema for data.db shared by app.py and 1.py. Each migration runs
+once, in its own transaction, and is recorded in ``schema_migrations`` so a
+database created by any app version is brought to the same schema.
+
+Usage: python migrations.py [--db data.db]   (apply pending migrations, print the version)
+"""
+
+import os
+import json
+import logging
+import argparse
+from datetime import datetime
+from db import connect
+from job_vectors import version_ddl
+from search import fts_ddl
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(APP_DIR, "data.db")
+
+
+def add_column(table, column, decl):
+    """Step adding ``column`` unless it already exists (older files gained some columns by hand)"""
+    def step(conn):
+        if column not in [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+    return step
+
+
+def rebuild_table(table, create_sql):
+    """
+    Step recreating ``table`` from ``create_sql`` (SQLite cannot ALTER a
+    constraint). Rows, indexes, triggers and any columns the new definition
+    lacks are carried over.
+    """
+    def step(conn):
+        extras = [r[0] for r in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL", (table,))]
+        old_columns = [(r[1], r[2]) for r in conn.execute(f"PRAGMA table_info({table})")]
+        conn.execute(create_sql.replace(f"CREATE TABLE {table} ", f"CREATE TABLE {table}_new ", 1))
+        new_columns = {r[1] for r in conn.execute(f"PRAGMA table_info({table}_new)")}
+        for name, decl in old_columns:
+            if name not in new_columns:
+                conn.execute(f"ALTER TABLE {table}_new ADD COLUMN {name} {decl}")
+        names = ", ".join(name for name, _ in old_columns)
+        conn.execute(f"INSERT INTO {table}_new ({names}) SELECT {names} FROM {table}")
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        for sql in extras:
+            conn.execute(sql)
+    return step
+
+
+def backfill_insight_snapshots(conn):
+    """
+    Every student's insight snapshot, computed as insights.py did when
+    migration 9 shipped. Kept here, not imported, so later changes to the
+    dashboard rules never change what an old database is migrated to.
+    """
+    profiles = conn.execute("""SELECT user_id, full_name, register_number, college_name, batch_year, current_semester,
+                                      skills, skill_ratings, experience, interests, tech_stack, location
+                               FROM student_profile""").fetchall()
+    ranked = conn.execute("""
+        SELECT user_id, title, match_score, n FROM (
+            SELECT r.user_id, j.title, r.match_score, COUNT(*) OVER (PARTITION BY r.user_id) AS n,
+                   ROW_NUMBER() OVER (PARTITION BY r.user_id ORDER BY r.match_score DESC, r.job_id) AS rnk
+            FROM job_recommendations r JOIN jobs j ON j.id = r.job_id)
+        WHERE rnk <= 5 ORDER BY user_id, rnk""").fetchall()
+    counts, top = {}, {}
+    for uid, title, score, n in ranked:
+        counts[uid] = n
+        top.setdefault(uid, []).append((title, int((score or 0) * 100)))
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    rows = []
+    for uid, *fields in profiles:
+        skills, experience, tech_stack = fields[5], fields[7], fields[9]
+        rec_count = counts.get(uid, 0)
+        completeness = int((sum(1 for f in fields if f and str(f).strip() and str(f) != 'None') / len(fields)) * 100)
+        notes = []
+        if skills and len(str(skills).split(',')) >= 3:
+            notes.append(("ok", "Strong skills profile with multiple technologies"))
+        elif skills:
+            notes.append(("warn", "Add more skills to improve ATS matching"))
+        if tech_stack and len(str(tech_stack).split(',')) >= 2:
+            notes.append(("ok", "Diverse tech stack increases job opportunities"))
+        elif tech_stack:
+            notes.append(("warn", "Expand your tech stack for better matches"))
+        if experience and len(str(experience).split()) >= 10:
+            notes.append(("ok", "Detailed experience description helps ATS parsing"))
+        elif experience:
+            notes.append(("warn", "Add more details to your experience section"))
+        if rec_count >= 5:
+            notes.append(("ok", "Multiple job matches found - good profile strength"))
+        elif rec_count >= 2:
+            notes.append(("ok", "Some job matches generated"))
+        elif rec_count:
+            notes.append(("warn", "Limited job matches - consider broadening skills"))
+        if not notes:
+            notes = [("tip", "Complete your profile for better recommendations"),
+                     ("tip", "Add skills, experience, and tech stack details"),
+                     ("tip", "Include specific technologies and tools you know")]
+        top_jobs = top.get(uid, [])
+        rows.append((uid, completeness, json.dumps(notes), top_jobs[0][1] if top_jobs else 0,
+                     json.dumps(top_jobs), rec_count, now))
+    conn.executemany("""INSERT INTO insight_snapshots (user_id, completeness, insights, confidence, top_jobs, rec_count, updated_at)
+                        VALUES (?,?,?,?,?,?,?)
+                        ON CONFLICT (user_id) DO UPDATE SET completeness = excluded.completeness, insights = excluded.insights,
+                            confidence = excluded.confidence, top_jobs = excluded.top_jobs, rec_count = excluded.rec_count,
+                            updated_at = excluded.updated_at, version = insight_snapshots.version + 1""", rows)
+
+
+# (version, name, steps) -- steps are SQL strings or callables taking the connection.
+# Append only: never edit a migration that has shipped.
+MIGRATIONS = [
+    (1, "baseline tables", [
+        "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, email TEXT UNIQUE NOT NULL, password TEXT NOT NULL, role TEXT DEFAULT 'student', created_at TEXT)",
+        "CREATE TABLE IF NOT EXISTS student_profile (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER UNIQUE NOT NULL, full_name TEXT, register_number TEXT, college_name TEXT, batch_year TEXT, current_semester TEXT, skills TEXT, skill_ratings TEXT, experience TEXT, interests TEXT, tech_stack TEXT, location TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id))",
+        "CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, required_skills TEXT, posted_by TEXT, application_link TEXT, created_at TEXT)",
+        "CREATE TABLE IF NOT EXISTS job_recommendations (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, match_score REAL, match_reason TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id), FOREIGN KEY (job_id) REFERENCES jobs(id))",
+        "CREATE TABLE IF NOT EXISTS courses (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, category TEXT, course_link TEXT, added_by TEXT, created_at TEXT)",
+        "CREATE TABLE IF NOT EXISTS course_videos (id INTEGER PRIMARY KEY AUTOINCREMENT, course_id INTEGER, video_title TEXT, video_url TEXT, category TEXT, FOREIGN KEY (course_id) REFERENCES courses(id))",
+        "CREATE TABLE IF NOT EXISTS job_trends (id INTEGER PRIMARY KEY AUTOINCREMENT, job_role TEXT, industry TEXT, trending_skills TEXT, year TEXT, added_by TEXT, created_at TEXT)",
+    ]),
+    (2, "columns missing from older databases", [
+        add_column("jobs", "application_link", "TEXT"),
+        add_column("courses", "course_link", "TEXT"),
+    ]),
+    (3, "indexes for the dashboard, admin and fan-out queries", [
+        # Dashboard: WHERE user_id = ? ORDER BY match_score DESC; fan-out ranks by (match_score DESC, job_id)
+        "CREATE INDEX IF NOT EXISTS idx_job_recommendations_user_score ON job_recommendations (user_id, match_score DESC, job_id)",
+        # Deleting a job and its recommendations
+        "CREATE INDEX IF NOT EXISTS idx_job_recommendations_job ON job_recommendations (job_id)",
+        # Videos of a course (admin join, course deletes)
+        "CREATE INDEX IF NOT EXISTS idx_course_videos_course ON course_videos (course_id)",
+        # Dashboard category filter: SELECT DISTINCT category FROM courses ORDER BY category
+        "CREATE INDEX IF NOT EXISTS idx_courses_category ON courses (category)",
+    ]),
+    (4, "background task queue", [
+        "CREATE TABLE IF NOT EXISTS tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, key TEXT NOT NULL, payload TEXT, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, run_after REAL NOT NULL, last_error TEXT, created_at REAL, updated_at REAL)",
+        # At most one waiting task per (kind, key): task_queue.enqueue dedupes on it
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_queued_key ON tasks (kind, key) WHERE status = 'queued'",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_run_after ON tasks (status, run_after)",
+    ]),
+    (5, "version counters for the cached catalogue tables",
+        version_ddl("courses") + version_ddl("course_videos") + version_ddl("job_trends")),
+    (6, "foreign keys with ON DELETE actions (db.connect turns enforcement on)", [
+        # Deleting a user removes the profile and recommendations; deleting a job removes its recommendations.
+        # The v3 indexes (user_id first, job_id, course_id) serve the cascades' child lookups.
+        rebuild_table("student_profile", "CREATE TABLE student_profile (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER UNIQUE NOT NULL, full_name TEXT, register_number TEXT, college_name TEXT, batch_year TEXT, current_semester TEXT, skills TEXT, skill_ratings TEXT, experience TEXT, interests TEXT, tech_stack TEXT, location TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE)"),
+        rebuild_table("job_recommendations", "CREATE TABLE job_recommendations (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, job_id INTEGER NOT NULL, match_score REAL, match_reason TEXT, created_at TEXT, FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE, FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE)"),
+        # A deleted course's videos stay listed, just no longer linked to it
+        rebuild_table("course_videos", "CREATE TABLE course_videos (id INTEGER PRIMARY KEY AUTOINCREMENT, course_id INTEGER, video_title TEXT, video_url TEXT, category TEXT, FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE SET NULL)"),
+    ]),
+    (7, "FTS5 full-text indexes over jobs and courses", fts_ddl("jobs") + fts_ddl("courses")),
+    (8, "per-student ATS insight snapshots", [
+        "CREATE TABLE IF NOT EXISTS insight_snapshots (user_id INTEGER PRIMARY KEY, completeness INTEGER NOT NULL, insights TEXT NOT NULL, confidence INTEGER NOT NULL, top_jobs TEXT NOT NULL, rec_count INTEGER NOT NULL, updated_at TEXT, FOREIGN KEY (user_id) REFERENCES student_profile(user_id) ON DELETE CASCADE)",
+    ]),
+    (9, "insight snapshot versions (dashboard cache stamps)", [
+        add_column("insight_snapshots", "version", "INTEGER NOT NULL DEFAULT 0"),
+        # Build every student's snapshot, bumping the version of any built at v8
+        backfill_insight_snapshots,
+    ]),
+    (10, "canonical skill dictionary and skill link tables", [
+        # Created by skills.SkillDictionary.load before this migration existed, hence IF NOT EXISTS
+        "CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS skill_aliases (alias TEXT PRIMARY KEY, skill_id INTEGER NOT NULL, FOREIGN KEY (skill_id) REFERENCES skills(id))",
+        "CREATE TABLE IF NOT EXISTS job_skills (job_id INTEGER NOT NULL, skill_id INTEGER NOT NULL, position INTEGER NOT NULL, PRIMARY KEY (job_id, skill_id))",
+        "CREATE TABLE IF NOT EXISTS profile_skills (user_id INTEGER NOT NULL, skill_id INTEGER NOT NULL, rating INTEGER, position INTEGER NOT NULL, PRIMARY KEY (user_id, skill_id))",
+        "CREATE TABLE IF NOT EXISTS course_skills (course_id INTEGER NOT NULL, skill_id INTEGER NOT NULL, PRIMARY KEY (course_id, skill_id))",
+        # Any writer that deletes or edits the source row drops its links; SkillDictionary.index_* / backfill re-create them
+        "CREATE TRIGGER IF NOT EXISTS jobs_skills_delete AFTER DELETE ON jobs BEGIN DELETE FROM job_skills WHERE job_id = OLD.id; END",
+        "CREATE TRIGGER IF NOT EXISTS jobs_skills_update AFTER UPDATE OF required_skills ON jobs BEGIN DELETE FROM job_skills WHERE job_id = OLD.id; END",
+        "CREATE TRIGGER IF NOT EXISTS profile_skills_delete AFTER DELETE ON student_profile BEGIN DELETE FROM profile_skills WHERE user_id = OLD.user_id; END",
+        "CREATE TRIGGER IF NOT EXISTS profile_skills_update AFTER UPDATE OF skills, skill_ratings ON student_profile BEGIN DELETE FROM profile_skills WHERE user_id = OLD.user_id; END",
+        "CREATE TRIGGER IF NOT EXISTS courses_skills_delete AFTER DELETE ON courses BEGIN DELETE FROM course_skills WHERE course_id = OLD.id; END",
+        "CREATE TRIGGER IF NOT EXISTS courses_skills_update AFTER UPDATE OF title, category ON courses BEGIN DELETE FROM course_skills WHERE course_id = OLD.id; END",
+    ]),
+    # Until now created only when a vector store loaded, so without a model the jobs stamp never moved
+    (11, "version counters for jobs and student profiles", version_ddl("jobs") + version_ddl("student_profile")),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER PRIMARY KEY, name TEXT, applied_at TEXT)")
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations").fetchone()[0]
+
+
+def migrate(db_path=DB_PATH, target=None):
+    """Apply pending migrations up to ``target`` (default: latest); returns the versions applied"""
+    target = LATEST_VERSION if target is None else target
+    applied = []
+    conn = connect(db_path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA foreign_keys = OFF")  # table rebuilds must not cascade
+    try:
+        for version, name, steps in MIGRATIONS:
+            if version > target:
+                break
+            # IMMEDIATE takes the write lock first, so two app processes never apply the same step
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if current_version(conn) >= version:
+                    conn.execute("COMMIT")
+                    continue
+                for step in steps:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        conn.execute(step)
+                conn.execute("INSERT INTO schema_migrations (version, name, applied_at) VALUES (?,?,?)",
+                             (version, name, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            applied.append(version)
+            logger.info(f"Applied migration {version}: {name}")
+    finally:
+        conn.close()
+    return applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply pending data.db schema migrations")
+    parser.add_argument("--db", default=DB_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    applied = migrate(args.db)
+    with connect(args.db) as conn:
+        version = current_version(conn)
+    print(f"Applied: {applied or 'nothing'}  Schema version: {version}")
+
+
+if __name__ == "__main__":
+    main()
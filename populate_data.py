@@ -2,6 +2,8 @@ import sqlite3
 import csv
 import os
 from datetime import datetime
+from skills import SkillDictionary
+from migrations import migrate
 
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(APP_DIR, "data.db")
@@ -41,9 +43,9 @@ def populate_content():
     conn = sqlite3.connect(DB_PATH)
     cur = conn.cursor()
     
-    # Ensure correct schema for courses if it's messed up
-    cur.execute("DROP TABLE IF EXISTS courses")
-    cur.execute("CREATE TABLE courses (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, category TEXT, course_link TEXT, added_by TEXT, created_at TEXT)")
+    # The schema (course_link column, indexes, triggers) comes from migrations.py; only the rows are replaced
+    cur.execute("DELETE FROM courses")
+    cur.execute("DELETE FROM sqlite_sequence WHERE name='courses'")
 
     # Sample Courses with categories based on jobs.csv skills
     courses = [
@@ -172,5 +174,10 @@ def populate_content():
     print("Courses and Videos populated")
 
 if __name__ == "__main__":
+    migrate(DB_PATH)
     populate_jobs()
     populate_content()
+    # Normalize the new jobs' and courses' skills into skill IDs
+    skills = SkillDictionary(DB_PATH)
+    skills.load()
+    skills.backfill(full=True)
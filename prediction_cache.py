@@ -0,0 +1,134 @@
+"""
+Prediction Cache
+Memoizes ``model.predict`` for single profile texts. The KNN model compares
+every query against its whole training matrix, so the same profile should
+only be classified once per model file.
+
+Keys are a hash of the normalized text plus the model file's version, so a
+retrained model never serves stale labels. Entries live in a bounded LRU in
+memory and, optionally, in a small SQLite file shared by worker processes.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from job_vectors import file_version
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """
+    ``predict(text)`` returns ``str(model.predict([text])[0])``.
+    ``stats()`` reports hits, misses and disk hits since start-up.
+    """
+
+    def __init__(self, model, model_path=None, max_size=1024, disk_path=None, disk_max_rows=100000):
+        self.model = model
+        self.model_version = (file_version(model_path) if model_path else None) or "unversioned"
+        self.max_size = max_size
+        self.disk_path = disk_path
+        self.disk_max_rows = disk_max_rows
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+
+        # Whitespace runs never change the TF-IDF tokens; case only matters if the vectorizer keeps it
+        steps = getattr(model, "named_steps", {}) or {}
+        vectorizer = steps.get("tfidf")
+        self._lowercase = bool(getattr(vectorizer, "lowercase", False))
+        if disk_path:
+            self._init_disk()
+
+    def key(self, text):
+        text = " ".join(str(text).split())
+        if self._lowercase:
+            text = text.lower()
+        return hashlib.sha1(f"{self.model_version}\x00{text}".encode("utf-8")).hexdigest()
+
+    def predict(self, text):
+        key = self.key(text)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        label = self._disk_get(key)
+        if label is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            label = str(self.model.predict([text])[0])
+            with self._lock:
+                self.misses += 1
+            self._disk_put(key, label)
+
+        with self._lock:
+            self._entries[key] = label
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return label
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "size": len(self._entries), "max_size": self.max_size,
+                    "hit_rate": round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0}
+
+    # --- Shared on-disk tier ---
+    def _connect(self):
+        return sqlite3.connect(self.disk_path, timeout=5)
+
+    def _init_disk(self):
+        try:
+            os.makedirs(os.path.dirname(self.disk_path) or ".", exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS predictions (key TEXT PRIMARY KEY, label TEXT NOT NULL, model_version TEXT, used_at REAL)")
+                # Labels of other model versions can never be hit again
+                conn.execute("DELETE FROM predictions WHERE model_version != ?", (self.model_version,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Prediction cache disk tier disabled: {e}")
+            self.disk_path = None
+
+    def _disk_get(self, key):
+        if not self.disk_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT label FROM predictions WHERE key=?", (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.error(f"Prediction cache read failed: {e}")
+            return None
+
+    def _disk_put(self, key, label):
+        if not self.disk_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO predictions (key, label, model_version, used_at) VALUES (?,?,?,?)",
+                             (key, label, self.model_version, time.time()))
+                self._disk_writes += 1
+                # Trim the oldest rows now and then rather than on every write
+                if self._disk_writes % 1000 == 0:
+                    conn.execute("""DELETE FROM predictions WHERE key IN (
+                                    SELECT key FROM predictions ORDER BY used_at DESC LIMIT -1 OFFSET ?)""",
+                                 (self.disk_max_rows,))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Prediction cache write failed: {e}")
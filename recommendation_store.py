@@ -0,0 +1,47 @@
+"""
+Recommendation Writer
+Replaces students' job_recommendations sets in a single transaction: one
+set-based DELETE and one executemany INSERT per call, instead of a commit
+per row. The students' insight snapshots are rebuilt in the same commit.
+Functions take an open connection (a pooled one from db.py or a plain
+sqlite3 connection) and commit or roll back as a whole.
+"""
+
+from datetime import datetime
+import insights
+
+INSERT_SQL = "INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason, created_at) VALUES (?,?,?,?,?)"
+
+# Stay well below SQLite's bound-parameter limit in the DELETE ... IN (...)
+DELETE_BATCH = 500
+
+
+def recommendation_rows(user_id, results, created_at=None):
+    """Insert tuples for a list of ``{"job_id", "score", "reason"}`` results"""
+    created_at = created_at or datetime.now().strftime("%Y-%m-%d")
+    return [(user_id, r["job_id"], r["score"], r["reason"], created_at) for r in results]
+
+
+def replace_rows(conn, user_ids, rows):
+    """Delete the sets of ``user_ids`` and insert ``rows`` atomically; returns rows written"""
+    user_ids = list(user_ids)
+    with conn:
+        for i in range(0, len(user_ids), DELETE_BATCH):
+            batch = user_ids[i:i + DELETE_BATCH]
+            conn.execute(f"DELETE FROM job_recommendations WHERE user_id IN ({','.join('?' * len(batch))})", batch)
+        conn.executemany(INSERT_SQL, rows)
+        insights.refresh(conn, user_ids)
+    return len(rows)
+
+
+def replace_user(conn, user_id, results, created_at=None):
+    """Replace one student's recommendations with ``results``"""
+    return replace_rows(conn, [user_id], recommendation_rows(user_id, results, created_at))
+
+
+def replace_users(conn, results_by_user, created_at=None):
+    """Replace the recommendations of many students ({user_id: results}) in one commit"""
+    rows = []
+    for user_id, results in results_by_user.items():
+        rows.extend(recommendation_rows(user_id, results, created_at))
+    return replace_rows(conn, results_by_user.keys(), rows)
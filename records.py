@@ -0,0 +1,197 @@
+"""
+Row Records
+Named, column-projected rows for the queries on the recommendation and
+dashboard paths, replacing ``SELECT *`` tuples read through magic indexes.
+
+Records are NamedTuples: no per-row ``__dict__`` (``__slots__ = ()``), built
+straight from sqlite3 rows, and still indexable, so templates and helpers
+that take plain tuples keep working while callers move to attribute access.
+Each query selects only the columns its record declares.
+
+Usage: python records.py [--rows 100000]
+       (memory and fetch latency of SELECT * tuples vs projected Job records)
+"""
+
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import tracemalloc
+from typing import NamedTuple, Optional
+
+
+class StudentProfile(NamedTuple):
+    """Every profile column: the dashboard's profile form and completeness score show them all"""
+    id: int
+    user_id: int
+    full_name: Optional[str]
+    register_number: Optional[str]
+    college_name: Optional[str]
+    batch_year: Optional[str]
+    current_semester: Optional[str]
+    skills: Optional[str]
+    skill_ratings: Optional[str]
+    experience: Optional[str]
+    interests: Optional[str]
+    tech_stack: Optional[str]
+    location: Optional[str]
+    created_at: Optional[str]
+
+
+class ScoringProfile(NamedTuple):
+    """The profile columns rescoring reads (same order as job_vectors.PROFILE_COLUMNS)"""
+    user_id: int
+    skills: Optional[str]
+    skill_ratings: Optional[str]
+    interests: Optional[str]
+    tech_stack: Optional[str]
+    experience: Optional[str]
+
+
+class ReportProfile(NamedTuple):
+    """The profile columns the career report prints"""
+    full_name: Optional[str]
+    register_number: Optional[str]
+    college_name: Optional[str]
+    batch_year: Optional[str]
+    current_semester: Optional[str]
+    skills: Optional[str]
+    tech_stack: Optional[str]
+    interests: Optional[str]
+    location: Optional[str]
+
+
+class Job(NamedTuple):
+    """The job columns scoring reads (same order as job_vectors.JOB_COLUMNS)"""
+    id: int
+    title: Optional[str]
+    description: Optional[str]
+    required_skills: Optional[str]
+
+
+class Recommendation(NamedTuple):
+    job_id: int
+    title: Optional[str]
+    description: Optional[str]
+    required_skills: Optional[str]
+    posted_by: Optional[str]
+    application_link: Optional[str]
+    match_score: float
+    match_reason: Optional[str]
+
+
+class Course(NamedTuple):
+    id: int
+    title: Optional[str]
+    description: Optional[str]
+    category: Optional[str]
+    course_link: Optional[str]
+
+
+class Trend(NamedTuple):
+    id: int
+    job_role: Optional[str]
+    industry: Optional[str]
+    trending_skills: Optional[str]
+    year: Optional[str]
+
+
+class Video(NamedTuple):
+    id: int
+    course_id: Optional[int]
+    video_title: Optional[str]
+    video_url: Optional[str]
+    category: Optional[str]
+    course_title: Optional[str]
+
+
+def columns(record, alias=None):
+    """Comma-joined column list of ``record``, optionally qualified with a table alias"""
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(prefix + f for f in record._fields)
+
+
+JOBS_QUERY = f"SELECT {columns(Job)} FROM jobs"
+RECOMMENDATIONS_QUERY = """SELECT r.job_id, j.title, j.description, j.required_skills, j.posted_by, j.application_link, r.match_score, r.match_reason
+                           FROM job_recommendations r JOIN jobs j ON r.job_id = j.id
+                           WHERE r.user_id = ? ORDER BY r.match_score DESC"""
+COURSES_QUERY = f"SELECT {columns(Course)} FROM courses ORDER BY id DESC"
+TRENDS_QUERY = f"SELECT {columns(Trend)} FROM job_trends ORDER BY id DESC"
+VIDEOS_QUERY = """SELECT v.id, v.course_id, v.video_title, v.video_url, v.category, c.title
+                  FROM course_videos v LEFT JOIN courses c ON v.course_id = c.id ORDER BY v.id DESC"""
+
+
+def as_records(record, rows):
+    return list(map(record._make, rows))
+
+
+def load_profile(fetchall, user_id, record=StudentProfile):
+    """``user_id``'s profile as ``record``, selecting only that record's columns"""
+    rows = fetchall(f"SELECT {columns(record)} FROM student_profile WHERE user_id=?", (user_id,))
+    return record._make(rows[0]) if rows else None
+
+
+def load_jobs(fetchall):
+    return as_records(Job, fetchall(JOBS_QUERY))
+
+
+def load_recommendations(fetchall, user_id):
+    return as_records(Recommendation, fetchall(RECOMMENDATIONS_QUERY, (user_id,)))
+
+
+# --- Benchmark ---
+def _synthetic_db(path, n, seed=42):
+    rnd = random.Random(seed)
+    words = ["python", "sql", "docker", "react", "cloud", "data", "pipeline", "api", "testing", "linux",
+             "design", "team", "scalable", "services", "analytics", "deploy", "monitoring", "security"]
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, required_skills TEXT, posted_by TEXT, application_link TEXT, created_at TEXT)")
+        conn.executemany("INSERT INTO jobs (title, description, required_skills, posted_by, application_link, created_at) VALUES (?,?,?,?,?,?)",
+                         ((f"Engineer {i % 500}", " ".join(rnd.choices(words, k=60)), ", ".join(rnd.sample(words, 5)),
+                           f"Company {i % 900}", f"https://jobs.example.com/apply/{i}", "2025-01-01") for i in range(n)))
+
+
+def _measure(fn, repeat=3):
+    """Best-of-``repeat`` latency (untraced), then the memory the result holds"""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = min(elapsed, (time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    result = fn()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, held / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SELECT * tuples vs projected records")
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        _synthetic_db(path, args.rows)
+        conn = sqlite3.connect(path)
+
+        def fetchall(query, params=()):
+            return conn.execute(query, params).fetchall()
+
+        fetchall(JOBS_QUERY)  # warm the page cache for both runs
+        full, full_ms, full_mb = _measure(lambda: fetchall("SELECT * FROM jobs"))
+        del full
+        jobs, rec_ms, rec_mb = _measure(lambda: load_jobs(fetchall))
+        conn.close()
+
+    print(f"{args.rows} jobs        | fetch (ms) | held (MB)")
+    print("-" * 44)
+    print(f"SELECT * tuples   | {full_ms:>10.1f} | {full_mb:>9.1f}")
+    print(f"Job records       | {rec_ms:>10.1f} | {rec_mb:>9.1f}")
+    print(f"first record: id={jobs[0].id} title={jobs[0].title!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Vectorized Job Scoring
+One sparse profile-by-jobs product plus partial top-k selection, shared by
+the recommenders in app.py, 1.py and 2.py.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+
+# app.py policy: a title match with the predicted label wins outright,
+# otherwise the job needs this much text similarity to be recommended
+SIMILARITY_THRESHOLD = 0.2
+
+
+def similarity_scores(profile_vec, job_matrix):
+    """
+    Cosine similarity of one profile row against every job row.
+    Equivalent to ``cosine_similarity(profile_vec, job_matrix)[0]`` but done
+    as a single sparse mat-vec and returned as a flat float array.
+    """
+    if job_matrix is None or job_matrix.shape[0] == 0:
+        return np.zeros(0)
+    p = normalize(sp.csr_matrix(profile_vec))
+    j = normalize(sp.csr_matrix(job_matrix))
+    return np.asarray((j @ p.T).todense()).ravel()
+
+
+def top_k_indices(scores, k, eligible=None):
+    """
+    Indices of the ``k`` best scores, highest first.
+
+    Uses argpartition so only the winners get sorted. Ties keep the original
+    row order, matching ``sorted(..., reverse=True)`` on the full list.
+    """
+    scores = np.asarray(scores, dtype=float)
+    candidates = np.arange(len(scores)) if eligible is None else np.flatnonzero(eligible)
+    if k <= 0 or len(candidates) == 0:
+        return np.zeros(0, dtype=int)
+    cand_scores = scores[candidates]
+    if len(candidates) > k:
+        kth = cand_scores[np.argpartition(-cand_scores, k - 1)[k - 1]]
+        above = np.flatnonzero(cand_scores > kth)
+        ties = np.flatnonzero(cand_scores == kth)[:k - len(above)]
+        keep = np.concatenate([above, ties])
+        candidates, cand_scores = candidates[keep], cand_scores[keep]
+    order = np.argsort(-cand_scores, kind="stable")
+    return candidates[order]
+
+
+def title_matches(predicted_label, titles):
+    """Boolean mask of lower-cased job titles that contain or are contained in the label"""
+    if not predicted_label:
+        return np.zeros(len(titles), dtype=bool)
+    return np.array([predicted_label in t or t in predicted_label for t in titles], dtype=bool)
+
+
+def rank_matches(sims, ai_match, predicted_label, job_ids, top_k=10):
+    """
+    Turn similarity scores and title matches into recommendation dicts
+    (``job_id``, ``score``, ``reason``), best first.
+    """
+    scores = np.round(np.where(ai_match, 1.0, sims), 3)
+    eligible = ai_match | (sims >= SIMILARITY_THRESHOLD)
+    recs = []
+    for idx in top_k_indices(scores, top_k, eligible):
+        if ai_match[idx]:
+            reason = f"AI Match: {predicted_label}"
+        else:
+            reason = f"Similarity: {sims[idx]:.2f}"
+        recs.append({"job_id": job_ids[idx], "score": round(float(scores[idx]), 3), "reason": reason})
+    return recs
+
+
+def rank_matches_many(sims, ai_match, predicted_labels, job_ids, top_k=10):
+    """
+    Block version of ``rank_matches`` for a students x jobs score matrix.
+
+    The per-row top-k runs as one argpartition over an integer key
+    (milli-score, then original row order), so the selection and tie order
+    are identical to ``rank_matches`` without a Python loop over jobs.
+    """
+    n_jobs = sims.shape[1]
+    scores = np.round(np.where(ai_match, 1.0, sims), 3)
+    eligible = ai_match | (sims >= SIMILARITY_THRESHOLD)
+    keys = np.rint(scores * 1000).astype(np.int64) * n_jobs + (n_jobs - 1 - np.arange(n_jobs))
+    keys[~eligible] = -1
+
+    k = min(top_k, n_jobs)
+    if k <= 0:
+        return [[] for _ in range(sims.shape[0])]
+    top = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    top_keys = np.take_along_axis(keys, top, axis=1)
+    order = np.argsort(-top_keys, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+
+    results = []
+    for i, label in enumerate(predicted_labels):
+        recs = []
+        for idx in top[i]:
+            if keys[i, idx] < 0:
+                break
+            if ai_match[i, idx]:
+                reason = f"AI Match: {label}"
+            else:
+                reason = f"Similarity: {sims[i, idx]:.2f}"
+            recs.append({"job_id": job_ids[idx], "score": round(float(scores[i, idx]), 3), "reason": reason})
+        results.append(recs)
+    return results
@@ -0,0 +1,114 @@
+"""
+Full-Text Search
+SQLite FTS5 indexes over jobs (title, description, required_skills) and
+courses (title, description, category), created by migration 7 and kept in
+sync by triggers, so every writer -- app.py, 1.py, 2.py, populate_data.py --
+updates them in the same transaction as the row.
+
+``search()`` ranks matches with BM25 (title hits weigh most) and is shared by
+the ``/search`` endpoint and the dashboards' course filters:
+
+    GET /search?q=pyth dev           jobs and courses matching "pyth*" AND "dev*"
+    GET /search?q=sql&type=courses   one kind only
+    ?limit=10                        rows per kind (max 50)
+"""
+
+import re
+from flask import Blueprint, request, session
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# kind -> content table, indexed columns with their BM25 weights, columns returned by the API
+INDEXES = {
+    "jobs": {"table": "jobs", "columns": {"title": 10.0, "description": 1.0, "required_skills": 5.0},
+             "fields": ["id", "title", "posted_by", "required_skills", "application_link"]},
+    "courses": {"table": "courses", "columns": {"title": 10.0, "description": 1.0, "category": 5.0},
+                "fields": ["id", "title", "category", "course_link"]},
+}
+
+# Same characters the tokenizer keeps inside a token, so "C++" and "C#" stay distinct from "C"
+TOKEN = re.compile(r"[\w+#]+")
+
+
+def fts_ddl(kind):
+    """Statements creating the FTS5 index of ``kind``, its sync triggers, and filling it"""
+    spec = INDEXES[kind]
+    table, fts = spec["table"], f"{spec['table']}_fts"
+    cols = ", ".join(spec["columns"])
+    new = ", ".join(f"new.{c}" for c in spec["columns"])
+    old = ", ".join(f"old.{c}" for c in spec["columns"])
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        f"tokenize=\"unicode61 tokenchars '+#'\", prefix='2 3')",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table}
+       BEGIN INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new}); END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table}
+       BEGIN INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {cols} ON {table}
+       BEGIN INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});
+             INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new}); END""",
+        f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')",
+    ]
+
+
+def _quote(tokens):
+    return '"' + " ".join(tokens).replace('"', '""') + '"'
+
+
+def match_all(text):
+    """Search-box query: every word must match, the last one as a prefix (search as you type)"""
+    tokens = TOKEN.findall(str(text or "").lower())
+    if not tokens:
+        return None
+    return " AND ".join([_quote([t]) for t in tokens[:-1]] + [_quote([tokens[-1]]) + "*"])
+
+
+def match_any(phrases):
+    """Any of ``phrases`` (e.g. skill names) as whole words; multi-word phrases must appear together"""
+    quoted = {_quote(tokens) for tokens in (TOKEN.findall(str(p).lower()) for p in phrases) if tokens}
+    return " OR ".join(sorted(quoted)) or None
+
+
+def search(fetchall, kind, match, limit=DEFAULT_LIMIT, select=None):
+    """
+    Rows of ``kind`` for an FTS5 ``match`` expression, best BM25 score first.
+    ``select`` lists the content-table columns (alias ``t``) to return.
+    """
+    if not match:
+        return []
+    spec = INDEXES[kind]
+    fts = f"{spec['table']}_fts"
+    weights = ", ".join(str(w) for w in spec["columns"].values())
+    select = select or ", ".join(f"t.{f}" for f in spec["fields"])
+    return fetchall(f"SELECT {select} FROM {fts} JOIN {spec['table']} t ON t.id = {fts}.rowid "
+                    f"WHERE {fts} MATCH ? ORDER BY bm25({fts}, {weights}) LIMIT ?", (match, limit))
+
+
+class SearchAPI:
+    """``SearchAPI(fetchall).blueprint`` is registered on the app; any logged-in user may search"""
+
+    def __init__(self, fetchall):
+        self.fetchall = fetchall
+        self.blueprint = Blueprint("search_api", __name__)
+        self.blueprint.add_url_rule("/search", "search", self.search_view)
+
+    def search_view(self):
+        if not session.get("role"):
+            return {"error": "login required"}, 401
+        match = match_all(request.args.get("q", ""))
+        if not match:
+            return {"error": "q must contain at least one word"}, 400
+        kinds = [request.args["type"]] if request.args.get("type") else list(INDEXES)
+        unknown = [k for k in kinds if k not in INDEXES]
+        if unknown:
+            return {"error": f"Unknown type '{unknown[0]}'"}, 400
+        try:
+            limit = min(max(int(request.args.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+        except ValueError:
+            return {"error": "limit must be an integer"}, 400
+        result = {"query": request.args["q"]}
+        for kind in kinds:
+            fields = INDEXES[kind]["fields"]
+            result[kind] = [dict(zip(fields, row)) for row in search(self.fetchall, kind, match, limit)]
+        return result
@@ -0,0 +1,377 @@
+"""
+Skill Matching Engine
+Scores a student's rated skills against a job's required skills.
+
+``calculate_skill_match_score`` is the original one-job-at-a-time version.
+``SkillCatalogue``/``SkillMatcher`` give the same scores and reasons, but a
+profile is parsed once, each required-skills string is compiled once into
+interned skill IDs (with their technical weight), and exact/partial matches
+are resolved once per distinct skill through a substring index.
+``SkillMatcher.score_all`` scores a whole catalogue at once from a sparse
+job x skill incidence matrix (``JobSkillMatrix``).
+"""
+
+import threading
+import numpy as np
+import scipy.sparse as sp
+
+# Categorize skills by importance (technical skills are more critical)
+TECHNICAL_KEYWORDS = ['python', 'java', 'javascript', 'sql', 'react', 'node', 'aws', 'docker',
+                      'kubernetes', 'git', 'linux', 'tensorflow', 'pytorch', 'ml', 'ai']
+
+
+def calculate_skill_match_score(profile_skills, profile_ratings, job_skills, experience_years, min_exp_required):
+    """
+    Calculate a realistic skill match score based on:
+    - Individual skill matches with ratings
+    - Skill importance levels
+    - Experience requirements
+    - Skill gaps analysis
+    """
+    if not profile_skills or not job_skills:
+        return 0.0, "Insufficient profile data"
+
+    # Parse profile skills and ratings
+    skill_dict = {}
+    if profile_ratings:
+        ratings_list = [int(r.strip()) for r in profile_ratings.split(',') if r.strip()]
+        skills_list = [s.strip().lower() for s in profile_skills.split(',') if s.strip()]
+
+        for i, skill in enumerate(skills_list):
+            rating = ratings_list[i] if i < len(ratings_list) else 3  # Default rating of 3
+            skill_dict[skill] = rating
+
+    # Parse job required skills
+    job_skill_list = [s.strip().lower() for s in job_skills.split(';') if s.strip()]
+
+    # Calculate skill matches
+    matched_skills = []
+    missing_skills = []
+    skill_score = 0.0
+    total_weight = 0.0
+
+    for job_skill in job_skill_list:
+        job_skill_lower = job_skill.lower()
+        weight = 2.0 if any(keyword in job_skill_lower for keyword in TECHNICAL_KEYWORDS) else 1.0
+        total_weight += weight
+
+        # Find best matching profile skill
+        best_match = None
+        best_rating = 0
+
+        for profile_skill, rating in skill_dict.items():
+            # Exact match gets full credit
+            if profile_skill == job_skill_lower:
+                best_match = profile_skill
+                best_rating = rating
+                break
+            # Partial match (contains) gets partial credit
+            elif job_skill_lower in profile_skill or profile_skill in job_skill_lower:
+                if rating > best_rating:
+                    best_match = profile_skill
+                    best_rating = rating
+
+        if best_match:
+            matched_skills.append(f"{best_match}({best_rating})")
+
+            # Rating-based scoring (1-5 scale)
+            # Convert to 0-1 scale and apply weight
+            normalized_rating = (best_rating - 1) / 4.0  # 0.0 to 1.0
+            skill_score += normalized_rating * weight
+        else:
+            missing_skills.append(job_skill)
+
+    # Experience factor (if experience data available)
+    exp_factor = 1.0
+    if experience_years is not None and min_exp_required is not None:
+        try:
+            exp_years = float(experience_years)
+            min_exp = float(min_exp_required)
+            if exp_years < min_exp:
+                exp_factor = max(0.3, exp_years / min_exp)  # Penalty for insufficient experience
+            elif exp_years > min_exp * 1.5:
+                exp_factor = 1.1  # Bonus for extensive experience
+        except:
+            pass
+
+    # Calculate final score
+    if total_weight > 0:
+        base_score = (skill_score / total_weight) * exp_factor
+
+        # Apply realistic caps based on skill gaps
+        skill_match_ratio = len(matched_skills) / len(job_skill_list)
+
+        if skill_match_ratio >= 0.8:  # 80%+ skills match
+            max_score = 0.85
+        elif skill_match_ratio >= 0.6:  # 60%+ skills match
+            max_score = 0.75
+        elif skill_match_ratio >= 0.4:  # 40%+ skills match
+            max_score = 0.65
+        else:  # Less than 40% skills match
+            max_score = 0.45
+
+        final_score = min(base_score, max_score)
+
+        # Generate detailed reason
+        if len(missing_skills) == 0:
+            reason = f"Excellent match! All {len(matched_skills)} required skills present"
+        elif len(missing_skills) <= 2:
+            reason = f"Good match with {len(missing_skills)} skill gap(s): {', '.join(missing_skills[:2])}"
+        else:
+            reason = f"Moderate match - {len(missing_skills)} missing skills including {', '.join(missing_skills[:3])}"
+
+        return final_score, reason
+    else:
+        return 0.0, "Unable to analyze skills"
+
+
+def parse_profile_skills(profile_skills, profile_ratings):
+    """Ordered {skill: rating}, parsed exactly like calculate_skill_match_score"""
+    skill_dict = {}
+    if profile_ratings:
+        ratings_list = [int(r.strip()) for r in profile_ratings.split(',') if r.strip()]
+        skills_list = [s.strip().lower() for s in profile_skills.split(',') if s.strip()]
+
+        for i, skill in enumerate(skills_list):
+            rating = ratings_list[i] if i < len(ratings_list) else 3  # Default rating of 3
+            skill_dict[skill] = rating
+    return skill_dict
+
+
+def experience_factor(experience_years, min_exp_required):
+    exp_factor = 1.0
+    if experience_years is not None and min_exp_required is not None:
+        try:
+            exp_years = float(experience_years)
+            min_exp = float(min_exp_required)
+            if exp_years < min_exp:
+                exp_factor = max(0.3, exp_years / min_exp)  # Penalty for insufficient experience
+            elif exp_years > min_exp * 1.5:
+                exp_factor = 1.1  # Bonus for extensive experience
+        except:
+            pass
+    return exp_factor
+
+
+def match_cap(skill_match_ratio):
+    """Realistic score ceiling for the fraction of required skills matched"""
+    if skill_match_ratio >= 0.8:  # 80%+ skills match
+        return 0.85
+    elif skill_match_ratio >= 0.6:  # 60%+ skills match
+        return 0.75
+    elif skill_match_ratio >= 0.4:  # 40%+ skills match
+        return 0.65
+    return 0.45  # Less than 40% skills match
+
+
+def match_reason(matched_count, missing_skills):
+    if len(missing_skills) == 0:
+        return f"Excellent match! All {matched_count} required skills present"
+    elif len(missing_skills) <= 2:
+        return f"Good match with {len(missing_skills)} skill gap(s): {', '.join(missing_skills[:2])}"
+    return f"Moderate match - {len(missing_skills)} missing skills including {', '.join(missing_skills[:3])}"
+
+
+class SkillCatalogue:
+    """
+    Interned job skills. Each distinct skill name gets an integer ID and its
+    technical weight once; each distinct required-skills string is compiled
+    once into a tuple of IDs, so re-scoring a job never re-parses it.
+
+    Shared by the request and worker threads: interning and the compiled
+    caches are guarded by one lock. Lookups of already compiled strings
+    skip it, and a name is published in ``ids`` only after its
+    ``names``/``weights`` entries exist.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.weights = []
+        self._compiled = {}
+        self._last_matrix = None
+        self._lock = threading.RLock()
+
+    def intern(self, name):
+        skill_id = self.ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self.ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self.names)
+                    self.names.append(name)
+                    self.weights.append(2.0 if any(keyword in name for keyword in TECHNICAL_KEYWORDS) else 1.0)
+                    self.ids[name] = skill_id
+        return skill_id
+
+    def job_matrix(self, job_skills_list):
+        """JobSkillMatrix for a list of required-skills strings; the last one built is reused"""
+        compiled = tuple(self.compile(s) for s in job_skills_list)
+        cached = self._last_matrix
+        if cached is None or cached.compiled != compiled:
+            # Built under the lock so names and weights have the same length
+            with self._lock:
+                cached = self._last_matrix
+                if cached is None or cached.compiled != compiled:
+                    cached = self._last_matrix = JobSkillMatrix(self, compiled)
+        return cached
+
+    def compile(self, job_skills):
+        """Tuple of skill IDs in listed order; None when the job lists no skills at all"""
+        if not job_skills:
+            return None
+        compiled = self._compiled.get(job_skills)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(job_skills)
+                if compiled is None:
+                    compiled = tuple(self.intern(s.strip().lower()) for s in job_skills.split(';') if s.strip())
+                    self._compiled[job_skills] = compiled
+        return compiled
+
+
+class SkillMatcher:
+    """
+    One profile's skills, ready to score any number of compiled jobs.
+
+    ``_containing`` maps every substring of every profile skill to the
+    skills containing it (job skill inside a profile skill); profile skills
+    inside a job skill are found by looking the job skill's substrings up in
+    the exact table. Each catalogue skill is resolved once and memoized.
+    """
+
+    def __init__(self, catalogue, profile_skills, profile_ratings):
+        self.catalogue = catalogue
+        self.has_skills = bool(profile_skills)
+        self.skills = parse_profile_skills(profile_skills, profile_ratings) if profile_skills else {}
+        self._order = {skill: i for i, skill in enumerate(self.skills)}
+        self._containing = {}
+        for skill in self.skills:
+            for start in range(len(skill)):
+                for end in range(start + 1, len(skill) + 1):
+                    holders = self._containing.setdefault(skill[start:end], [])
+                    if not holders or holders[-1] != skill:
+                        holders.append(skill)
+        self._resolved = {}
+
+    def resolve(self, skill_id):
+        """(profile skill, rating) credited for a catalogue skill, or None"""
+        if skill_id in self._resolved:
+            return self._resolved[skill_id]
+        name = self.catalogue.names[skill_id]
+        if name in self.skills:
+            # Exact match gets full credit
+            best = (name, self.skills[name])
+        else:
+            # Partial match (contains) gets partial credit: first skill with the highest positive rating
+            partial = set(self._containing.get(name, ()))
+            for start in range(len(name)):
+                for end in range(start + 1, len(name) + 1):
+                    if name[start:end] in self.skills:
+                        partial.add(name[start:end])
+            best, best_rating = None, 0
+            for skill in sorted(partial, key=self._order.__getitem__):
+                if self.skills[skill] > best_rating:
+                    best, best_rating = (skill, self.skills[skill]), self.skills[skill]
+        self._resolved[skill_id] = best
+        return best
+
+    def score(self, compiled_job, experience_years, min_exp_required):
+        """Same (score, reason) as calculate_skill_match_score for the compiled job"""
+        if not self.has_skills or compiled_job is None:
+            return 0.0, "Insufficient profile data"
+
+        names, weights = self.catalogue.names, self.catalogue.weights
+        matched = 0
+        missing_skills = []
+        skill_score = 0.0
+        total_weight = 0.0
+        for skill_id in compiled_job:
+            weight = weights[skill_id]
+            total_weight += weight
+            best = self.resolve(skill_id)
+            if best:
+                matched += 1
+                skill_score += (best[1] - 1) / 4.0 * weight
+            else:
+                missing_skills.append(names[skill_id])
+
+        if total_weight > 0:
+            base_score = (skill_score / total_weight) * experience_factor(experience_years, min_exp_required)
+            final_score = min(base_score, match_cap(matched / len(compiled_job)))
+            return final_score, match_reason(matched, missing_skills)
+        return 0.0, "Unable to analyze skills"
+
+    def score_all(self, jobs, experience_years, min_exp_required):
+        """
+        ``score`` for every job of a JobSkillMatrix in a few array operations.
+        ``min_exp_required`` is one value per job.
+        """
+        weights = self.catalogue.weights
+        n_skills = jobs.incidence.shape[1]
+        # Profile as a vector over catalogue skills: matched flag and weighted normalized rating
+        hit = np.zeros(n_skills)
+        credit = np.zeros(n_skills)
+        for skill_id in range(n_skills):
+            best = self.resolve(skill_id)
+            if best:
+                hit[skill_id] = 1.0
+                credit[skill_id] = (best[1] - 1) / 4.0 * weights[skill_id]
+
+        matched = jobs.incidence @ hit
+        skill_score = jobs.incidence @ credit
+        factors = {}
+        for m in min_exp_required:
+            if m not in factors:
+                factors[m] = experience_factor(experience_years, m)
+        exp_factor = np.array([factors[m] for m in min_exp_required], dtype=float)
+
+        analyzable = jobs.present & (jobs.total_weight > 0) & self.has_skills
+        with np.errstate(divide="ignore", invalid="ignore"):
+            base_score = (skill_score / jobs.total_weight) * exp_factor
+            ratio = matched / jobs.lengths
+        cap = np.select([ratio >= 0.8, ratio >= 0.6, ratio >= 0.4], [0.85, 0.75, 0.65], 0.45)
+        final = np.where(analyzable, np.minimum(base_score, cap), 0.0)
+        return BatchScores(self, jobs, matched, skill_score, cap, final)
+
+
+class JobSkillMatrix:
+    """
+    Sparse jobs x skills incidence of compiled jobs. Each row keeps its
+    skills in listed order (repeats included), so a row-wise product sums
+    the terms in the same order as the per-job loop.
+    """
+
+    def __init__(self, catalogue, compiled_jobs):
+        self.catalogue = catalogue
+        self.compiled = compiled_jobs
+        self.present = np.array([c is not None for c in compiled_jobs], dtype=bool)
+        self.lengths = np.array([len(c) if c else 0 for c in compiled_jobs], dtype=np.int64)
+        indptr = np.concatenate([[0], np.cumsum(self.lengths)])
+        indices = np.fromiter((i for c in compiled_jobs if c for i in c), dtype=np.int64, count=int(indptr[-1]))
+        self.incidence = sp.csr_matrix((np.ones(len(indices)), indices, indptr),
+                                       shape=(len(compiled_jobs), len(catalogue.names)))
+        self.total_weight = self.incidence @ np.asarray(catalogue.weights)
+
+
+class BatchScores:
+    """Per-job arrays from SkillMatcher.score_all; reasons are built only when asked for"""
+
+    def __init__(self, matcher, jobs, matched, skill_score, cap, final):
+        self.matcher = matcher
+        self.jobs = jobs
+        self.matched = matched
+        self.skill_score = skill_score
+        self.cap = cap
+        self.final = final
+
+    def reason(self, idx):
+        compiled = self.jobs.compiled[idx]
+        if not self.matcher.has_skills or compiled is None:
+            return "Insufficient profile data"
+        if not compiled:
+            return "Unable to analyze skills"
+        names = self.matcher.catalogue.names
+        missing_skills = [names[i] for i in compiled if not self.matcher.resolve(i)]
+        return match_reason(int(self.matched[idx]), missing_skills)
+
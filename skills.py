@@ -0,0 +1,261 @@
+"""
+Skill Dictionary
+Canonical skill names with integer IDs, shared by profiles, jobs and courses.
+
+Skill fields arrive in several formats ("Python, SQL" profiles, "Docker;Linux"
+in jobs.csv, comma-joined jobs from populate_data.py, JSON tech_stacks in
+students.csv). They are normalized once, when a row is written, into the
+job_skills / profile_skills / course_skills link tables. 1.py's courses tab
+reads these integer ID sets instead of re-splitting strings on every request.
+
+Job match scores do not use them: skill_matcher.py keeps the original
+``';'`` split of required_skills and its own interned IDs, so scores and
+reasons stay exactly those of calculate_skill_match_score.
+"""
+
+import re
+import json
+import sqlite3
+import logging
+import threading
+from db import connect
+
+logger = logging.getLogger(__name__)
+
+# Spelling variants -> canonical name (seeded into skill_aliases, admins can add more)
+SKILL_ALIASES = {
+    "js": "javascript", "es6": "javascript",
+    "ts": "typescript",
+    "py": "python", "python3": "python",
+    "node": "node.js", "nodejs": "node.js",
+    "reactjs": "react", "react.js": "react",
+    "vue": "vue.js", "vuejs": "vue.js",
+    "k8s": "kubernetes",
+    "golang": "go",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "html5": "html", "css3": "css",
+    "cpp": "c++",
+    "sklearn": "scikit-learn",
+    "amazon web services": "aws",
+    "rest api": "rest", "restful": "rest",
+}
+
+SKILL_SEPARATORS = re.compile(r"[,;|\n]")
+
+
+def clean_skill(name):
+    """Lower-cased, trimmed, single-spaced form of a raw skill name"""
+    return " ".join(str(name).lower().split()).strip(" .")
+
+
+def split_skills(value):
+    """
+    Raw skill names from any stored format, in listed order. JSON lists
+    (students.csv tech_stacks) give ``(name, rating)`` pairs via
+    ``split_rated_skills``; here only the names are returned.
+    """
+    return [name for name, _ in split_rated_skills(value, None)]
+
+
+def split_rated_skills(value, ratings):
+    """
+    ``(clean name, rating)`` pairs. Ratings are aligned by position with the
+    default of 3 used by the skill matcher; JSON entries carry their own.
+    """
+    if not value:
+        return []
+    text = str(value).strip()
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+            pairs = []
+            for item in items:
+                if isinstance(item, dict):
+                    pairs.append((clean_skill(item.get("name", "")), item.get("rating", 3)))
+                else:
+                    pairs.append((clean_skill(item), 3))
+            return [(n, r) for n, r in pairs if n]
+        except (ValueError, TypeError, AttributeError):
+            pass
+    names = [clean_skill(s) for s in SKILL_SEPARATORS.split(text)]
+    names = [n for n in names if n]
+    rating_list = []
+    if ratings:
+        for r in str(ratings).split(","):
+            try:
+                rating_list.append(int(r.strip()))
+            except ValueError:
+                continue
+    return [(n, rating_list[i] if i < len(rating_list) else 3) for i, n in enumerate(names)]
+
+
+class SkillDictionary:
+    """
+    In-memory interned map of the ``skills`` and ``skill_aliases`` tables
+    (created by migration 10 in migrations.py).
+
+    ``canonical`` resolves aliases without touching the DB; ``intern`` adds
+    unseen skills. The ``index_*`` methods are called by the write paths so
+    link tables always hold integer IDs for every job, profile and course.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.ids = {}
+        self.names = {}
+        self.aliases = {}
+        self._lock = threading.RLock()
+
+    def _connect(self):
+        return connect(self.db_path)
+
+    # --- Lifecycle ---
+    def load(self):
+        with self._lock, self._connect() as conn:
+            for alias, name in SKILL_ALIASES.items():
+                conn.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (name,))
+                conn.execute("INSERT OR IGNORE INTO skill_aliases (alias, skill_id) SELECT ?, id FROM skills WHERE name=?", (alias, name))
+            conn.commit()
+            self.ids = {name: sid for sid, name in conn.execute("SELECT id, name FROM skills")}
+            self.names = {sid: name for name, sid in self.ids.items()}
+            self.aliases = {alias: sid for alias, sid in conn.execute("SELECT alias, skill_id FROM skill_aliases")}
+        logger.info(f"Skill dictionary loaded ({len(self.ids)} skills, {len(self.aliases)} aliases)")
+
+    # --- Resolution ---
+    def lookup(self, name):
+        """ID of a known skill or alias, None otherwise"""
+        name = clean_skill(name)
+        sid = self.ids.get(name)
+        return sid if sid is not None else self.aliases.get(name)
+
+    def canonical(self, name):
+        """Canonical spelling of a skill (unknown skills are just cleaned)"""
+        name = clean_skill(name)
+        sid = self.lookup(name)
+        return self.names[sid] if sid is not None else name
+
+    def canonical_names(self, value):
+        """Canonical names from a raw skill field, duplicates dropped"""
+        return list(dict.fromkeys(self.canonical(n) for n in split_skills(value)))
+
+    def intern(self, conn, name):
+        """ID for ``name``, inserting a new skill if it was never seen"""
+        name = clean_skill(name)
+        sid = self.lookup(name)
+        if sid is None:
+            with self._lock:
+                conn.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (name,))
+                sid = conn.execute("SELECT id FROM skills WHERE name=?", (name,)).fetchone()[0]
+                self.ids[name] = sid
+                self.names[sid] = name
+        return sid
+
+    def find_in_text(self, text):
+        """IDs of known skills (or aliases) mentioned as whole words in free text"""
+        words = [w.strip(".") for w in re.findall(r"[a-z0-9+#.]+", str(text or "").lower())]
+        found = set()
+        for size in (1, 2, 3):
+            for i in range(len(words) - size + 1):
+                sid = self.lookup(" ".join(words[i:i + size]))
+                if sid is not None:
+                    found.add(sid)
+        return found
+
+    # --- Write-time indexing ---
+    # A failed index never fails the write itself; backfill picks the row up later
+    def index_job(self, job_id, required_skills):
+        try:
+            with self._connect() as conn:
+                self._index_job(conn, job_id, required_skills)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Skill index of job {job_id} failed: {e}")
+
+    def index_profile(self, user_id, skills, ratings):
+        try:
+            with self._connect() as conn:
+                self._index_profile(conn, user_id, skills, ratings)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Skill index of profile {user_id} failed: {e}")
+
+    def index_course(self, course_id, title, category):
+        try:
+            with self._connect() as conn:
+                self._index_course(conn, course_id, title, category)
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Skill index of course {course_id} failed: {e}")
+
+    def _index_job(self, conn, job_id, required_skills):
+        ids = list(dict.fromkeys(self.intern(conn, n) for n in split_skills(required_skills)))
+        conn.execute("DELETE FROM job_skills WHERE job_id=?", (job_id,))
+        conn.executemany("INSERT INTO job_skills (job_id, skill_id, position) VALUES (?,?,?)",
+                         [(job_id, sid, pos) for pos, sid in enumerate(ids)])
+
+    def _index_profile(self, conn, user_id, skills, ratings):
+        rated = {}
+        for name, rating in split_rated_skills(skills, ratings):
+            rated[self.intern(conn, name)] = rating  # last rating wins, as in the skill matcher
+        conn.execute("DELETE FROM profile_skills WHERE user_id=?", (user_id,))
+        conn.executemany("INSERT INTO profile_skills (user_id, skill_id, rating, position) VALUES (?,?,?,?)",
+                         [(user_id, sid, rating, pos) for pos, (sid, rating) in enumerate(rated.items())])
+
+    def _index_course(self, conn, course_id, title, category):
+        ids = self.find_in_text(f"{title or ''} {category or ''}")
+        conn.execute("DELETE FROM course_skills WHERE course_id=?", (course_id,))
+        conn.executemany("INSERT INTO course_skills (course_id, skill_id) VALUES (?,?)",
+                         [(course_id, sid) for sid in sorted(ids)])
+
+    def backfill(self, full=False):
+        """
+        Index rows written without going through index_* (populate_data.py,
+        old data). ``full`` re-indexes everything, e.g. after a table was
+        dropped and re-created with reused IDs.
+        """
+        job_sql = "SELECT id, required_skills FROM jobs"
+        profile_sql = "SELECT user_id, skills, skill_ratings FROM student_profile"
+        course_sql = "SELECT id, title, category FROM courses"
+        if not full:
+            job_sql += " WHERE id NOT IN (SELECT job_id FROM job_skills)"
+            profile_sql += " WHERE user_id NOT IN (SELECT user_id FROM profile_skills)"
+            course_sql += " WHERE id NOT IN (SELECT course_id FROM course_skills)"
+        with self._connect() as conn:
+            jobs = conn.execute(job_sql).fetchall()
+            profiles = conn.execute(profile_sql).fetchall()
+            courses = conn.execute(course_sql).fetchall()
+            for job_id, required in jobs:
+                self._index_job(conn, job_id, required)
+            for user_id, skills, ratings in profiles:
+                self._index_profile(conn, user_id, skills, ratings)
+            for course_id, title, category in courses:
+                self._index_course(conn, course_id, title, category)
+            conn.commit()
+        if jobs or profiles or courses:
+            logger.info(f"Skill index backfilled: {len(jobs)} jobs, {len(profiles)} profiles, {len(courses)} courses")
+
+    # --- Readers ---
+    def job_skill_ids(self, job_ids):
+        """{job_id: set of skill IDs} for the given jobs"""
+        job_ids = list(job_ids)
+        result = {jid: set() for jid in job_ids}
+        if not job_ids:
+            return result
+        with self._connect() as conn:
+            placeholders = ",".join("?" * len(job_ids))
+            for jid, sid in conn.execute(f"SELECT job_id, skill_id FROM job_skills WHERE job_id IN ({placeholders})", job_ids):
+                result[jid].add(sid)
+        return result
+
+    def profile_skill_ids(self, user_id):
+        with self._connect() as conn:
+            return {sid for (sid,) in conn.execute("SELECT skill_id FROM profile_skills WHERE user_id=?", (user_id,))}
+
+    def course_skill_ids(self):
+        """{course_id: set of skill IDs} for every indexed course"""
+        result = {}
+        with self._connect() as conn:
+            for cid, sid in conn.execute("SELECT course_id, skill_id FROM course_skills"):
+                result.setdefault(cid, set()).add(sid)
+        return result
@@ -0,0 +1,240 @@
+function showTab(tabId) {
+    document.querySelectorAll('.tab-content').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.nav-item').forEach(n => n.classList.remove('active'));
+    document.getElementById(tabId).classList.add('active');
+    document.getElementById('nav-' + tabId).classList.add('active');
+    loadTab(tabId);
+}
+
+// --- Lazy, paginated tab data from /admin/api/<collection> ---
+const TAB_COLLECTIONS = {
+    jobs: ['jobs'], courses: ['courses'], videos: ['videos'],
+    trends: ['trends'], students: ['students', 'users']
+};
+const COLLECTIONS = {
+    jobs: { fields: 'id,title,posted_by,required_skills,application_link,description', render: jobRow },
+    courses: { fields: 'id,title,category,course_link,description', render: courseRow },
+    videos: { fields: 'id,video_title,course_title,video_url', render: videoRow },
+    trends: { fields: 'id,job_role,industry,trending_skills,year', render: trendCard, pageSize: 24 },
+    students: { fields: 'id,full_name,college_name,skills', render: studentRow },
+    users: { fields: 'id,username,email', render: userRow }
+};
+const collectionState = {};
+
+function esc(value) {
+    return String(value === null || value === undefined ? '' : value)
+        .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+}
+
+function randomBetween(low, high) {
+    return low + Math.floor(Math.random() * (high - low));
+}
+
+function jobRow(j) {
+    return `<tr>
+        <td>${esc(j.title)}</td>
+        <td>${esc(j.posted_by)}</td>
+        <td>${esc(j.required_skills)}</td>
+        <td>${j.application_link ? `<a href="${esc(j.application_link)}" target="_blank" style="color: var(--accent);">View Link</a>` : 'None'}</td>
+        <td>
+            <div class="action-btns">
+                <button data-job-id="${esc(j.id)}" data-job-title="${esc(j.title)}" data-job-link="${esc(j.application_link)}" data-job-skills="${esc(j.required_skills)}" data-job-desc="${esc(j.description)}" onclick="openEditJobModal(this.dataset.jobId, this.dataset.jobTitle, this.dataset.jobLink, this.dataset.jobSkills, this.dataset.jobDesc)" class="btn btn-edit btn-sm">
+                    <i class="fas fa-edit"></i> Edit
+                </button>
+                <a href="/delete/job/${esc(j.id)}" class="btn btn-danger btn-sm" onclick="return confirm('Delete this job?')">
+                    <i class="fas fa-trash"></i> Delete
+                </a>
+            </div>
+        </td>
+    </tr>`;
+}
+
+function courseRow(c) {
+    return `<tr>
+        <td>${esc(c.title)}</td>
+        <td>${esc(c.category)}</td>
+        <td><a href="${esc(c.course_link)}" target="_blank" style="color: var(--accent);">Visit Link</a></td>
+        <td>
+            <div class="action-btns">
+                <button data-course-id="${esc(c.id)}" data-course-title="${esc(c.title)}" data-course-category="${esc(c.category)}" data-course-desc="${esc(c.description)}" data-course-link="${esc(c.course_link)}" onclick="openEditModal(this.dataset.courseId, this.dataset.courseTitle, this.dataset.courseCategory, this.dataset.courseDesc, this.dataset.courseLink)" class="btn btn-edit btn-sm">
+                    <i class="fas fa-edit"></i> Edit
+                </button>
+                <a href="/delete/course/${esc(c.id)}" class="btn btn-danger btn-sm" onclick="return confirm('Delete this course?')">
+                    <i class="fas fa-trash"></i> Delete
+                </a>
+            </div>
+        </td>
+    </tr>`;
+}
+
+function videoRow(v) {
+    return `<tr>
+        <td>${esc(v.video_title)}</td>
+        <td>${esc(v.course_title || 'General')}</td>
+        <td><a href="${esc(v.video_url)}" target="_blank" style="color: var(--accent);">Watch</a></td>
+        <td><a href="/delete/video/${esc(v.id)}" class="btn btn-danger btn-sm" onclick="return confirm('Delete this video?')"><i class="fas fa-trash"></i> Delete</a></td>
+    </tr>`;
+}
+
+function trendCard(t) {
+    const skills = (t.trending_skills || '').split(',').slice(0, 3).map(skill => {
+        const percentage = randomBetween(75, 96);
+        return `<div class="skill-circle">
+            <div class="circle-container">
+                <div class="circle-background"></div>
+                <div class="circle-progress" style="--progress: ${percentage}deg;"></div>
+                <div class="circle-center">${percentage}%</div>
+            </div>
+            <div class="skill-label">${esc(skill.trim())}</div>
+        </div>`;
+    }).join('');
+    return `<div class="analytics-card">
+        <div class="analytics-header">
+            <div class="trend-title"><i class="fas fa-rocket" style="margin-right: 8px; opacity: 0.8;"></i> ${esc(t.job_role)}</div>
+        </div>
+        <div class="analytics-visual"><div class="skill-circles">${skills}</div></div>
+        <div class="trend-stats">
+            <div class="stat-item"><span class="stat-value">${randomBetween(50, 200)}K</span><span class="stat-label">Jobs</span></div>
+            <div class="stat-item"><span class="stat-value">$${randomBetween(80, 150)}K</span><span class="stat-label">Avg Salary</span></div>
+            <div class="stat-item"><span class="stat-value">+${randomBetween(15, 35)}%</span><span class="stat-label">Growth</span></div>
+        </div>
+        <div class="trend-industry"><i class="fas fa-building"></i> ${esc(t.industry)}</div>
+        <div style="position: absolute; top: 15px; right: 15px; display: flex; flex-direction: column; align-items: flex-end; gap: 8px;">
+            <a href="/delete/trend/${esc(t.id)}" class="btn btn-danger btn-sm" style="padding: 4px 8px; font-size: 0.75rem;" onclick="return confirm('Delete this trend?')">
+                <i class="fas fa-trash"></i> Delete
+            </a>
+            <div style="background: linear-gradient(135deg, #ff6b9d, #c44569); color: white; padding: 4px 8px; border-radius: 15px; font-size: 0.65rem; font-weight: 600; box-shadow: 0 2px 8px rgba(255, 107, 157, 0.3);">${esc(t.year)}</div>
+        </div>
+    </div>`;
+}
+
+function studentRow(s) {
+    return `<tr><td>${esc(s.full_name)}</td><td>${esc(s.college_name)}</td><td>${esc(s.skills)}</td>
+        <td><a href="/delete/student/${esc(s.id)}" class="btn btn-danger">Delete Profile</a></td></tr>`;
+}
+
+function userRow(u) {
+    return `<tr><td>${esc(u.id)}</td><td>${esc(u.username)}</td><td>${esc(u.email)}</td>
+        <td><a href="/delete/user/${esc(u.id)}" class="btn btn-danger">Delete Account</a></td></tr>`;
+}
+
+function loadCollection(name, reset) {
+    const spec = COLLECTIONS[name];
+    const state = collectionState[name] || (collectionState[name] = { after: null, shown: 0 });
+    const body = document.getElementById(name + '-rows');
+    if (reset) { state.after = null; state.shown = 0; body.innerHTML = ''; }
+    const query = document.getElementById(name + '-q');
+    const params = new URLSearchParams({ fields: spec.fields, limit: spec.pageSize || 50 });
+    if (state.after) params.set('after', state.after);
+    if (query && query.value.trim()) params.set('q', query.value.trim());
+    const request = state.request = fetch('/admin/api/' + name + '?' + params)
+        .then(r => r.json())
+        .then(data => {
+            if (request !== state.request) return;  // a newer search superseded this page
+            body.insertAdjacentHTML('beforeend', data.items.map(spec.render).join(''));
+            state.after = data.next_after;
+            state.shown += data.items.length;
+            document.getElementById(name + '-count').innerText = `Showing ${state.shown} of ${data.total}`;
+            document.getElementById(name + '-more').style.display = data.next_after ? '' : 'none';
+            const empty = document.getElementById(name + '-empty');
+            if (empty) empty.style.display = state.shown ? 'none' : '';
+        })
+        .catch(() => { document.getElementById(name + '-count').innerText = 'Could not load data'; });
+}
+
+let filterTimer = null;
+function filterCollection(name) {
+    clearTimeout(filterTimer);
+    filterTimer = setTimeout(() => loadCollection(name, true), 250);
+}
+
+function loadCourseOptions() {
+    fetch('/admin/api/courses?fields=id,title&limit=500')
+        .then(r => r.json())
+        .then(data => {
+            document.getElementById('video-course-options').insertAdjacentHTML('beforeend',
+                data.items.map(c => `<option value="${esc(c.id)}">${esc(c.title)}</option>`).join(''));
+        });
+}
+
+function loadTab(tabId) {
+    (TAB_COLLECTIONS[tabId] || []).forEach(name => {
+        if (!collectionState[name]) loadCollection(name, true);
+    });
+    if (tabId === 'videos' && !collectionState.courseOptions) {
+        collectionState.courseOptions = true;
+        loadCourseOptions();
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const active = document.querySelector('.tab-content.active');
+    loadTab(active ? active.id : 'jobs');
+});
+
+function openEditModal(id, title, category, desc, link) {
+    const modal = document.getElementById('editModal');
+    document.getElementById('modalTitle').innerText = "Edit Course";
+    document.getElementById('modalAction').value = "edit_course";
+    document.getElementById('modalId').name = "course_id";
+    document.getElementById('modalId').value = id;
+
+    document.getElementById('modalFields').innerHTML = `
+        <div class="form-group">
+            <label>Course Title</label>
+            <input type="text" name="title" value="${title}" required>
+        </div>
+        <div class="form-group">
+            <label>Category</label>
+            <input type="text" name="category" value="${category}" required>
+        </div>
+        <div class="form-group">
+            <label>Course Link</label>
+            <input type="text" name="course_link" value="${link}" required>
+        </div>
+        <div class="form-group">
+            <label>Description</label>
+            <textarea name="description" rows="4" required>${desc}</textarea>
+        </div>
+    `;
+    modal.style.display = 'flex';
+}
+
+function openEditJobModal(id, title, link, skills, desc) {
+    const modal = document.getElementById('editModal');
+    document.getElementById('modalTitle').innerText = "Edit Job";
+    document.getElementById('modalAction').value = "edit_job";
+    document.getElementById('modalId').name = "job_id";
+    document.getElementById('modalId').value = id;
+
+    document.getElementById('modalFields').innerHTML = `
+        <div class="form-group">
+            <label>Job Title</label>
+            <input type="text" name="title" value="${title}" required>
+        </div>
+        <div class="form-group">
+            <label>Apply URL</label>
+            <input type="text" name="application_link" value="${link}">
+        </div>
+        <div class="form-group">
+            <label>Skills (comma separated)</label>
+            <input type="text" name="required_skills" value="${skills}" required>
+        </div>
+        <div class="form-group">
+            <label>Description</label>
+            <textarea name="description" rows="4" required>${desc}</textarea>
+        </div>
+    `;
+    modal.style.display = 'flex';
+}
+
+function closeModal() {
+    document.getElementById('editModal').style.display = 'none';
+}
+
+window.onclick = function(event) {
+    if (event.target == document.getElementById('editModal')) {
+        closeModal();
+    }
+}
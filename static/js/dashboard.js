@@ -0,0 +1,259 @@
+function toggleChatbot() {
+    const modal = document.getElementById('chatbotModal');
+    const icon = document.querySelector('.chatbot-icon');
+
+    if (modal.style.display === 'flex') {
+        modal.style.display = 'none';
+        icon.style.display = 'flex';
+    } else {
+        modal.style.display = 'flex';
+        icon.style.display = 'none';
+    }
+}
+
+function sendChatbotMessage() {
+    const input = document.getElementById('chatbotInput');
+    const messages = document.getElementById('chatbotMessages');
+
+    if (!input.value.trim()) return;
+
+    const userText = input.value.trim();
+
+    // Add user message
+    const userDiv = document.createElement('div');
+    userDiv.className = 'chatbot-message user';
+    userDiv.innerHTML = `
+        <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
+            <i class="fas fa-user" style="color: white; opacity: 0.8;"></i>
+            <span style="font-weight: 600;">You</span>
+        </div>
+        <div>${userText}</div>
+    `;
+    messages.appendChild(userDiv);
+
+    // Clear input
+    input.value = '';
+
+    // Show typing indicator
+    const typingDiv = document.createElement('div');
+    typingDiv.className = 'chatbot-message bot';
+    typingDiv.id = 'typingIndicator';
+    typingDiv.innerHTML = `
+        <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
+            <i class="fas fa-robot" style="color: var(--primary);"></i>
+            <span style="font-weight: 600; color: var(--primary);">CareerBot</span>
+        </div>
+        <div style="display: flex; align-items: center; gap: 4px;">
+            <div class="typing-dot"></div>
+            <div class="typing-dot"></div>
+            <div class="typing-dot"></div>
+            <span style="margin-left: 8px; font-size: 0.8rem; opacity: 0.7;">Typing...</span>
+        </div>
+    `;
+    messages.appendChild(typingDiv);
+    messages.scrollTop = messages.scrollHeight;
+
+    // Simulate bot response with enhanced logic
+    setTimeout(() => {
+        // Remove typing indicator
+        const typingIndicator = document.getElementById('typingIndicator');
+        if (typingIndicator) typingIndicator.remove();
+
+        const botDiv = document.createElement('div');
+        botDiv.className = 'chatbot-message bot';
+
+        let response = "";
+        const lowerText = userText.toLowerCase();
+
+        // Enhanced keyword matching with broader detection
+        const jobKeywords = ['job', 'recommend', 'opportunity', 'position', 'career', 'role'];
+        const skillKeywords = ['skill', 'learn', 'improve', 'develop', 'training', 'education'];
+        const courseKeywords = ['course', 'curriculum', 'program', 'class', 'learning', 'study'];
+        const trendKeywords = ['trend', 'market', 'industry', 'growth', 'future', 'analysis'];
+        const profileKeywords = ['profile', 'update', 'resume', 'cv', 'experience', 'background'];
+
+        const hasJobKeywords = jobKeywords.some(keyword => lowerText.includes(keyword));
+        const hasSkillKeywords = skillKeywords.some(keyword => lowerText.includes(keyword));
+        const hasCourseKeywords = courseKeywords.some(keyword => lowerText.includes(keyword));
+        const hasTrendKeywords = trendKeywords.some(keyword => lowerText.includes(keyword));
+        const hasProfileKeywords = profileKeywords.some(keyword => lowerText.includes(keyword));
+
+        if (hasJobKeywords) {
+            response = `
+                <div>Great question about job recommendations! 🚀</div>
+                <div style="margin-top: 8px;">
+                    <strong>Your personalized job matches are ready!</strong><br>
+                    Check the "Career Path & Jobs" section for AI-powered recommendations tailored to your profile.
+                </div>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    💡 Tip: Complete your profile for more accurate matches
+                </div>
+            `;
+        } else if (hasSkillKeywords) {
+            response = `
+                <div>Skill development is key to career growth! 📈</div>
+                <div style="margin-top: 8px;">
+                    Explore our <strong>Video Modules</strong> for targeted learning:
+                </div>
+                <ul style="margin: 8px 0; padding-left: 20px;">
+                    <li>🎓 Recommended Videos (skill gaps)</li>
+                    <li>💬 Communication Training</li>
+                    <li>🎯 Placement Preparation</li>
+                </ul>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    Focus on the Recommended Videos section for skills you need to develop!
+                </div>
+            `;
+        } else if (hasCourseKeywords) {
+            response = `
+                <div>Excellent choice for structured learning! 🎓</div>
+                <div style="margin-top: 8px;">
+                    Our <strong>Courses section</strong> offers specialized learning paths:
+                </div>
+                <ul style="margin: 8px 0; padding-left: 20px;">
+                    <li>💻 Programming & Technical Skills</li>
+                    <li>🌐 Web Development</li>
+                    <li>📊 Data Science & ML</li>
+                    <li>☁️ DevOps & Cloud Computing</li>
+                    <li>📱 Mobile Development</li>
+                </ul>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    Click any category tab to explore courses in that domain!
+                </div>
+            `;
+        } else if (hasTrendKeywords) {
+            response = `
+                <div>Stay ahead with market insights! 📊</div>
+                <div style="margin-top: 8px;">
+                    Check the <strong>visual analytics</strong> in the home section showing:
+                </div>
+                <ul style="margin: 8px 0; padding-left: 20px;">
+                    <li>🔥 Trending job roles with demand percentages</li>
+                    <li>📈 In-demand skills with circular progress charts</li>
+                    <li>💰 Salary insights and growth projections</li>
+                </ul>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    Scroll up to see the interactive trend cards above!
+                </div>
+            `;
+        } else if (hasProfileKeywords) {
+            response = `
+                <div>Profile optimization is crucial! ⚙️</div>
+                <div style="margin-top: 8px;">
+                    <strong>To get better recommendations:</strong>
+                </div>
+                <ul style="margin: 8px 0; padding-left: 20px;">
+                    <li>Add your current skills with proficiency ratings (1-5)</li>
+                    <li>Specify your career interests and goals</li>
+                    <li>Update your experience level and background</li>
+                </ul>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    Go to "Career Profile" section to update your information!
+                </div>
+            `;
+        } else {
+            // More engaging fallback response
+            response = `
+                <div>I'm here to help with your career journey! 🌟</div>
+                <div style="margin-top: 8px;">
+                    <strong>You can ask me about:</strong>
+                </div>
+                <ul style="margin: 8px 0; padding-left: 20px;">
+                    <li>💼 <strong>Jobs:</strong> "What jobs match my skills?" or "Show me opportunities"</li>
+                    <li>📚 <strong>Skills:</strong> "What skills should I learn?" or "How to improve?"</li>
+                    <li>🎓 <strong>Courses:</strong> "What courses are available?" or "Tell me about learning"</li>
+                    <li>📊 <strong>Trends:</strong> "What's trending?" or "Market insights"</li>
+                    <li>👤 <strong>Profile:</strong> "How to improve my profile?" or "Update tips"</li>
+                </ul>
+                <div style="margin-top: 8px; font-size: 0.8rem; opacity: 0.8;">
+                    What would you like to explore today?
+                </div>
+            `;
+        }
+
+        botDiv.innerHTML = `
+            <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
+                <i class="fas fa-robot" style="color: var(--primary);"></i>
+                <span style="font-weight: 600; color: var(--primary);">CareerBot</span>
+            </div>
+            <div>${response}</div>
+        `;
+
+        messages.appendChild(botDiv);
+        messages.scrollTop = messages.scrollHeight;
+    }, 1500 + Math.random() * 1000); // Random delay for more natural feel
+}
+
+// Close chatbot when clicking outside
+document.addEventListener('click', function(event) {
+    const modal = document.getElementById('chatbotModal');
+    const icon = document.querySelector('.chatbot-icon');
+
+    if (!modal.contains(event.target) && !icon.contains(event.target) && modal.style.display === 'flex') {
+        toggleChatbot();
+    }
+});
+
+// Send message on Enter key
+document.getElementById('chatbotInput').addEventListener('keypress', function(event) {
+    if (event.key === 'Enter') {
+        sendChatbotMessage();
+    }
+});
+
+// Auto-hide flash messages after 3 seconds
+setTimeout(function() {
+    const flashMessages = document.querySelectorAll('.card[style*="rgba(34, 197, 94, 0.1)"]');
+    flashMessages.forEach(function(message) {
+        message.style.transition = 'opacity 0.5s ease-out';
+        message.style.opacity = '0';
+        setTimeout(function() {
+            message.style.display = 'none';
+        }, 500);
+    });
+}, 3000);
+
+// Video Navigation Functionality, bound once the videos tab has been loaded (dashboard_tabs.js)
+function bindVideoNav() {
+    const navLinks = document.querySelectorAll('.video-nav-link');
+    const videoSections = document.querySelectorAll('.video-main-category');
+
+    // Function to update active navigation link based on scroll position
+    function updateActiveNavLink() {
+        const scrollPosition = window.scrollY + 100;
+
+        videoSections.forEach((section, index) => {
+            const sectionTop = section.offsetTop;
+            const sectionHeight = section.offsetHeight;
+
+            if (scrollPosition >= sectionTop && scrollPosition < sectionTop + sectionHeight) {
+                // Remove active class from all links
+                navLinks.forEach(link => link.classList.remove('active'));
+                // Add active class to current section link
+                navLinks[index].classList.add('active');
+            }
+        });
+    }
+
+    // Smooth scroll to section when clicking nav links
+    navLinks.forEach(link => {
+        link.addEventListener('click', function(e) {
+            e.preventDefault();
+            const targetId = this.getAttribute('href').substring(1);
+            const targetSection = document.getElementById(targetId);
+
+            if (targetSection) {
+                targetSection.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+
+    // Update active nav link on scroll
+    window.addEventListener('scroll', updateActiveNavLink);
+
+    // Set initial active link
+    updateActiveNavLink();
+}
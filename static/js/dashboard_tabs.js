@@ -0,0 +1,387 @@
+// Lazy dashboard tabs: each [data-panel] is filled from its JSON endpoint
+// (dashboard_api.py) the first time its section is shown.
+
+const PAGE_SIZE = 200;
+
+function escapeHtml(value) {
+    return String(value == null ? '' : value)
+        .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+}
+
+function truncate(text, length) {
+    text = text || '';
+    return text.length > length ? text.slice(0, length) + '...' : text;
+}
+
+function randomInt(low, high) {
+    // Same range as Jinja's range(low, high)|random
+    return low + Math.floor(Math.random() * (high - low));
+}
+
+function categoryId(category) {
+    return category.toLowerCase().split(' ').join('').split('&').join('');
+}
+
+// [test, icon, emoji]; the video tabs have no AI/ML entry and use a different default emoji
+const CATEGORY_ICONS = [
+    [c => c.includes('Programming'), 'fa-code', '💻'],
+    [c => c.includes('Web'), 'fa-globe', '🌐'],
+    [c => c.includes('Data'), 'fa-chart-bar', '📊'],
+    [c => c.includes('AI') || c.includes('Machine'), 'fa-brain', '🤖'],
+    [c => c.includes('Database'), 'fa-database', '🗄️'],
+    [c => c.includes('DevOps') || c.includes('Cloud'), 'fa-server', '☁️'],
+    [c => c.includes('Mobile'), 'fa-mobile-alt', '📱'],
+];
+
+function categoryIcon(category, forVideos) {
+    const match = CATEGORY_ICONS.find(([test, icon]) => test(category) && !(forVideos && icon === 'fa-brain'));
+    if (match) return {icon: match[1], emoji: match[2]};
+    return {icon: 'fa-graduation-cap', emoji: forVideos ? '🎓' : '📚'};
+}
+
+// Every page of a list endpoint; the first page's extra keys (e.g. categories) are kept
+function fetchAll(url) {
+    const sep = url.includes('?') ? '&' : '?';
+    function fetchPage(offset, result) {
+        return fetch(`${url}${sep}limit=${PAGE_SIZE}&offset=${offset}`, {credentials: 'same-origin'})
+            .then(response => {
+                if (!response.ok) throw new Error(`${url}: ${response.status}`);
+                return response.json();
+            })
+            .then(data => {
+                if (!result) result = data;
+                else result.items = result.items.concat(data.items);
+                return data.next_offset === null ? result : fetchPage(data.next_offset, result);
+            });
+    }
+    return fetchPage(0, null);
+}
+
+// --- Renderers: data -> HTML, same markup the template used to render ---
+function renderTrends(data) {
+    if (!data.items.length) {
+        return `
+            <div class="analytics-placeholder">
+                <div style="position: relative;">
+                    <i class="fas fa-chart-line"></i>
+                    <div style="position: absolute; top: 10px; left: 10px; width: 20px; height: 20px; background: var(--primary); border-radius: 50%; opacity: 0.6;"></div>
+                    <div style="position: absolute; top: -5px; right: 15px; width: 15px; height: 15px; background: var(--accent); border-radius: 50%; opacity: 0.4;"></div>
+                </div>
+                <h4 style="color: var(--text-muted); margin: 15px 0 10px 0;">Analyzing Market Trends</h4>
+                <p style="color: var(--text-muted); font-size: 0.9rem;">No industry trends available at the moment.<br>Check back soon for the latest insights!</p>
+            </div>`;
+    }
+    return data.items.map(trend => {
+        const circles = (trend.trending_skills || '').split(',').slice(0, 3).map(skill => {
+            const percentage = randomInt(75, 96);
+            return `
+                    <div class="skill-circle">
+                        <div class="circle-container">
+                            <div class="circle-background"></div>
+                            <div class="circle-progress" style="--progress: ${percentage}deg;"></div>
+                            <div class="circle-center">${percentage}%</div>
+                        </div>
+                        <div class="skill-label">${escapeHtml(skill.trim())}</div>
+                    </div>`;
+        }).join('');
+        return `
+            <div class="analytics-card">
+                <div class="analytics-header">
+                    <div class="trend-title">
+                        <i class="fas fa-rocket" style="margin-right: 8px; opacity: 0.8;"></i>
+                        ${escapeHtml(trend.job_role)}
+                    </div>
+                    <div class="trend-year">${escapeHtml(trend.year)}</div>
+                </div>
+
+                <div class="analytics-visual">
+                    <div class="skill-circles">${circles}
+                    </div>
+                </div>
+
+                <div class="trend-stats">
+                    <div class="stat-item">
+                        <span class="stat-value">${randomInt(50, 200)}K</span>
+                        <span class="stat-label">Jobs</span>
+                    </div>
+                    <div class="stat-item">
+                        <span class="stat-value">$${randomInt(80, 150)}K</span>
+                        <span class="stat-label">Avg Salary</span>
+                    </div>
+                    <div class="stat-item">
+                        <span class="stat-value">+${randomInt(15, 35)}%</span>
+                        <span class="stat-label">Growth</span>
+                    </div>
+                </div>
+
+                <div class="trend-industry">
+                    <i class="fas fa-building"></i> ${escapeHtml(trend.industry)}
+                </div>
+            </div>`;
+    }).join('');
+}
+
+function renderReportMatches(data) {
+    if (!data.items.length) {
+        return `
+            <div style="text-align: center; padding: 30px; color: var(--text-muted);">
+                <i class="fas fa-search" style="font-size: 2rem; margin-bottom: 10px; opacity: 0.5;"></i>
+                <p>No suitable job matches found based on your current profile.</p>
+                <p style="font-size: 0.9rem; margin-top: 5px;">Try updating your skills and experience to get better matches!</p>
+            </div>`;
+    }
+    const items = data.items.map(job => `
+            <div class="recommendation-item" style="margin-bottom: 15px; padding-bottom: 15px; border-bottom: 1px solid rgba(255,255,255,0.1);">
+                <div class="rec-header" style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
+                    <strong style="color: white;">${escapeHtml(job.title)}</strong>
+                    <span class="match-score" style="background: linear-gradient(135deg, var(--primary), var(--accent)); color: white; padding: 3px 8px; border-radius: 12px; font-size: 0.75rem; font-weight: 600;">${Math.floor(job.match_score * 100)}% Match</span>
+                </div>
+                <div class="rec-company" style="color: var(--text-muted); font-size: 0.8rem; margin-bottom: 8px;">
+                    🏢 ${escapeHtml(job.posted_by)}
+                </div>
+                <div class="skill-analysis" style="font-size: 0.75rem; color: var(--accent); line-height: 1.3; background: rgba(255,255,255,0.05); padding: 8px; border-radius: 6px;">
+                    <strong>Analysis:</strong> ${escapeHtml(job.match_reason)}
+                </div>
+            </div>`).join('');
+    return `<div class="recommendations-list">${items}
+        </div>`;
+}
+
+function renderRecommendations(data) {
+    if (!data.items.length) {
+        return `
+            <div class="text-center" style="padding: 40px;">
+                <i class="fas fa-search fa-3x" style="color: var(--text-muted); margin-bottom: 15px;"></i>
+                <p class="text-muted">No jobs matching your profile were found. Try updating your skills!</p>
+            </div>`;
+    }
+    const cards = data.items.map(job => `
+            <div class="job-card">
+                <div class="match-badge">${Math.floor(job.match_score * 100)}% Match</div>
+                <h4>${escapeHtml(job.title)}</h4>
+                <p style="color: var(--accent); font-weight: 500; font-size: 0.9rem;">🏢 ${escapeHtml(job.posted_by)}</p>
+                <p>${escapeHtml(truncate(job.description, 120))}</p>
+
+                <!-- Enhanced Skill Analysis -->
+                <div class="skill-analysis" style="margin: 15px 0; padding: 10px; background: rgba(0,0,0,0.05); border-radius: 8px; border-left: 3px solid var(--accent);">
+                    <div style="font-size: 0.75rem; font-weight: 600; color: var(--accent); margin-bottom: 5px;">SKILL ANALYSIS</div>
+                    <div style="font-size: 0.7rem; color: var(--text); line-height: 1.3;">
+                        ${escapeHtml(job.match_reason)}
+                    </div>
+                </div>
+
+                <div style="margin-bottom: 15px;">
+                    <small style="color: var(--text-muted);"><strong>Required Skills:</strong> ${escapeHtml(truncate(job.required_skills, 80))}</small>
+                </div>
+
+                <a href="${job.application_link ? escapeHtml(job.application_link) : '#'}" class="btn btn-primary" style="width: 100%; justify-content: center;" ${job.application_link ? 'target="_blank"' : ''}>
+                    ${job.application_link ? 'Apply Now' : 'No Link Available'}
+                </a>
+            </div>`).join('');
+    return `<div class="recommendations-grid">${cards}
+        </div>`;
+}
+
+function renderCourses(data) {
+    const tabs = data.categories.map((category, index) => {
+        const active = index === 0;
+        return `
+            <button class="course-tab-btn ${active ? 'active' : ''}"
+                    onclick="showCourseCategory('${categoryId(category)}')"
+                    style="background: ${active ? 'var(--primary)' : 'rgba(255,255,255,0.1)'};
+                           color: ${active ? 'white' : 'var(--text)'};
+                           border: ${active ? 'none' : '1px solid rgba(255,255,255,0.2)'};
+                           padding: 8px 16px; border-radius: 6px; cursor: pointer; font-size: 0.85rem;">
+                <i class="fas ${categoryIcon(category).icon}"></i>
+                ${escapeHtml(category)}
+            </button>`;
+    }).join('');
+
+    const sections = data.categories.map((category, index) => {
+        const {icon, emoji} = categoryIcon(category);
+        const courses = data.items.filter(course => course.category === category);
+        const body = courses.length ? `
+                <div class="courses-grid">${courses.map(course => `
+                    <div class="course-card">
+                        <div class="course-image">
+                            <i class="fas ${icon}"></i>
+                        </div>
+                        <div class="course-content">
+                            <span class="course-category">${escapeHtml(course.category)}</span>
+                            <h4>${escapeHtml(course.title)}</h4>
+                            <p>${escapeHtml(truncate(course.description, 120))}</p>
+
+                            <div class="course-footer">
+                                <div class="course-meta">
+                                    <span><i class="fas fa-clock"></i> 12+ Hours</span>
+                                    <span><i class="fas fa-signal"></i> All Levels</span>
+                                </div>
+                                <a href="${course.course_link ? escapeHtml(course.course_link) : '#'}" target="_blank" class="btn btn-primary" style="padding: 8px 16px; font-size: 0.8rem; text-decoration: none;">
+                                    Enroll <i class="fas fa-arrow-right"></i>
+                                </a>
+                            </div>
+                        </div>
+                    </div>`).join('')}
+                </div>`
+            : `
+                <p class="text-muted">No courses available in this category yet.</p>`;
+        return `
+            <div id="${categoryId(category)}-category" class="course-category-content" style="display: ${index === 0 ? 'block' : 'none'};">
+                <h4 style="color: var(--accent); margin-bottom: 15px; font-size: 1.1rem;">
+                    <i class="fas ${icon}"></i> ${emoji}
+                    ${escapeHtml(category)}
+                </h4>${body}
+            </div>`;
+    }).join('');
+
+    const empty = data.items.length ? '' : `
+            <div style="text-align: center; padding: 40px; background: rgba(255,255,255,0.02); border-radius: 12px;">
+                <i class="fas fa-book-reader fa-3x" style="color: var(--text-muted); margin-bottom: 15px;"></i>
+                <p class="text-muted">No course recommendations available yet. Try adding more skills to your profile!</p>
+            </div>`;
+
+    return `
+        <!-- Dynamic Course Category Tabs -->
+        <div class="course-tabs" style="display: flex; flex-wrap: wrap; gap: 10px; margin-bottom: 30px; border-bottom: 1px solid rgba(255,255,255,0.1); padding-bottom: 15px;">${tabs}
+        </div>
+
+        <!-- Dynamic Course Category Sections -->${sections}${empty}`;
+}
+
+function renderVideoCards(videos, button) {
+    return videos.map(video => `
+            <div class="video-square-card">
+                <h5 style="font-size: 0.85rem; margin-bottom: 6px; font-weight: 600; text-align: center; line-height: 1.2;">${escapeHtml(video.video_title)}</h5>
+                <div class="video-square-container">
+                    <iframe src="${escapeHtml(video.video_url)}" style="width: 100%; height: 100%; border: none; border-radius: 6px;" allowfullscreen></iframe>
+                </div>
+                <a href="${escapeHtml((video.video_url || '').split('embed/').join('watch?v='))}" target="_blank" class="btn ${button}" style="width: 100%; justify-content: center; font-size: 0.75rem; margin-top: 6px; padding: 6px;">
+                    <i class="fas fa-external-link-alt" style="margin-right: 2px;"></i>Watch
+                </a>
+            </div>`).join('');
+}
+
+function renderVideos(data) {
+    const inCategory = category => data.items.filter(video => video.category === category);
+
+    const nav = data.categories.map((category, index) => `
+            <a href="#${categoryId(category)}-videos" class="video-nav-link ${index === 0 ? 'active' : ''}" data-section="${categoryId(category)}">
+                <i class="fas ${categoryIcon(category, true).icon}"></i>
+                <span>${escapeHtml(category)}</span>
+            </a>`).join('');
+
+    const sections = data.categories.map(category => {
+        const videos = inCategory(category);
+        if (!videos.length) return '';
+        const {icon, emoji} = categoryIcon(category, true);
+        return `
+            <div id="${categoryId(category)}-videos" class="video-main-category">
+                <h3 style="color: var(--primary); margin-bottom: 25px; font-size: 1.4rem; text-align: center; padding: 15px; background: linear-gradient(135deg, rgba(37, 99, 235, 0.1), rgba(59, 130, 246, 0.1)); border-radius: 15px; border-left: 4px solid var(--primary);">
+                    <i class="fas ${icon}"></i> ${emoji} ${escapeHtml(category)}
+                </h3>
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 30px;">
+                    <div class="video-category-card">
+                        <h4 style="color: var(--accent); margin-bottom: 20px; font-size: 1.1rem; text-align: center; padding: 12px; background: rgba(37, 99, 235, 0.08); border-radius: 10px; border: 1px solid rgba(37, 99, 235, 0.2);">
+                            <i class="fas fa-play-circle"></i> 📹 Available Tutorials
+                        </h4>
+                        <div class="video-grid-horizontal">${renderVideoCards(videos, 'btn-primary')}
+                        </div>
+                    </div>
+                </div>
+            </div>`;
+    }).join('');
+
+    const empty = data.items.length ? '' : `
+        <div style="text-align: center; padding: 40px; background: rgba(255,255,255,0.02); border-radius: 12px;">
+            <i class="fas fa-video fa-3x" style="color: var(--text-muted); margin-bottom: 15px;"></i>
+            <p class="text-muted">No educational videos available at the moment.</p>
+        </div>`;
+
+    return `
+        <!-- Sticky Navigation Header -->
+        <div class="video-sticky-nav">${nav}
+            <a href="#career-videos" class="video-nav-link" data-section="career">
+                <i class="fas fa-compass"></i>
+                <span>Career Guidance</span>
+            </a>
+            <a href="#soft-skills-videos" class="video-nav-link" data-section="soft-skills">
+                <i class="fas fa-users"></i>
+                <span>Soft Skills & Placement</span>
+            </a>
+        </div>
+
+        <!-- Video Content Sections -->
+        <div class="video-content-sections">
+            <!-- Course Category Video Sections -->${sections}
+
+            <!-- 2️⃣ Career Guidance Videos Section -->
+            <div id="career-videos" class="video-main-category">
+                <h3 style="color: var(--success); margin-bottom: 25px; font-size: 1.4rem; text-align: center; padding: 15px; background: linear-gradient(135deg, rgba(34, 197, 94, 0.1), rgba(16, 185, 129, 0.1)); border-radius: 15px; border-left: 4px solid var(--success);">
+                    <i class="fas fa-compass"></i> 🧭 Career Guidance Videos
+                </h3>
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 30px;">
+                    <div class="video-category-card">
+                        <h4 style="color: var(--success); margin-bottom: 20px; font-size: 1.1rem; text-align: center; padding: 12px; background: rgba(34, 197, 94, 0.08); border-radius: 10px; border: 1px solid rgba(34, 197, 94, 0.2);">
+                            <i class="fas fa-compass"></i> 🎯 Career Development
+                        </h4>
+                        <div class="video-grid-horizontal">${renderVideoCards(inCategory('Career Guidance'), 'btn-success')}
+                        </div>
+                    </div>
+                </div>
+            </div>
+
+            <!-- 3️⃣ Soft Skills & Placement Prep Videos Section -->
+            <div id="soft-skills-videos" class="video-main-category">
+                <h3 style="color: var(--warning); margin-bottom: 25px; font-size: 1.4rem; text-align: center; padding: 15px; background: linear-gradient(135deg, rgba(245, 158, 11, 0.1), rgba(251, 191, 36, 0.1)); border-radius: 15px; border-left: 4px solid var(--warning);">
+                    <i class="fas fa-users"></i> 🤝 Soft Skills & Placement Prep Videos
+                </h3>
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 30px;">
+                    <div class="video-category-card">
+                        <h4 style="color: var(--warning); margin-bottom: 20px; font-size: 1.1rem; text-align: center; padding: 12px; background: rgba(245, 158, 11, 0.08); border-radius: 10px; border: 1px solid rgba(245, 158, 11, 0.2);">
+                            <i class="fas fa-handshake"></i> 🎭 Communication & Soft Skills
+                        </h4>
+                        <div class="video-grid-horizontal">${renderVideoCards(inCategory('Soft Skills & Placement Prep'), 'btn-warning')}
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+        <!-- End Video Content Sections -->${empty}`;
+}
+
+const RENDERERS = {
+    'trends': renderTrends,
+    'report-matches': renderReportMatches,
+    'recommendations': renderRecommendations,
+    'courses': renderCourses,
+    'videos': renderVideos,
+};
+
+// Fill the section's panels that have not been loaded yet
+function loadTab(sectionId) {
+    const section = document.getElementById(sectionId);
+    if (!section) return;
+    section.querySelectorAll('[data-panel][data-src]:not([data-loaded])').forEach(panel => {
+        panel.setAttribute('data-loaded', 'loading');
+        fetchAll(panel.getAttribute('data-src'))
+            .then(data => {
+                panel.innerHTML = RENDERERS[panel.getAttribute('data-panel')](data);
+                panel.setAttribute('data-loaded', 'done');
+                if (panel.getAttribute('data-panel') === 'videos') bindVideoNav();
+            })
+            .catch(error => {
+                console.error(error);
+                panel.removeAttribute('data-loaded');  // retried when the tab is opened again
+                panel.innerHTML = '<p class="text-muted">Could not load this section. Open the tab again to retry.</p>';
+            });
+    });
+}
+
+// The section the page opens on: the URL fragment's (see window.onload), else the active one
+document.addEventListener('DOMContentLoaded', function() {
+    const hash = window.location.hash.substring(1);
+    const active = document.querySelector('.dashboard-section.active');
+    if (hash && document.getElementById(hash)) loadTab(hash);
+    else if (active) loadTab(active.id);
+});
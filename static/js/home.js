@@ -0,0 +1,97 @@
+// Theme Toggle Functionality
+function toggleTheme() {
+  const body = document.body;
+  const themeToggle = document.querySelector('.theme-toggle');
+  const icon = themeToggle.querySelector('i');
+
+  body.classList.toggle('dark-mode');
+
+  if (body.classList.contains('dark-mode')) {
+    icon.className = 'fas fa-sun';
+    localStorage.setItem('theme', 'dark');
+  } else {
+    icon.className = 'fas fa-moon';
+    localStorage.setItem('theme', 'light');
+  }
+}
+
+// Load saved theme
+document.addEventListener('DOMContentLoaded', function() {
+  const savedTheme = localStorage.getItem('theme');
+  const themeToggle = document.querySelector('.theme-toggle');
+  const icon = themeToggle.querySelector('i');
+
+  if (savedTheme === 'dark') {
+    document.body.classList.add('dark-mode');
+    icon.className = 'fas fa-sun';
+  } else {
+    icon.className = 'fas fa-moon';
+  }
+});
+
+// Smooth scrolling for navigation links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+  anchor.addEventListener('click', function (e) {
+    e.preventDefault();
+    const target = document.querySelector(this.getAttribute('href'));
+    if (target) {
+      target.scrollIntoView({
+        behavior: 'smooth',
+        block: 'start'
+      });
+    }
+  });
+});
+
+// Scroll to top functionality
+function scrollToTop() {
+  window.scrollTo({
+    top: 0,
+    behavior: 'smooth'
+  });
+}
+
+// Show/hide scroll to top button and get started CTA
+window.addEventListener('scroll', function() {
+  const scrollButton = document.querySelector('.scroll-to-top');
+  const getStartedCTA = document.querySelector('.get-started-cta');
+
+  if (window.pageYOffset > 300) {
+    scrollButton.classList.add('show');
+    getStartedCTA.classList.add('show');
+  } else {
+    scrollButton.classList.remove('show');
+    getStartedCTA.classList.remove('show');
+  }
+});
+
+// Intersection Observer for animations
+const observerOptions = {
+  threshold: 0.1,
+  rootMargin: '0px 0px -50px 0px'
+};
+
+const observer = new IntersectionObserver(function(entries) {
+  entries.forEach(entry => {
+    if (entry.isIntersecting) {
+      entry.target.style.opacity = '1';
+      entry.target.style.transform = 'translateY(0)';
+    }
+  });
+}, observerOptions);
+
+// Observe feature cards for animation
+document.querySelectorAll('.feature-card').forEach(card => {
+  card.style.opacity = '0';
+  card.style.transform = 'translateY(30px)';
+  card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+  observer.observe(card);
+});
+
+// Observe testimonial cards for animation
+document.querySelectorAll('.testimonial-card').forEach(card => {
+  card.style.opacity = '0';
+  card.style.transform = 'translateY(30px)';
+  card.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+  observer.observe(card);
+});
@@ -0,0 +1,178 @@
+"""
+Storage Backends
+Where app.py, 1.py and 2.py keep their data, chosen with
+``app.config["STORAGE"]`` (``FLASK_STORAGE=memory`` in the environment):
+
+* ``sqlite`` -- data.db on disk (the default).
+* ``memory`` -- a private in-memory database with the current schema,
+  preloaded from jobs.csv, students.csv and applications.csv. Nothing is read
+  from data.db or written to disk, so tests, load tests and recommendation
+  benchmarks start from the same rows every run. ``scale``
+  (``FLASK_STORAGE_SCALE``) repeats every CSV row that many times, with
+  skills redrawn from a seeded RNG, for large synthetic catalogues.
+
+Both expose ``db_path`` (a file path or a ``file:`` URI that db.connect opens
+anywhere a path is expected), a ConnectionPool ``pool``, the pool's
+``fetchall``/``execute``/``executemany``, ``artifact_path`` for the vector,
+ANN and prediction caches, and ``close``.
+
+Usage: python storage.py [--scale 100]   (build a memory store, print load time and row counts)
+"""
+
+import os
+import csv
+import json
+import time
+import uuid
+import random
+import shutil
+import argparse
+import tempfile
+from db import ConnectionPool, connect
+from migrations import migrate
+import insights
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(APP_DIR, "data.db")
+DEFAULT_PASSWORD = "student123"  # login for the students loaded from students.csv
+
+
+class SQLiteStorage:
+    """data.db (or any database file) behind a connection pool"""
+
+    name = "sqlite"
+
+    def __init__(self, db_path=DB_PATH, pool_size=8):
+        self.db_path = db_path
+        self.pool = ConnectionPool(db_path, size=pool_size)
+
+    def fetchall(self, query, params=()):
+        return self.pool.fetchall(query, params)
+
+    def execute(self, query, params=()):
+        return self.pool.execute(query, params)
+
+    def executemany(self, query, seq_of_params):
+        return self.pool.executemany(query, seq_of_params)
+
+    def artifact_path(self, path):
+        """Where a cache file derived from this database's rows is kept"""
+        return path
+
+    def close(self):
+        self.pool.close()
+
+
+class MemoryStorage(SQLiteStorage):
+    """
+    In-memory SQLite (the ``memdb`` VFS, SQLite 3.36+) loaded from the bundled
+    CSVs. Unlike a shared-cache ``:memory:`` database it locks like a file, so
+    concurrent connections wait out the busy timeout instead of failing.
+    """
+
+    name = "memory"
+
+    def __init__(self, data_dir=APP_DIR, scale=1, seed=0, pool_size=8):
+        self.scale = max(1, int(scale))
+        self.seed = seed
+        db_path = f"file:/storage-{uuid.uuid4().hex}?vfs=memdb"
+        # The database exists while at least one connection to it is open
+        self._keeper = connect(db_path, check_same_thread=False)
+        self._artifact_dir = tempfile.mkdtemp(prefix="storage-")
+        super().__init__(db_path, pool_size)
+        migrate(db_path)
+        self.counts = self.load_csv(data_dir)
+
+    def artifact_path(self, path):
+        # Caches built from generated rows must never replace the ones for data.db
+        return os.path.join(self._artifact_dir, os.path.basename(path))
+
+    def load_csv(self, data_dir):
+        """Insert ``scale`` copies of every CSV row; returns the row counts"""
+        rnd = random.Random(self.seed)
+        jobs = _read_csv(os.path.join(data_dir, "jobs.csv"))
+        students = _read_csv(os.path.join(data_dir, "students.csv"))
+        applications = _read_csv(os.path.join(data_dir, "applications.csv"))
+        vocabulary = sorted({s for row in jobs for s in row["requirements"].split(";") if s})
+
+        job_ids, job_rows = {}, []
+        student_ids, user_rows, profile_rows = {}, [], []
+        for copy in range(self.scale):
+            for row in jobs:
+                skills = row["requirements"].split(";")
+                if copy:
+                    skills = rnd.sample(vocabulary, min(len(skills), len(vocabulary)))
+                job_ids[(copy, row["job_id"])] = len(job_rows) + 1
+                job_rows.append((len(job_rows) + 1, row["title"], row["description"], ", ".join(skills),
+                                 row["company"], row["posted_at"]))
+            for row in students:
+                rated = [(s["name"], s.get("rating", 3)) for s in json.loads(row["tech_stacks"] or "[]")]
+                if copy:
+                    rated = [(name, rnd.randint(1, 5)) for name in rnd.sample(vocabulary, min(len(rated), len(vocabulary)))]
+                uid = len(user_rows) + 1
+                suffix = f"_{copy}" if copy else ""
+                username = row["username"] + suffix
+                student_ids[(copy, row["student_id"])] = uid
+                user_rows.append((uid, username, f"{username}@example.edu", DEFAULT_PASSWORD, "student"))
+                profile_rows.append((uid, row["name"], row["register_number"] + suffix, row["college"], row["batch_year"],
+                                     row["semester"], ", ".join(n for n, _ in rated), ",".join(str(r) for _, r in rated),
+                                     row["experience_years"], row["interests"].replace(";", ", "), row["place"]))
+
+        # Applications become each student's stored recommendations, so dashboards have rows to read
+        recommendation_rows = [
+            (student_ids[(copy, row["student_id"])], job_ids[(copy, row["job_id"])], float(row["final_score"]),
+             f"{row['status']} application", row["applied_at"])
+            for copy in range(self.scale) for row in applications
+            if (copy, row["student_id"]) in student_ids and (copy, row["job_id"]) in job_ids]
+
+        with self.pool.connection() as conn:
+            conn.executemany("INSERT INTO jobs (id, title, description, required_skills, posted_by, created_at) "
+                             "VALUES (?,?,?,?,?,?)", job_rows)
+            conn.executemany("INSERT INTO users (id, username, email, password, role) VALUES (?,?,?,?,?)", user_rows)
+            conn.executemany("INSERT INTO student_profile (user_id, full_name, register_number, college_name, batch_year, "
+                             "current_semester, skills, skill_ratings, experience, interests, location) "
+                             "VALUES (?,?,?,?,?,?,?,?,?,?,?)", profile_rows)
+            conn.executemany("INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason, created_at) "
+                             "VALUES (?,?,?,?,?)", recommendation_rows)
+            insights.refresh(conn, [row[0] for row in user_rows])
+        return {"jobs": len(job_rows), "students": len(user_rows), "recommendations": len(recommendation_rows)}
+
+    def close(self):
+        super().close()
+        self._keeper.close()
+        shutil.rmtree(self._artifact_dir, ignore_errors=True)
+
+
+BACKENDS = {SQLiteStorage.name: SQLiteStorage, MemoryStorage.name: MemoryStorage}
+
+
+def open_storage(backend="sqlite", db_path=DB_PATH, scale=1, seed=0):
+    """The backend named by ``app.config["STORAGE"]``"""
+    if backend == SQLiteStorage.name:
+        return SQLiteStorage(db_path)
+    if backend == MemoryStorage.name:
+        return MemoryStorage(scale=scale, seed=seed)
+    raise ValueError(f"Unknown storage backend '{backend}' (expected one of: {', '.join(BACKENDS)})")
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an in-memory store from the bundled CSVs")
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    storage = MemoryStorage(scale=args.scale, seed=args.seed)
+    elapsed = (time.perf_counter() - start) * 1000
+    counts = ", ".join(f"{n} {name}" for name, n in storage.counts.items())
+    print(f"Loaded {counts} in {elapsed:.0f} ms ({storage.db_path})")
+    storage.close()
+
+
+if __name__ == "__main__":
+    main()
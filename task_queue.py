@@ -0,0 +1,177 @@
+"""
+Background Task Queue
+A small job queue stored in the ``tasks`` table of data.db (created by
+migrations.py), so request handlers can hand slow work such as rescoring a
+student's recommendations to worker threads and return at once.
+
+* Deduplication: while a task for the same (kind, key) is still queued, a
+  new ``enqueue`` is a no-op -- ten quick profile saves rescore once.
+* One at a time per key: a queued task waits while another task for its
+  (kind, key) is running, so an older rescore can never finish after a newer
+  one and overwrite it.
+* Retries: a failed task is re-queued with exponential backoff until it
+  has used ``max_attempts``; a task whose worker died is reclaimed once its
+  lease expires.
+* Any process with access to data.db can run a ``Worker`` on the same table.
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from db import connect
+
+logger = logging.getLogger(__name__)
+
+
+class TaskQueue:
+    def __init__(self, db_path, max_attempts=3, backoff_seconds=2.0, lease_seconds=300):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.lease_seconds = lease_seconds
+
+    def _connect(self):
+        return connect(self.db_path, timeout=30, isolation_level=None)
+
+    def enqueue(self, kind, key, payload=None):
+        """Queue a task; returns False if one for (kind, key) is already waiting"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            # The partial unique index on queued (kind, key) turns a duplicate into an ignored insert
+            cur = conn.execute("""INSERT OR IGNORE INTO tasks (kind, key, payload, status, attempts, run_after, created_at, updated_at)
+                                  VALUES (?, ?, ?, 'queued', 0, ?, ?, ?)""",
+                               (kind, str(key), json.dumps(payload or {}), now, now, now))
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def claim(self):
+        """Mark the oldest runnable task as running and return it as a dict (None if idle)"""
+        now = time.time()
+        expired = now - self.lease_seconds
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Skip queued tasks whose key is still running on another worker (unless that lease expired)
+            row = conn.execute("""SELECT id, kind, key, payload, attempts FROM tasks t
+                                  WHERE (status = 'queued' AND run_after <= ?
+                                         AND NOT EXISTS (SELECT 1 FROM tasks r WHERE r.kind = t.kind AND r.key = t.key
+                                                         AND r.status = 'running' AND r.updated_at >= ?))
+                                     OR (status = 'running' AND updated_at < ?)
+                                  ORDER BY run_after, id LIMIT 1""", (now, expired, expired)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute("UPDATE tasks SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?", (now, row[0]))
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return {"id": row[0], "kind": row[1], "key": row[2], "payload": json.loads(row[3] or "{}"), "attempts": row[4] + 1}
+
+    def complete(self, task_id):
+        conn = self._connect()
+        try:
+            conn.execute("UPDATE tasks SET status = 'done', last_error = NULL, updated_at = ? WHERE id = ?", (time.time(), task_id))
+        finally:
+            conn.close()
+
+    def fail(self, task, error):
+        """Re-queue with backoff, or mark failed once ``max_attempts`` is used up"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            if task["attempts"] < self.max_attempts:
+                delay = self.backoff_seconds * 2 ** (task["attempts"] - 1)
+                conn.execute("UPDATE tasks SET status = 'queued', run_after = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                             (now + delay, str(error), now, task["id"]))
+            else:
+                conn.execute("UPDATE tasks SET status = 'failed', last_error = ?, updated_at = ? WHERE id = ?",
+                             (str(error), now, task["id"]))
+        except sqlite3.IntegrityError:
+            # A fresh task for the same key was queued meanwhile; it supersedes this retry
+            conn.execute("UPDATE tasks SET status = 'failed', last_error = ?, updated_at = ? WHERE id = ?",
+                         (str(error), now, task["id"]))
+        finally:
+            conn.close()
+
+    def pending(self, kind, key):
+        """True while a task for (kind, key) is queued or running"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT 1 FROM tasks WHERE kind = ? AND key = ? AND status IN ('queued', 'running') LIMIT 1",
+                               (kind, str(key))).fetchone()
+            return row is not None
+        finally:
+            conn.close()
+
+    def purge(self, older_than_seconds=86400):
+        """Delete finished tasks older than the given age; returns rows removed"""
+        conn = self._connect()
+        try:
+            return conn.execute("DELETE FROM tasks WHERE status IN ('done', 'failed') AND updated_at < ?",
+                                (time.time() - older_than_seconds,)).rowcount
+        finally:
+            conn.close()
+
+
+class Worker:
+    """Daemon threads that claim tasks and run ``handlers[kind](payload)``"""
+
+    def __init__(self, queue, handlers, threads=1, poll_seconds=0.5):
+        self.queue = queue
+        self.handlers = handlers
+        self.threads = threads
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for i in range(self.threads):
+            t = threading.Thread(target=self._run, name=f"task-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def notify(self):
+        """Skip the poll wait after an enqueue from this process"""
+        self._wake.set()
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+
+    def run_once(self):
+        """Claim and run a single task; returns False when nothing was runnable"""
+        task = self.queue.claim()
+        if task is None:
+            return False
+        handler = self.handlers.get(task["kind"])
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for task kind '{task['kind']}'")
+            handler(task["payload"])
+            self.queue.complete(task["id"])
+        except Exception as e:
+            logger.error(f"Task {task['id']} ({task['kind']} {task['key']}) failed on attempt {task['attempts']}: {e}")
+            self.queue.fail(task, e)
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Task worker error: {e}")
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
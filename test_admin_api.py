@@ -0,0 +1,97 @@
+"""
+Admin data API: keyset pages cover every row exactly once, projection and
+filters are applied, and totals are cached until invalidated.
+
+Run: python -m pytest test_admin_api.py
+"""
+
+import sqlite3
+import importlib
+import pytest
+from flask import Flask
+from migrations import migrate
+from admin_api import AdminAPI
+
+
+@pytest.fixture
+def client(tmp_path):
+    db = str(tmp_path / "admin.db")
+    migrate(db)
+    with sqlite3.connect(db) as conn:
+        conn.executemany("INSERT INTO jobs (title, required_skills, posted_by) VALUES (?, ?, ?)",
+                         [(f"Job {i}", "Python, SQL" if i % 3 == 0 else "Java", "admin" if i % 2 else "acme") for i in range(1, 121)])
+        conn.execute("INSERT INTO users (username, email, password, role) VALUES ('amy', 'amy@x.io', 'secret', 'student')")
+
+    def fetchall(query, params=()):
+        with sqlite3.connect(db) as conn:
+            return conn.execute(query, params).fetchall()
+
+    api = AdminAPI(fetchall)
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(api.blueprint)
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s["role"] = "admin"
+    c.api, c.db = api, db
+    return c
+
+
+def test_keyset_pages_cover_all_rows_newest_first(client):
+    ids, after = [], None
+    while True:
+        data = client.get("/admin/api/jobs", query_string={"limit": 50, **({"after": after} if after else {})}).json
+        ids.extend(item["id"] for item in data["items"])
+        assert data["total"] == 120
+        after = data["next_after"]
+        if after is None:
+            break
+    assert ids == list(range(120, 0, -1))
+
+
+def test_projection_and_filters(client):
+    data = client.get("/admin/api/jobs?fields=title&q=python&posted_by=acme").json
+    assert set(data["items"][0]) == {"id", "title"}
+    assert data["total"] == 20  # multiples of 6 up to 120
+    assert client.get("/admin/api/jobs?fields=title,salary").status_code == 400
+    users = client.get("/admin/api/users?fields=id,username,email").json["items"]
+    assert users == [{"id": 1, "username": "amy", "email": "amy@x.io"}]
+    assert client.get("/admin/api/users?fields=password").status_code == 400
+
+
+def test_total_is_cached_until_invalidated(client):
+    assert client.get("/admin/api/jobs").json["total"] == 120
+    with sqlite3.connect(client.db) as conn:
+        conn.execute("INSERT INTO jobs (title) VALUES ('New')")
+    assert client.get("/admin/api/jobs").json["total"] == 120
+    client.api.invalidate()
+    assert client.get("/admin/api/jobs").json["total"] == 121
+
+
+def test_count_cache_keeps_most_recent_filters(client):
+    client.api.max_counts = 3
+    for q in ["a", "b", "c", "a", "d"]:
+        client.get("/admin/api/jobs", query_string={"q": q})
+    cached = [params[0] for _, _, params in client.api._counts]
+    assert cached == ["%c%", "%a%", "%d%"]  # "b" was the least recently used
+
+
+def test_2py_students_tab_lists_the_rows_it_deletes(monkeypatch):
+    monkeypatch.setenv("FLASK_STORAGE", "memory")
+    portal = importlib.import_module("2")
+    portal.db_execute("INSERT INTO students (username, password, full_name, college, skills) "
+                      "VALUES ('amy', 'secret', 'Amy Lee', 'MIT', 'Python')")
+    c = portal.app.test_client()
+    with c.session_transaction() as s:
+        s["role"] = "admin"
+    items = c.get("/admin/api/students?fields=id,full_name,college_name,skills").json["items"]
+    assert [(s["full_name"], s["college_name"]) for s in items] == [("Amy Lee", "MIT")]
+    assert c.get("/admin/api/students?fields=password").status_code == 400
+    c.get(f"/delete/student/{items[0]['id']}")
+    assert c.get("/admin/api/students").json == {"items": [], "next_after": None, "total": 0}
+
+
+def test_requires_admin_session(client):
+    with client.session_transaction() as s:
+        s["role"] = "student"
+    assert client.get("/admin/api/jobs").status_code == 401
@@ -0,0 +1,61 @@
+"""
+IVF job index: recall@10 against the exact search, and searches pinned to
+the job store snapshot the index was built over.
+
+Run: python -m pytest test_ann_index.py
+"""
+
+import time
+import warnings
+import joblib
+import numpy as np
+from ann_index import IVFIndex, ExactIndex, recall_at_k
+from bench_scoring import synthetic_jobs, MODEL_PATH
+from job_vectors import Snapshot
+
+
+def vectorizer():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_PATH).named_steps["tfidf"]
+
+
+def snapshot(vec, n, seed=42, version=1):
+    return Snapshot(version, tuple(range(1000 * version, 1000 * version + n)), (), vec.transform(synthetic_jobs(n, seed)))
+
+
+def test_recall_at_10_against_exact_search():
+    vec = vectorizer()
+    jobs = snapshot(vec, 3000)
+    queries = vec.transform(synthetic_jobs(100, seed=7))
+    exact, ivf = ExactIndex(), IVFIndex()
+    exact.sync(jobs)
+    ivf.sync(jobs)
+    n_lists = len(ivf.state.centroids)
+    assert recall_at_k(ivf, exact, queries, 10, n_probe=n_lists) == 1.0
+    assert recall_at_k(ivf, exact, queries, 10, n_probe=8) >= 0.9
+    assert recall_at_k(ivf, exact, queries, 10, n_probe=8) >= recall_at_k(ivf, exact, queries, 10, n_probe=1)
+
+
+def test_search_stays_on_its_snapshot():
+    vec = vectorizer()
+    old, new = snapshot(vec, 400), snapshot(vec, 150, seed=3, version=2)
+    ivf = IVFIndex(n_lists=8)
+    ivf.sync(old)
+    state = ivf.state
+    query = vec.transform(synthetic_jobs(1, seed=7))
+
+    ivf.sync(new, background=True)
+    deadline = time.time() + 10
+    while ivf.state is state and time.time() < deadline:
+        time.sleep(0.01)
+    assert ivf.state.snapshot is new
+    # Positions from the state a request started with still address that state's rows
+    rows = ivf.candidates(query, 10, n_probe=8, state=state)
+    assert len(rows) == 10 and rows.max() < len(old.keys)
+    assert all(old.keys[r] < 2000 for r in rows)
+    assert np.all(ivf.candidates(query, 10, n_probe=8) < len(new.keys))
+    # Already current: no rebuild
+    current = ivf.state
+    ivf.sync(new, background=True)
+    assert ivf.state is current
@@ -0,0 +1,96 @@
+"""
+Static assets: the build fingerprints and precompresses static/css and
+static/js, templates link the built names, and responses are compressed.
+
+Run: python -m pytest test_assets.py
+"""
+
+import gzip
+from flask import Flask, render_template_string
+import assets
+import fragment_cache
+
+CSS = b"body { color: #222; }\n" * 100
+
+
+def make_app(tmp_path, built=True):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    (static / "css" / "site.css").write_bytes(CSS)
+    manifest = assets.build(str(static)) if built else {}
+    app = Flask(__name__, static_folder=str(static))
+    assets.Assets(app, str(static))
+
+    @app.route("/page")
+    def page():
+        tag = "abc123"
+        return fragment_cache.not_modified(tag) or fragment_cache.conditional(
+            render_template_string("<link href=\"{{ asset('css/site.css') }}\">" + "<p>text</p>" * 100), tag)
+
+    return app, manifest
+
+
+def test_build_fingerprints_and_serves_precompressed(tmp_path):
+    app, manifest = make_app(tmp_path)
+    built = manifest["css/site.css"]
+    assert built.startswith("site.") and built.endswith(".css") and built != "site.css"
+    with app.test_client() as c:
+        html = gzip.decompress(c.get("/page", headers={"Accept-Encoding": "gzip"}).data).decode()
+        assert f'href="/static/assets/{built}"' in html
+
+        r = c.get(f"/static/assets/{built}", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["Content-Encoding"] == "gzip" and r.mimetype == "text/css"
+        assert "immutable" in r.headers["Cache-Control"]
+        assert gzip.decompress(r.data) == CSS
+        assert c.get(f"/static/assets/{built}").data == CSS  # client without gzip
+
+
+def test_unbuilt_assets_fall_back_to_plain_files(tmp_path):
+    app, _ = make_app(tmp_path, built=False)
+    with app.test_client() as c:
+        assert b'href="/static/css/site.css"' in c.get("/page").data
+
+
+def test_compressed_pages_keep_conditional_get(tmp_path):
+    app, _ = make_app(tmp_path)
+    with app.test_client() as c:
+        r = c.get("/page", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["Content-Encoding"] == "gzip" and "Accept-Encoding" in r.headers["Vary"]
+        assert r.headers["ETag"] == '"abc123-gzip"'
+        again = c.get("/page", headers={"Accept-Encoding": "gzip", "If-None-Match": r.headers["ETag"]})
+        assert again.status_code == 304 and again.headers["ETag"] == '"abc123-gzip"'
+
+        plain = c.get("/page")
+        assert "Content-Encoding" not in plain.headers and plain.headers["ETag"] == '"abc123"'
+
+
+def test_rebuild_changes_page_etag_and_keeps_previous_files(tmp_path):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    (static / "css" / "site.css").write_bytes(CSS)
+    first = assets.build(str(static))["css/site.css"]
+    template = tmp_path / "page.html"
+    template.write_text("<link href=\"{{ asset('css/site.css') }}\">")
+    app = Flask(__name__, static_folder=str(static))
+    pages = fragment_cache.PageETag(str(template), assets=assets.Assets(app, str(static)))
+
+    @app.route("/page")
+    def page():
+        tag = pages.etag("user-1")
+        return fragment_cache.not_modified(tag) or fragment_cache.conditional(
+            render_template_string(template.read_text()), tag)
+
+    with app.test_client() as c:
+        etag = c.get("/page").headers["ETag"]
+        (static / "css" / "site.css").write_bytes(CSS + b"p { margin: 0; }\n")
+        second = assets.build(str(static))["css/site.css"]
+        # The page links the new file, so a cached copy is not revalidated as unchanged
+        r = c.get("/page", headers={"If-None-Match": etag})
+        assert r.status_code == 200 and second.encode() in r.data and r.headers["ETag"] != etag
+        # Pages still cached with the old name can load it until the build after next
+        assert c.get(f"/static/assets/{first}").status_code == 200
+
+        (static / "css" / "site.css").write_bytes(CSS * 2)
+        assets.build(str(static))
+        assert c.get(f"/static/assets/{first}").status_code == 404
+        assert c.get(f"/static/assets/{second}").status_code == 200
@@ -0,0 +1,119 @@
+"""
+Bulk recompute and single-job fan-out: recompute_all must write each
+student's rank_matches list, and fan_out_job must leave the same rows a
+full recompute after posting the job would.
+
+Run: python -m pytest test_batch_recommend.py
+"""
+
+import os
+import csv
+import random
+import warnings
+import joblib
+import pytest
+from db import connect
+from migrations import migrate
+from job_vectors import JobVectorStore, ProfileVectorStore, job_text, profile_text
+from scoring import similarity_scores, title_matches, rank_matches
+import batch_recommend
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+JOBS_CSV = os.path.join(APP_DIR, "jobs.csv")
+TOP_K = 3
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+
+
+@pytest.fixture(scope="module")
+def model():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_PATH)
+
+
+@pytest.fixture
+def db(tmp_path, model):
+    path = str(tmp_path / "batch.db")
+    migrate(path)
+    with open(JOBS_CSV, newline="", encoding="utf-8") as f:
+        jobs = [(row["title"], row["description"], row["requirements"]) for row in csv.DictReader(f)][:30]
+    rnd = random.Random(0)
+    vocab = list(model.named_steps["tfidf"].vocabulary_) + ["engineer", "developer"]
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO jobs (title, description, required_skills) VALUES (?, ?, ?)", jobs)
+        for uid in range(1, 41):
+            conn.execute("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         (uid, f"user{uid}", f"user{uid}@x.io"))
+            conn.execute("INSERT INTO student_profile (user_id, skills, interests) VALUES (?, ?, ?)",
+                         (uid, ", ".join(rnd.sample(vocab, rnd.randint(1, 6))), rnd.choice(["", "web", "data"])))
+    return path
+
+
+def stored(db):
+    with connect(db) as conn:
+        return sorted(conn.execute("SELECT user_id, job_id, match_score, match_reason FROM job_recommendations"))
+
+
+def expected(db, model):
+    """Each student's rank_matches list, scored one profile at a time"""
+    vectorizer = model.named_steps["tfidf"]
+    with connect(db) as conn:
+        jobs = conn.execute("SELECT id, title, description, required_skills FROM jobs ORDER BY id").fetchall()
+        profiles = conn.execute(f"SELECT {batch_recommend.PROFILE_COLUMNS} FROM student_profile").fetchall()
+    job_matrix = vectorizer.transform([job_text(j) for j in jobs])
+    titles = [(j[1] or "").lower() for j in jobs]
+    rows = []
+    for p in profiles:
+        text = profile_text(p)
+        label = str(model.predict([text])[0]).strip().lower()
+        sims = similarity_scores(vectorizer.transform([text]), job_matrix)
+        recs = rank_matches(sims, title_matches(label, titles), label, [j[0] for j in jobs], TOP_K)
+        rows.extend((p[0], r["job_id"], r["score"], r["reason"]) for r in recs)
+    return sorted(rows)
+
+
+def recompute(db, tmp_path):
+    return batch_recommend.recompute_all(db, MODEL_PATH, str(tmp_path / "jobs.pkl"), workers=1, top_k=TOP_K)
+
+
+def test_recompute_all_writes_rank_matches_rows(db, model, tmp_path):
+    with connect(db) as conn:
+        conn.execute("INSERT INTO job_recommendations (user_id, job_id, match_score) VALUES (1, 1, 0.99)")
+    stats = recompute(db, tmp_path)
+    rows = stored(db)
+    assert rows == expected(db, model)
+    assert (stats["students"], stats["jobs"], stats["rows"]) == (40, 30, len(rows))
+    assert (1, 1, 0.99, None) not in rows  # stale rows replaced
+
+
+def test_recompute_in_subprocess_uses_a_worker_pool(db, model, tmp_path):
+    code = batch_recommend.recompute_in_subprocess(db, MODEL_PATH, str(tmp_path / "jobs.pkl"), workers=2, top_k=TOP_K)
+    assert code == 0
+    assert stored(db) == expected(db, model)
+
+
+def test_fan_out_job_matches_full_recompute(db, model, tmp_path):
+    recompute(db, tmp_path)
+    job_store = JobVectorStore(model.named_steps["tfidf"], db, str(tmp_path / "jobs.pkl"))
+    profile_store = ProfileVectorStore(model, db, str(tmp_path / "profiles.pkl"))
+    job_store.load()
+    profile_store.load()
+
+    with connect(db) as conn:
+        job_id = conn.execute("INSERT INTO jobs (title, description, required_skills) VALUES (?, ?, ?)",
+                              ("Python Developer", "python sql flask web development", "Python;SQL;Flask")).lastrowid
+    job_store.upsert(job_id)
+    updated = batch_recommend.fan_out_job(job_id, job_store, profile_store, db, top_k=TOP_K)
+    assert updated > 0
+    fanned_out = stored(db)
+    assert sum(1 for row in fanned_out if row[1] == job_id) == updated
+
+    recompute(db, tmp_path)
+    assert fanned_out == stored(db)
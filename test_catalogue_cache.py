@@ -0,0 +1,53 @@
+"""
+Catalogue cache: hits until an explicit invalidation, a write from another
+connection (version trigger) or the TTL.
+
+Run: python -m pytest test_catalogue_cache.py
+"""
+
+import time
+import sqlite3
+from migrations import migrate
+from catalogue_cache import CatalogueCache
+
+QUERY = "SELECT title FROM courses ORDER BY id"
+
+
+def make_cache(tmp_path, **kwargs):
+    db = str(tmp_path / "catalogue.db")
+    migrate(db)
+
+    def fetchall(query, params=()):
+        with sqlite3.connect(db) as conn:
+            return conn.execute(query, params).fetchall()
+
+    fetchall("INSERT INTO courses (title) VALUES ('Python')")
+    return db, fetchall, CatalogueCache(fetchall, **kwargs)
+
+
+def test_hits_until_invalidated(tmp_path):
+    db, fetchall, cache = make_cache(tmp_path, check_interval=60)
+    assert cache.get(QUERY, tables=["courses"]) == [("Python",)]
+    fetchall("INSERT INTO courses (title) VALUES ('SQL')")
+    assert cache.get(QUERY, tables=["courses"]) == [("Python",)]  # version not re-read yet
+    cache.invalidate("courses")
+    assert cache.get(QUERY, tables=["courses"]) == [("Python",), ("SQL",)]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_write_by_another_process_is_seen_via_version(tmp_path):
+    db, fetchall, cache = make_cache(tmp_path, check_interval=0)
+    assert cache.get(QUERY, tables=["courses"]) == [("Python",)]
+    assert cache.get(QUERY, tables=["courses"]) == [("Python",)]
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE courses SET title = 'Python 3'")
+    assert cache.get(QUERY, tables=["courses"]) == [("Python 3",)]
+    assert cache.stats()["hit_ratio"] == round(1 / 3, 3)
+
+
+def test_ttl_expires_entries(tmp_path):
+    db, fetchall, cache = make_cache(tmp_path, ttl=0.01, check_interval=60)
+    cache.get(QUERY, tables=["courses"])
+    time.sleep(0.02)
+    cache.get(QUERY, tables=["courses"])
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,73 @@
+"""
+Course skill index: the same courses qualify as for the FTS5 query it
+replaced, ranked by how many skills they mention, and the index is rebuilt
+when the courses change.
+
+Run: python -m pytest test_course_index.py
+"""
+
+import random
+import sqlite3
+import pytest
+import search
+from catalogue_cache import CatalogueCache
+from course_index import CourseIndex, SKILLS, synthetic_db
+
+
+def reader(path):
+    def fetchall(query, params=()):
+        with sqlite3.connect(path) as conn:
+            return conn.execute(query, params).fetchall()
+    return fetchall
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "courses.db")
+    synthetic_db(path, 300)
+    with sqlite3.connect(path) as conn:
+        conn.executemany("INSERT INTO courses (title, description, category) VALUES (?, ?, ?)", [
+            ("Learning Machines", "machine-learning, machine   learning; MACHINE learning", None),
+            ("Machine Shop", "learning to weld", None),
+            ("C# for .NET", "c#/asp.net core and Node.js", "Programming Languages"),
+            ("Puppet", "configuration management", None),
+            ("Ansible and Puppet", None, "DevOps & Cloud"),
+            ("Ansible", None, None),
+        ])
+    return path
+
+
+def fts_ids(db, skills):
+    rows = search.search(reader(db), "courses", search.match_any(skills), limit=10000, select="t.id")
+    return {row[0] for row in rows}
+
+
+def test_same_courses_qualify_as_for_fts_query(db):
+    index = CourseIndex(CatalogueCache(reader(db), check_interval=0))
+    rnd = random.Random(1)
+    queries = [rnd.sample(SKILLS, rnd.randint(1, 6)) for _ in range(100)]
+    queries += [["Machine Learning"], ["C#", "c++"], ["node.js"], ["nothing here"], []]
+    for skills in queries:
+        assert {c.id for c in index.match(skills, limit=10000)} == fts_ids(db, skills), skills
+    assert index.stats()["builds"] == 1
+
+
+def test_ranked_by_skills_mentioned(db):
+    index = CourseIndex(CatalogueCache(reader(db), check_interval=0))
+    titles = {c.title for c in index.match(["machine learning"], limit=10000)}
+    assert "Learning Machines" in titles and "Machine Shop" not in titles  # the phrase, not just both words
+    # Both skills first, then one skill each in course ID order
+    assert [c.title for c in index.match(["Ansible", "puppet"])] == ["Ansible and Puppet", "Puppet", "Ansible"]
+
+
+def test_rebuilds_when_courses_change(db):
+    index = CourseIndex(CatalogueCache(reader(db), check_interval=0))
+    assert index.match(["terraform"]) == []
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO courses (title, category) VALUES ('Terraform Basics', 'DevOps & Cloud')")
+    assert [c.title for c in index.match(["terraform"])] == ["Terraform Basics"]
+    assert index.stats()["builds"] == 2
+
+    index.invalidate()
+    index.match(["terraform"])
+    assert index.stats()["builds"] == 3
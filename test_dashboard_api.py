@@ -0,0 +1,105 @@
+"""
+Dashboard tab API: pages with projection, the student's own matches only,
+per-app course picking, and 304 until a version stamp moves.
+
+Run: python -m pytest test_dashboard_api.py
+"""
+
+import sqlite3
+import pytest
+from flask import Flask
+from migrations import migrate
+from catalogue_cache import CatalogueCache
+from dashboard_api import DashboardAPI
+from db import connect
+import recommendation_store
+
+
+def make_client(tmp_path, **options):
+    db = str(tmp_path / "dashboard.db")
+    migrate(db)
+    with sqlite3.connect(db) as conn:
+        conn.executemany("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         [(i, f"user{i}", f"user{i}@x.io") for i in (1, 2)])
+        conn.executemany("INSERT INTO student_profile (user_id, full_name) VALUES (?, ?)", [(1, "Amy"), (2, "Ben")])
+        conn.executemany("INSERT INTO jobs (id, title) VALUES (?, ?)", [(i, f"Job {i}") for i in range(1, 6)])
+        conn.executemany("INSERT INTO courses (title, category) VALUES (?, ?)",
+                         [(f"Course {i}", "Web Development" if i % 2 else "Databases") for i in range(1, 8)])
+        conn.executemany("INSERT INTO course_videos (course_id, video_title, category) VALUES (?, ?, ?)",
+                         [(1, "Intro", "Web Development"), (None, "Interviews", "Career Guidance")])
+    with connect(db) as conn:
+        recommendation_store.replace_user(conn, 1, [{"job_id": j, "score": j / 10, "reason": "test"} for j in range(1, 6)])
+        recommendation_store.replace_user(conn, 2, [{"job_id": 1, "score": 0.9, "reason": "test"}])
+
+    def fetchall(query, params=()):
+        with sqlite3.connect(db) as conn:
+            return conn.execute(query, params).fetchall()
+
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(DashboardAPI(fetchall, CatalogueCache(fetchall, check_interval=0), **options).blueprint)
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s.update({"role": "student", "user_id": 1})
+    c.db = db
+    return c
+
+
+@pytest.fixture
+def client(tmp_path):
+    return make_client(tmp_path)
+
+
+def test_recommendations_page_and_projection(client):
+    data = client.get("/api/me/recommendations?fields=job_id,match_score&limit=2").json
+    assert data["items"] == [{"job_id": 5, "match_score": 0.5}, {"job_id": 4, "match_score": 0.4}]
+    assert (data["total"], data["next_offset"]) == (5, 2)
+    last = client.get("/api/me/recommendations?fields=title&offset=4&limit=2").json
+    assert last["items"] == [{"title": "Job 1"}] and last["next_offset"] is None
+
+    assert client.get("/api/me/recommendations?min_score=0.25").json["total"] == 3
+    assert client.get("/api/me/recommendations?fields=password").status_code == 400
+    with client.session_transaction() as s:
+        s.update({"role": "admin", "user_id": -1})
+    assert client.get("/api/me/recommendations").status_code == 401
+
+
+def test_catalogue_tabs(client):
+    courses = client.get("/api/courses?category=Databases&fields=title").json
+    assert courses["items"] == [{"title": "Course 6"}, {"title": "Course 4"}, {"title": "Course 2"}]
+    assert courses["categories"] == ["Web Development", "Databases"]  # newest course first
+    videos = client.get("/api/videos").json
+    assert [v["video_title"] for v in videos["items"]] == ["Interviews", "Intro"]
+    assert videos["items"][1]["course_title"] == "Course 1"
+    assert client.get("/api/trends").json["items"] == []
+
+    with client.session_transaction() as s:
+        s.clear()
+    assert client.get("/api/courses").status_code == 401
+
+
+def test_courses_picked_per_student(tmp_path):
+    client = make_client(tmp_path, courses_for=lambda uid: [], alphabetical=True)
+    data = client.get("/api/courses").json
+    assert data["items"] == [] and data["categories"] == ["Databases", "Web Development"]
+    with client.session_transaction() as s:
+        s.update({"role": "admin", "user_id": -1})
+    assert client.get("/api/courses").json["total"] == 7
+
+
+def test_not_modified_until_a_stamp_moves(client):
+    first = client.get("/api/me/recommendations")
+    etag = first.headers["ETag"]
+    assert client.get("/api/me/recommendations", headers={"If-None-Match": etag}).status_code == 304
+    # Another query string is another representation
+    assert client.get("/api/me/recommendations?limit=1", headers={"If-None-Match": etag}).status_code == 200
+
+    with connect(client.db) as conn:
+        recommendation_store.replace_user(conn, 1, [{"job_id": 2, "score": 0.7, "reason": "test"}])
+    changed = client.get("/api/me/recommendations", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.json["total"] == 1
+
+    courses = client.get("/api/courses").headers["ETag"]
+    with sqlite3.connect(client.db) as conn:
+        conn.execute("INSERT INTO courses (title, category) VALUES ('New', 'Cloud')")
+    assert client.get("/api/courses", headers={"If-None-Match": courses}).json["total"] == 8
@@ -0,0 +1,71 @@
+"""
+Connection pool: connections are reused rather than reopened, every one
+runs with the WAL pragmas, and a failed block is rolled back.
+
+Run: python -m pytest test_db.py
+"""
+
+import sqlite3
+import threading
+import pytest
+from db import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2)
+    pool.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield pool
+    pool.close()
+
+
+def test_sequential_calls_reuse_one_connection(pool):
+    with pool.connection() as first:
+        pass
+    for i in range(20):
+        pool.execute("INSERT INTO items (name) VALUES (?)", (f"item{i}",))
+        assert pool.fetchall("SELECT COUNT(*) FROM items") == [(i + 1,)]
+    with pool.connection() as last:
+        assert last is first
+    stats = pool.stats()
+    assert (stats["connections"], stats["checkouts"], stats["waits"]) == (1, 43, 0)
+
+
+def test_connections_use_wal_pragmas(pool):
+    with pool.connection() as a, pool.connection() as b:
+        for conn in (a, b):
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            assert conn.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+            assert conn.execute("PRAGMA foreign_keys").fetchone() == (1,)
+            assert conn.execute("PRAGMA busy_timeout").fetchone() == (5000,)
+            assert conn.execute("PRAGMA temp_store").fetchone() == (2,)  # MEMORY
+    assert pool.stats()["connections"] == 2
+
+
+def test_waits_for_a_free_connection_when_all_are_busy(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1)
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait(5)
+    threading.Timer(0.05, release.set).start()
+    assert pool.fetchall("SELECT 1") == [(1,)]
+    thread.join()
+    assert (pool.stats()["connections"], pool.stats()["waits"]) == (1, 1)
+    pool.close()
+
+
+def test_failed_block_rolls_back(pool):
+    with pytest.raises(sqlite3.IntegrityError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'a')")
+            conn.execute("INSERT INTO items (id, name) VALUES (1, 'b')")
+    assert pool.fetchall("SELECT COUNT(*) FROM items") == [(0,)]
+    assert pool.stats()["connections"] == 1
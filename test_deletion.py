@@ -0,0 +1,72 @@
+"""
+Deletes: cascades remove dependent rows, bulk deletes are all-or-nothing,
+and compact_db.py purges orphans left by older deletes.
+
+Run: python -m pytest test_deletion.py
+"""
+
+import sqlite3
+import pytest
+from db import connect
+from migrations import migrate
+from deletion import delete_ids, parse_ids
+from compact_db import compact
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "delete.db")
+    migrate(path)
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         [(i, f"user{i}", f"user{i}@x.io") for i in range(1, 4)])
+        conn.executemany("INSERT INTO student_profile (user_id, full_name) VALUES (?, ?)", [(i, f"User {i}") for i in range(1, 4)])
+        conn.executemany("INSERT INTO jobs (id, title) VALUES (?, ?)", [(i, f"Job {i}") for i in range(1, 1201)])
+        conn.executemany("INSERT INTO job_recommendations (user_id, job_id, match_score) VALUES (?, ?, 0.5)",
+                         [(u, j) for u in range(1, 4) for j in (1, 2, 3)])
+        conn.execute("INSERT INTO courses (id, title) VALUES (1, 'SQL')")
+        conn.execute("INSERT INTO course_videos (course_id, video_title) VALUES (1, 'Joins')")
+    return path
+
+
+def count(path, query):
+    with connect(path) as conn:
+        return conn.execute(query).fetchone()[0]
+
+
+def test_deleting_users_and_jobs_cascades(db):
+    with connect(db) as conn:
+        assert delete_ids(conn, "user", [1, 2]) == (2, [1, 2])
+        assert delete_ids(conn, "job", [3]) == (1, [])
+        assert delete_ids(conn, "course", [1]) == (1, [])
+    assert count(db, "SELECT COUNT(*) FROM student_profile") == 1
+    assert count(db, "SELECT COUNT(*) FROM job_recommendations") == 2  # user 3, jobs 1 and 2
+    assert count(db, "SELECT COUNT(*) FROM course_videos WHERE course_id IS NULL") == 1
+
+
+def test_bulk_delete_spans_batches_in_one_transaction(db):
+    with pytest.raises(sqlite3.OperationalError):
+        with connect(db) as conn:
+            delete_ids(conn, "job", range(1, 1001))
+            conn.execute("SELECT * FROM no_such_table")
+    assert count(db, "SELECT COUNT(*) FROM jobs") == 1200
+    with connect(db) as conn:
+        assert delete_ids(conn, "job", "1,2," + ",".join(map(str, range(3, 1001))))[0] == 1000
+    assert count(db, "SELECT COUNT(*) FROM jobs") == 200
+    with pytest.raises(ValueError):
+        parse_ids(["7", "x"])
+
+
+def test_compact_purges_orphans_from_older_deletes(db):
+    with sqlite3.connect(db) as conn:  # plain connection: no foreign-key enforcement, like the old code paths
+        conn.execute("DELETE FROM users WHERE id = 1")
+        conn.execute("DELETE FROM jobs WHERE id = 2")
+    result = compact(db, dry_run=True)
+    assert result["orphans"][("student_profile", "user_id")] == 1
+    assert count(db, "SELECT COUNT(*) FROM job_recommendations") == 9
+    result = compact(db)
+    assert result["orphans"][("job_recommendations", "user_id")] == 3
+    assert result["orphans"][("job_recommendations", "job_id")] == 2  # user 1's row for job 2 went with user 1
+    assert count(db, "SELECT COUNT(*) FROM job_recommendations") == 4
+    assert count(db, "SELECT COUNT(*) FROM student_profile") == 2
+    assert compact(db, dry_run=True)["orphans"][("job_recommendations", "job_id")] == 0
@@ -0,0 +1,44 @@
+"""
+Parity check: the indexed FastKNN step must predict exactly what the
+bundled KNeighborsClassifier predicts, including tie-breaks.
+
+Run: python -m pytest test_fast_knn.py
+"""
+
+import os
+import random
+import warnings
+import joblib
+from fast_knn import FastKNN, accelerate
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "job_recommendation_type_knn.pkl")
+
+
+def load_model():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_PATH)
+
+
+def random_texts(model, n, seed=0):
+    rnd = random.Random(seed)
+    vocab = list(model.named_steps["tfidf"].vocabulary_) + ["web", "development", "unknownword"]
+    return [" ".join(rnd.sample(vocab, rnd.randint(0, 8))) for _ in range(n)] + ["", "nothing known here"]
+
+
+def test_accelerated_model_predicts_like_sklearn():
+    model = load_model()
+    fast = accelerate(model)
+    assert isinstance(fast.named_steps["knn"], FastKNN)
+    texts = random_texts(model, 2000)
+    assert list(fast.predict(texts)) == list(model.predict(texts))
+    for text in texts[:300]:
+        assert fast.predict([text])[0] == model.predict([text])[0]
+
+
+def test_neighbour_sets_match():
+    model = load_model()
+    X = model.named_steps["tfidf"].transform(random_texts(model, 500, seed=1))
+    _, expected = model.named_steps["knn"].kneighbors(X)
+    got = FastKNN(model.named_steps["knn"]).kneighbors(X)
+    assert [sorted(r) for r in got.tolist()] == [sorted(r) for r in expected.tolist()]
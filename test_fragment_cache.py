@@ -0,0 +1,64 @@
+"""
+Dashboard page ETags: a repeat request with the page's ETag gets 304, and a
+moved stamp or an edited template renders again.
+
+Run: python -m pytest test_fragment_cache.py
+"""
+
+from flask import Flask, render_template_string
+import fragment_cache
+
+PAGE = '{% for i in items %}<i>{{ i }}</i>{% endfor %}'
+
+
+def make_app(tmp_path):
+    template = tmp_path / "page.html"
+    template.write_text(PAGE)
+    pages = fragment_cache.PageETag(str(template))
+    app = Flask(__name__)
+    state = {"items": [1, 2], "version": 1, "renders": 0}
+
+    @app.route("/page")
+    def page():
+        tag = pages.etag(state["version"])
+        unchanged = fragment_cache.not_modified(tag)
+        if unchanged:
+            return unchanged
+        state["renders"] += 1
+        return fragment_cache.conditional(render_template_string(template.read_text(), items=state["items"]), tag)
+
+    return app, state, template
+
+
+def test_conditional_get(tmp_path):
+    app, state, template = make_app(tmp_path)
+    with app.test_client() as c:
+        first = c.get("/page")
+        assert first.data == b"<i>1</i><i>2</i>"
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        etag = first.headers["ETag"]
+        repeat = c.get("/page", headers={"If-None-Match": etag})
+        assert repeat.status_code == 304 and repeat.headers["ETag"] == etag
+        assert state["renders"] == 1
+
+        state["version"], state["items"] = 2, [3]
+        changed = c.get("/page", headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.headers["ETag"] != etag
+        assert changed.data == b"<i>3</i>"
+
+
+def test_edited_template_changes_etag(tmp_path):
+    app, state, template = make_app(tmp_path)
+    with app.test_client() as c:
+        etag = c.get("/page").headers["ETag"]
+        template.write_text(PAGE + " ")
+        assert c.get("/page", headers={"If-None-Match": etag}).status_code == 200
+    assert state["renders"] == 2
+
+
+def test_no_tag_sends_no_validators():
+    app = Flask(__name__)
+    with app.test_request_context():
+        assert fragment_cache.not_modified(None) is None
+        response = fragment_cache.conditional("<p>", None)
+        assert response.headers.get("ETag") is None
@@ -0,0 +1,74 @@
+"""
+Insight snapshots: built by the recommendation writer, kept in step with job
+and profile deletes, and matching what the dashboard used to compute inline.
+
+Run: python -m pytest test_insights.py
+"""
+
+import pytest
+from db import connect
+from migrations import migrate
+from records import StudentProfile
+from deletion import delete_ids
+import insights
+import recommendation_store
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "insights.db")
+    migrate(path)
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         [(i, f"user{i}", f"user{i}@x.io") for i in (1, 2)])
+        conn.execute("INSERT INTO student_profile (user_id, full_name, skills, tech_stack, experience) "
+                     "VALUES (1, 'Amy', 'Python, SQL, Docker', 'Flask', 'two years')")
+        conn.execute("INSERT INTO student_profile (user_id, full_name) VALUES (2, 'Ben')")
+        conn.executemany("INSERT INTO jobs (id, title) VALUES (?, ?)", [(i, f"Job {i}") for i in range(1, 8)])
+    return path
+
+
+def snapshot(path, uid):
+    with connect(path) as conn:
+        return insights.load(lambda q, p=(): conn.execute(q, p).fetchall(), uid)
+
+
+def test_compute_matches_dashboard_rules():
+    profile = StudentProfile(1, 9, "Amy", None, None, None, None, "Python", None, None, None, "Flask, React", None, None)
+    s = insights.compute(profile, 2, [("Dev", 0.876), ("Ops", 0.5)])
+    assert s.completeness == 27  # 3 of 11 fields
+    assert insights.marked(s) == ["⚠ Add more skills to improve ATS matching",
+                                  "✓ Diverse tech stack increases job opportunities",
+                                  "✓ Some job matches generated"]
+    assert (s.confidence, s.top_jobs) == (87, [("Dev", 87), ("Ops", 50)])
+
+    empty = insights.compute(profile._replace(skills=None, tech_stack=None), 0, [])
+    assert insights.plain(empty)[0] == "Complete your profile for better recommendations"
+    assert (empty.confidence, empty.top_jobs) == (0, [])
+
+
+def test_writer_refreshes_snapshot_in_same_commit(db):
+    results = [{"job_id": j, "score": j / 10, "reason": "test"} for j in range(1, 8)]
+    with connect(db) as conn:
+        recommendation_store.replace_user(conn, 1, results)
+    s = snapshot(db, 1)
+    assert s.rec_count == 7
+    assert s.top_jobs == [("Job 7", 70), ("Job 6", 60), ("Job 5", 50), ("Job 4", 40), ("Job 3", 30)]
+    assert s.confidence == 70
+    assert insights.marked(s)[-1] == "✓ Multiple job matches found - good profile strength"
+
+    with connect(db) as conn:
+        delete_ids(conn, "job", [7, 6, 5, 4, 3])
+    version = s.version
+    s = snapshot(db, 1)
+    assert (s.rec_count, s.confidence) == (2, 20)
+    assert s.version == version + 1  # the dashboard's cache stamp moved
+    assert insights.marked(s)[-1] == "✓ Some job matches generated"
+
+
+def test_snapshot_goes_with_the_profile(db):
+    with connect(db) as conn:
+        assert insights.refresh(conn, [1, 2, 3]) == 2  # user 3 has no profile
+        delete_ids(conn, "user", [1])
+    assert snapshot(db, 1) is None
+    assert snapshot(db, 2).completeness == 9
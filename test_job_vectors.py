@@ -0,0 +1,158 @@
+"""
+Job vector store: row deltas (upsert/remove) must leave the same matrix a
+full rebuild from the jobs table produces without rebuilding on the write
+path, and the disk snapshot is reused only while the table version matches.
+
+Run: python -m pytest test_job_vectors.py
+"""
+
+import os
+import time
+import warnings
+import joblib
+import pytest
+from db import connect
+from migrations import migrate
+from job_vectors import JobVectorStore, job_text
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "job_recommendation_type_knn.pkl")
+
+JOBS = [(1, "Data Scientist", "python and machine learning", "Python;SQL"),
+        (2, "Frontend Developer", "react web apps", "React;CSS"),
+        (3, "DevOps Engineer", "docker and kubernetes", "Docker;Linux")]
+
+
+@pytest.fixture(scope="module")
+def vectorizer():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_PATH).named_steps["tfidf"]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    migrate(path)
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO jobs (id, title, description, required_skills) VALUES (?, ?, ?, ?)", JOBS)
+    return path
+
+
+def write(db, query, params=()):
+    with connect(db) as conn:
+        conn.execute(query, params)
+
+
+def assert_matches_rebuild(store, vectorizer, tmp_path):
+    fresh = JobVectorStore(vectorizer, store.db_path, str(tmp_path / "fresh.pkl"))
+    fresh.load()
+    assert store.job_ids == fresh.job_ids
+    assert store.titles == fresh.titles
+    assert store.version == fresh.version
+    assert (store.matrix != fresh.matrix).nnz == 0
+
+
+def test_upsert_and_remove_round_trip(db, vectorizer, tmp_path):
+    store = JobVectorStore(vectorizer, db, str(tmp_path / "jobs.pkl"))
+    store.load()
+    before = store.snapshot()
+
+    write(db, "INSERT INTO jobs (id, title, description, required_skills) VALUES (4, 'Backend Developer', 'flask apis', 'Python;Flask')")
+    store.upsert(4)
+    assert store.position(4) == 3
+    assert (store.matrix[3] != vectorizer.transform([job_text((4, "Backend Developer", "flask apis", "Python;Flask"))])).nnz == 0
+    assert_matches_rebuild(store, vectorizer, tmp_path)
+
+    write(db, "UPDATE jobs SET title='ML Engineer', description='deep learning' WHERE id=1")
+    store.upsert(1)
+    assert store.titles[0] == "ml engineer"
+    assert_matches_rebuild(store, vectorizer, tmp_path)
+
+    write(db, "DELETE FROM jobs WHERE id=2")
+    store.remove(2)
+    assert store.job_ids == [1, 3, 4] and store.position(2) is None
+    assert_matches_rebuild(store, vectorizer, tmp_path)
+
+    # Snapshots taken before the writes still describe the rows they were taken from
+    assert before.keys == (1, 2, 3) and before.matrix.shape[0] == 3
+    assert (before.position(3), before.position(4)) == (2, None)
+    assert list(before.title_positions("frontend developer")) == [1]
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_deltas_never_rebuild_on_the_write_path(db, vectorizer, tmp_path):
+    store = JobVectorStore(vectorizer, db, str(tmp_path / "jobs.pkl"))
+    store.load()
+    store.rebuild = lambda: pytest.fail("rebuilt on a write")
+    # Two writers commit before either updates the store: a transient gap, closed by the second delta
+    write(db, "INSERT INTO jobs (id, title) VALUES (5, 'Tester')")
+    write(db, "INSERT INTO jobs (id, title) VALUES (6, 'Analyst')")
+    store.upsert(6)
+    store.upsert(5)
+    assert store.job_ids == [1, 2, 3, 6, 5] and store.version == store.db_version()
+    store.remove(42)  # deleted nothing
+    assert store.version == store.db_version()
+
+
+def test_unseen_write_rebuilds_in_background(db, vectorizer, tmp_path):
+    store = JobVectorStore(vectorizer, db, str(tmp_path / "jobs.pkl"), rebuild_delay=0)
+    store.load()
+    write(db, "INSERT INTO jobs (id, title) VALUES (5, 'Tester')")  # never reported to the store
+    write(db, "INSERT INTO jobs (id, title) VALUES (6, 'Analyst')")
+    store.upsert(6)
+    assert 6 in store.job_ids  # the delta is applied right away
+    wait_for(lambda: store.job_ids == [1, 2, 3, 5, 6])
+    assert_matches_rebuild(store, vectorizer, tmp_path)
+
+
+def test_write_during_rebuild_survives_the_swap(db, vectorizer, tmp_path):
+    store = JobVectorStore(vectorizer, db, str(tmp_path / "jobs.pkl"))
+    store.load()
+    row_meta = store.row_meta
+
+    def write_mid_build(rows, texts):
+        if len(rows) > 1:
+            write(db, "INSERT INTO jobs (id, title) VALUES (7, 'Designer')")
+            store.upsert(7)
+        return row_meta(rows, texts)
+
+    store.row_meta = write_mid_build
+    store.rebuild()
+    store.row_meta = row_meta
+    assert store.job_ids == [1, 2, 3, 7]
+    assert_matches_rebuild(store, vectorizer, tmp_path)
+
+
+def test_deltas_are_persisted_lazily(db, vectorizer, tmp_path):
+    cache = str(tmp_path / "jobs.pkl")
+    store = JobVectorStore(vectorizer, db, cache, save_delay=3600)
+    store.load()
+    saved = os.path.getmtime(cache), os.path.getsize(cache)
+    write(db, "DELETE FROM jobs WHERE id=2")
+    store.remove(2)
+    assert (os.path.getmtime(cache), os.path.getsize(cache)) == saved
+    store.flush()
+    reloaded = JobVectorStore(vectorizer, db, cache)
+    reloaded.rebuild = lambda: pytest.fail("rebuilt although the snapshot is current")
+    reloaded.load()
+    assert reloaded.job_ids == [1, 3]
+
+
+def test_disk_snapshot_reused_only_for_current_version(db, vectorizer, tmp_path):
+    cache = str(tmp_path / "jobs.pkl")
+    JobVectorStore(vectorizer, db, cache).load()
+    store = JobVectorStore(vectorizer, db, cache)
+    store.rebuild = lambda: pytest.fail("rebuilt although the snapshot is current")
+    store.load()
+    assert store.job_ids == [1, 2, 3]
+
+    write(db, "DELETE FROM jobs WHERE id=3")
+    store = JobVectorStore(vectorizer, db, cache)
+    store.load()
+    assert store.job_ids == [1, 2]
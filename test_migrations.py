@@ -0,0 +1,109 @@
+"""
+Schema migrations: version bookkeeping, upgrading a drifted database,
+EXPLAIN QUERY PLAN checks that the hot queries use the new indexes, and the
+frozen insight snapshot backfill.
+
+Run: python -m pytest test_migrations.py
+"""
+
+import sqlite3
+import insights
+from migrations import LATEST_VERSION, current_version, migrate
+
+DASHBOARD_QUERY = """SELECT j.*, r.match_score, r.match_reason FROM job_recommendations r
+                     JOIN jobs j ON r.job_id = j.id WHERE r.user_id = ? ORDER BY r.match_score DESC"""
+
+
+def plan(db_path, query, params=()):
+    with sqlite3.connect(db_path) as conn:
+        return " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+
+def test_fresh_database_reaches_latest_version(tmp_path):
+    db = str(tmp_path / "fresh.db")
+    assert migrate(db) == list(range(1, LATEST_VERSION + 1))
+    assert migrate(db) == []
+    with sqlite3.connect(db) as conn:
+        assert current_version(conn) == LATEST_VERSION
+
+
+def test_job_and_profile_writes_bump_table_versions(tmp_path):
+    db = str(tmp_path / "fresh.db")
+    migrate(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO jobs (title) VALUES ('Data Analyst')")
+        conn.execute("UPDATE jobs SET title = 'Data Engineer'")
+        conn.execute("INSERT INTO student_profile (user_id, full_name) VALUES (1, 'Amy')")
+        versions = dict(conn.execute("SELECT name, version FROM table_versions WHERE name IN ('jobs', 'student_profile')"))
+    assert versions == {"jobs": 2, "student_profile": 1}
+
+
+def test_drifted_database_gains_missing_columns(tmp_path):
+    db = str(tmp_path / "old.db")
+    with sqlite3.connect(db) as conn:
+        # Shapes found in older data.db files: no application_link, no course_link
+        conn.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, required_skills TEXT, posted_by TEXT, created_at TEXT)")
+        conn.execute("CREATE TABLE courses (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT, description TEXT, category TEXT, added_by TEXT, created_at TEXT)")
+        conn.execute("INSERT INTO jobs (title) VALUES ('Data Analyst')")
+    migrate(db)
+    with sqlite3.connect(db) as conn:
+        assert "application_link" in [r[1] for r in conn.execute("PRAGMA table_info(jobs)")]
+        assert "course_link" in [r[1] for r in conn.execute("PRAGMA table_info(courses)")]
+        assert conn.execute("SELECT title FROM jobs").fetchall() == [("Data Analyst",)]
+
+
+def test_dashboard_query_uses_index_without_sort(tmp_path):
+    db = str(tmp_path / "plan.db")
+    migrate(db)
+    query_plan = plan(db, DASHBOARD_QUERY, (1,))
+    assert "idx_job_recommendations_user_score" in query_plan
+    assert "TEMP B-TREE" not in query_plan
+
+
+def test_course_video_lookups_use_index(tmp_path):
+    db = str(tmp_path / "plan.db")
+    migrate(db)
+    assert "idx_course_videos_course" in plan(db, "SELECT * FROM course_videos WHERE course_id = ?", (1,))
+    assert "idx_job_recommendations_job" in plan(db, "DELETE FROM job_recommendations WHERE job_id = ?", (1,))
+    assert "TEMP B-TREE" not in plan(db, "SELECT DISTINCT category FROM courses ORDER BY category")
+
+
+def test_foreign_key_rebuild_keeps_rows_indexes_and_triggers(tmp_path):
+    db = str(tmp_path / "v5.db")
+    migrate(db, target=5)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO course_videos (course_id, video_title) VALUES (3, 'Intro')")
+        conn.execute("ALTER TABLE student_profile ADD COLUMN github TEXT")  # added by hand on some installs
+        conn.execute("INSERT INTO student_profile (user_id, full_name, github) VALUES (1, 'Amy', 'amy-dev')")
+    assert migrate(db, target=6) == [6]
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT full_name, github FROM student_profile").fetchall() == [("Amy", "amy-dev")]
+        assert conn.execute("SELECT course_id, video_title FROM course_videos").fetchall() == [(3, "Intro")]
+        actions = {(r[2], r[6]) for t in ("student_profile", "job_recommendations", "course_videos")
+                   for r in conn.execute(f"PRAGMA foreign_key_list({t})")}
+        assert actions == {("users", "CASCADE"), ("jobs", "CASCADE"), ("courses", "SET NULL")}
+        triggers = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'course_videos'")}
+        assert triggers == {"course_videos_version_insert", "course_videos_version_update", "course_videos_version_delete"}
+    assert "idx_job_recommendations_user_score" in plan(db, DASHBOARD_QUERY, (1,))
+
+
+def test_insight_backfill_matches_current_snapshots(tmp_path):
+    db = str(tmp_path / "v8.db")
+    migrate(db, target=8)
+    with sqlite3.connect(db) as conn:
+        conn.executemany("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         [(i, f"u{i}", f"u{i}@x.io") for i in (1, 2, 3)])
+        conn.executemany("INSERT INTO student_profile (user_id, full_name, skills, tech_stack, experience) VALUES (?, ?, ?, ?, ?)",
+                         [(1, "Amy", "Python, SQL, Docker", "Flask, React", "two years " * 6), (2, "Ben", "Go", None, "intern"),
+                          (3, None, None, None, None)])
+        conn.executemany("INSERT INTO jobs (id, title) VALUES (?, ?)", [(j, f"Job {j}") for j in range(1, 8)])
+        conn.executemany("INSERT INTO job_recommendations (user_id, job_id, match_score) VALUES (?, ?, ?)",
+                         [(1, j, j / 10) for j in range(1, 8)] + [(2, 3, 0.25)])
+    migrate(db, target=9)
+    query = "SELECT user_id, completeness, insights, confidence, top_jobs, rec_count FROM insight_snapshots ORDER BY user_id"
+    with sqlite3.connect(db) as conn:
+        migrated = conn.execute(query).fetchall()
+        # The frozen backfill and today's insights.refresh still agree
+        insights.refresh(conn, [1, 2, 3])
+        assert conn.execute(query).fetchall() == migrated
+    assert len(migrated) == 3 and migrated[0][3] == 70 and migrated[0][5] == 7
@@ -4,9 +4,12 @@ Test Password Reset Functionality
 Shows how the demo mode works with working reset links.
 """
 
+import os
 from dotenv import load_dotenv
 load_dotenv()
 
+# Importing app migrates and indexes its database; use the in-memory store, never the checked-in data.db
+os.environ.setdefault("FLASK_STORAGE", "memory")
 import app
 
 def test_password_reset():
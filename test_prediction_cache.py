@@ -0,0 +1,64 @@
+"""
+Prediction cache: repeated texts are served from memory or the shared disk
+tier without calling the model, and a changed model file invalidates both.
+
+Run: python -m pytest test_prediction_cache.py
+"""
+
+import sqlite3
+from sklearn.feature_extraction.text import TfidfVectorizer
+from prediction_cache import PredictionCache
+
+
+class CountingModel:
+    """Labels a text by its first word and counts predict calls"""
+
+    def __init__(self, suffix=""):
+        self.named_steps = {"tfidf": TfidfVectorizer()}
+        self.calls = 0
+        self.suffix = suffix
+
+    def predict(self, texts):
+        self.calls += 1
+        return [(t.split() or ["none"])[0].lower() + self.suffix for t in texts]
+
+
+def test_hit_and_miss():
+    model = CountingModel()
+    cache = PredictionCache(model, max_size=2)
+    assert cache.predict("Python developer") == "python"
+    assert cache.predict("  python   DEVELOPER ") == "python"  # same tokens for a lower-casing vectorizer
+    assert cache.predict("Java developer") == "java"
+    assert model.calls == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+    cache.predict("Go developer")  # evicts the least recently used entry
+    assert cache.stats()["size"] == 2
+    cache.predict("Python developer")
+    assert model.calls == 4
+
+
+def test_disk_tier_shared_between_instances(tmp_path):
+    disk = str(tmp_path / "predictions.db")
+    PredictionCache(CountingModel(), disk_path=disk).predict("SQL analyst")
+    model = CountingModel()
+    cache = PredictionCache(model, disk_path=disk)
+    assert cache.predict("SQL analyst") == "sql"
+    assert model.calls == 0 and cache.stats()["disk_hits"] == 1
+
+
+def test_model_change_invalidates(tmp_path):
+    model_path = tmp_path / "model.pkl"
+    model_path.write_bytes(b"v1")
+    disk = str(tmp_path / "predictions.db")
+    old = PredictionCache(CountingModel(), model_path=str(model_path), disk_path=disk)
+    assert old.predict("Rust engineer") == "rust"
+
+    model_path.write_bytes(b"retrained")
+    model = CountingModel(suffix=" v2")
+    new = PredictionCache(model, model_path=str(model_path), disk_path=disk)
+    assert new.key("Rust engineer") != old.key("Rust engineer")
+    assert new.predict("Rust engineer") == "rust v2"
+    assert model.calls == 1
+    with sqlite3.connect(disk) as conn:  # the old version's rows are dropped on start-up
+        assert conn.execute("SELECT DISTINCT model_version FROM predictions").fetchall() == [(new.model_version,)]
@@ -0,0 +1,61 @@
+"""
+Recommendation writer: replace_rows swaps exactly the given students' sets,
+leaves everyone else alone, and writes nothing if any row fails.
+
+Run: python -m pytest test_recommendation_store.py
+"""
+
+import sqlite3
+import pytest
+from db import connect
+from migrations import migrate
+import recommendation_store
+from recommendation_store import replace_rows, replace_user, replace_users, recommendation_rows
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "recs.db")
+    migrate(path)
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO users (id, username, email, password) VALUES (?, ?, ?, 'pw')",
+                         [(i, f"user{i}", f"user{i}@x.io") for i in range(1, 8)])
+        conn.executemany("INSERT INTO jobs (id, title) VALUES (?, ?)", [(i, f"Job {i}") for i in range(1, 6)])
+        conn.executemany("INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason, created_at) "
+                         "VALUES (?, ?, 0.5, 'old', '2024-01-01')", [(u, j) for u in (1, 2, 3) for j in (1, 2)])
+    return path
+
+
+def rows(db):
+    with connect(db) as conn:
+        return sorted(conn.execute("SELECT user_id, job_id, match_score, match_reason, created_at FROM job_recommendations"))
+
+
+def test_replaces_only_the_given_students(db):
+    new = [(1, 3, 0.9, "new", "2024-02-01"), (1, 4, 0.8, "new", "2024-02-01")]
+    with connect(db) as conn:
+        assert replace_rows(conn, [1, 2], new) == 2
+    # Student 2 is in user_ids without rows: the set is emptied; student 3 is untouched
+    assert rows(db) == new + [(3, 1, 0.5, "old", "2024-01-01"), (3, 2, 0.5, "old", "2024-01-01")]
+
+
+def test_failed_insert_keeps_old_sets(db):
+    with connect(db) as conn:
+        with pytest.raises(sqlite3.IntegrityError):
+            replace_rows(conn, [1], [(1, 3, 0.9, "new", "2024-02-01"), (1, 99, 0.8, "unknown job", "2024-02-01")])
+    assert [r for r in rows(db) if r[0] == 1] == [(1, 1, 0.5, "old", "2024-01-01"), (1, 2, 0.5, "old", "2024-01-01")]
+
+
+def test_deletes_in_batches(db, monkeypatch):
+    monkeypatch.setattr(recommendation_store, "DELETE_BATCH", 2)
+    with connect(db) as conn:
+        replace_users(conn, {u: [{"job_id": 5, "score": 0.7, "reason": "r"}] for u in range(1, 8)}, "2024-03-01")
+    assert rows(db) == [(u, 5, 0.7, "r", "2024-03-01") for u in range(1, 8)]
+
+
+def test_replace_user_builds_rows_from_results(db):
+    results = [{"job_id": 2, "score": 1.0, "reason": "AI Match: dev"}]
+    assert recommendation_rows(4, results, "2024-04-01") == [(4, 2, 1.0, "AI Match: dev", "2024-04-01")]
+    with connect(db) as conn:
+        assert replace_user(conn, 3, results, "2024-04-01") == 1
+    assert [r for r in rows(db) if r[0] == 3] == [(3, 2, 1.0, "AI Match: dev", "2024-04-01")]
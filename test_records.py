@@ -0,0 +1,57 @@
+"""
+Row records: projected queries fill fields by name, whatever the physical
+column order of a migrated table.
+
+Run: python -m pytest test_records.py
+"""
+
+import sqlite3
+from migrations import migrate
+from job_vectors import PROFILE_COLUMNS
+from records import (StudentProfile, ScoringProfile, ReportProfile, Course, load_profile, load_jobs,
+                     load_recommendations, columns)
+
+
+def make_db(tmp_path):
+    db = str(tmp_path / "records.db")
+    migrate(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO jobs (title, description, required_skills, posted_by, created_at, application_link) "
+                     "VALUES ('Data Analyst', 'SQL reports', 'SQL, Excel', 'acme', '2025-01-01', 'https://acme.io/apply')")
+        conn.execute("INSERT INTO student_profile (user_id, full_name, skills, experience) VALUES (7, 'Amy', 'SQL', '2')")
+        conn.execute("INSERT INTO job_recommendations (user_id, job_id, match_score, match_reason) VALUES (7, 1, 0.8, 'SQL')")
+
+    def fetchall(query, params=()):
+        with sqlite3.connect(db) as conn:
+            return conn.execute(query, params).fetchall()
+
+    return fetchall
+
+
+def test_records_read_columns_by_name(tmp_path):
+    fetchall = make_db(tmp_path)
+    profile = load_profile(fetchall, 7)
+    assert (profile.full_name, profile.skills, profile.experience) == ("Amy", "SQL", "2")
+    assert load_profile(fetchall, 8) is None
+
+    # Rescoring and the report select only the columns they read
+    queries = []
+    scoring = load_profile(lambda q, p=(): queries.append(q) or fetchall(q, p), 7, ScoringProfile)
+    assert (scoring.user_id, scoring.skills, scoring.experience) == (7, "SQL", "2")
+    assert queries == [f"SELECT {PROFILE_COLUMNS} FROM student_profile WHERE user_id=?"]
+    report = load_profile(fetchall, 7, ReportProfile)
+    assert (report.full_name, report.skills) == ("Amy", "SQL") and "id" not in report._fields
+
+    job, = load_jobs(fetchall)
+    assert (job.id, job.title, job.required_skills) == (1, "Data Analyst", "SQL, Excel")
+
+    rec, = load_recommendations(fetchall, 7)
+    # application_link was added after created_at, so SELECT j.* put the date where the link was expected
+    assert (rec.posted_by, rec.application_link, rec.match_score) == ("acme", "https://acme.io/apply", 0.8)
+
+
+def test_records_are_slotted_and_indexable():
+    profile = StudentProfile._make(range(len(StudentProfile._fields)))
+    assert not hasattr(profile, "__dict__")
+    assert profile[7] == profile.skills
+    assert columns(Course, "c") == "c.id, c.title, c.description, c.category, c.course_link"
@@ -0,0 +1,89 @@
+"""
+Parity check: the vectorized scoring path must recommend exactly what the
+original per-job loop (cosine_similarity per row, then a stable sort on the
+score) recommended on the bundled jobs.csv, ties included.
+
+Run: python -m pytest test_scoring.py
+"""
+
+import os
+import csv
+import random
+import warnings
+import joblib
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+from scoring import similarity_scores, top_k_indices, title_matches, rank_matches, rank_matches_many
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(APP_DIR, "models", "job_recommendation_type_knn.pkl")
+JOBS_CSV = os.path.join(APP_DIR, "jobs.csv")
+
+
+def load_model():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_PATH)
+
+
+def load_jobs():
+    with open(JOBS_CSV, newline="", encoding="utf-8") as f:
+        return [(i, row["title"], row["description"], row["requirements"]) for i, row in enumerate(csv.DictReader(f), 1)]
+
+
+def baseline(label, profile_vec, jobs, job_matrix, top_k=10):
+    """The loop app.py used before scoring.py"""
+    recs = []
+    for idx, job in enumerate(jobs):
+        job_title = (job[1] or "").lower()
+        if label and (label in job_title or job_title in label):
+            recs.append({"job_id": job[0], "score": 1.0, "reason": f"AI Match: {label}"})
+            continue
+        sim = float(cosine_similarity(profile_vec, job_matrix[idx:idx + 1])[0][0])
+        if sim >= 0.2:
+            recs.append({"job_id": job[0], "score": round(sim, 3), "reason": f"Similarity: {sim:.2f}"})
+    return sorted(recs, key=lambda x: x["score"], reverse=True)[:top_k]
+
+
+def test_rank_matches_reproduces_baseline_on_jobs_csv():
+    model = load_model()
+    vectorizer = model.named_steps["tfidf"]
+    jobs = load_jobs()
+    job_matrix = vectorizer.transform([" ".join(j[1:]) for j in jobs])
+    titles = [j[1].lower() for j in jobs]
+    job_ids = [j[0] for j in jobs]
+
+    rnd = random.Random(0)
+    vocab = list(vectorizer.vocabulary_) + ["engineer", "developer", "unknownword"]
+    texts = [" ".join(rnd.sample(vocab, rnd.randint(0, 8))) for _ in range(40)] + [""]
+    labels = [str(l).strip().lower() for l in model.predict(texts)]
+    labels[:5] = [None] * 5  # no prediction: similarity only
+
+    profiles = vectorizer.transform(texts)
+    sims_block, masks = [], []
+    for i, (text, label) in enumerate(zip(texts, labels)):
+        sims = similarity_scores(profiles[i], job_matrix)
+        ai_match = title_matches(label, titles)
+        sims_block.append(sims)
+        masks.append(ai_match)
+        assert rank_matches(sims, ai_match, label, job_ids) == baseline(label, profiles[i], jobs, job_matrix)
+
+    block = rank_matches_many(np.array(sims_block), np.array(masks), labels, job_ids)
+    for i, label in enumerate(labels):
+        assert block[i] == baseline(label, profiles[i], jobs, job_matrix)
+
+
+def test_ties_keep_row_order():
+    scores = [0.5, 0.9, 0.5, 0.7, 0.5, 0.5]
+    assert list(top_k_indices(scores, 4)) == [1, 3, 0, 2]
+    assert list(top_k_indices(scores, 10)) == [1, 3, 0, 2, 4, 5]
+    assert list(top_k_indices(scores, 3, eligible=np.array([1, 0, 1, 0, 1, 1], dtype=bool))) == [0, 2, 4]
+    assert list(top_k_indices(scores, 0)) == []
+
+    sims = np.array([[0.3, 0.3, 0.1, 0.3], [0.25, 0.25, 0.25, 0.25]])
+    ai_match = np.array([[False, False, True, False], [False, False, False, False]])
+    ranked = rank_matches_many(sims, ai_match, ["dev", None], [11, 12, 13, 14], top_k=3)
+    assert [[r["job_id"] for r in recs] for recs in ranked] == [[13, 11, 12], [11, 12, 13]]
+    assert ranked[0][0]["reason"] == "AI Match: dev"
+    for row in range(2):
+        assert ranked[row] == rank_matches(sims[row], ai_match[row], ["dev", None][row], [11, 12, 13, 14], top_k=3)
@@ -0,0 +1,75 @@
+"""
+Full-text search: the FTS5 indexes follow inserts, updates and deletes, rank
+title hits first, and the /search endpoint applies prefix matching.
+
+Run: python -m pytest test_search.py
+"""
+
+import pytest
+from flask import Flask
+from db import connect
+from migrations import migrate
+from search import SearchAPI, search, match_all, match_any
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "search.db")
+    migrate(path)
+    with connect(path) as conn:
+        conn.executemany("INSERT INTO jobs (title, description, required_skills, posted_by) VALUES (?, ?, ?, ?)", [
+            ("Python Developer", "Build APIs", "Python, Flask", "acme"),
+            ("Data Analyst", "Reports with Python and SQL", "SQL, Excel", "globex"),
+            ("Embedded Engineer", "Firmware in C++", "C++, C", "initech"),
+        ])
+        conn.executemany("INSERT INTO courses (title, description, category) VALUES (?, ?, ?)", [
+            ("SQL Database Mastery", "Queries and indexes", "Databases"),
+            ("Machine Learning A-Z", "Models with scikit-learn", "Data Science & ML"),
+        ])
+
+    def fetchall(query, params=()):
+        with connect(path) as conn:
+            return conn.execute(query, params).fetchall()
+
+    fetchall.path = path
+    return fetchall
+
+
+def titles(rows):
+    return [r[1] for r in rows]
+
+
+def test_title_matches_rank_first_and_prefixes_match(db):
+    assert titles(search(db, "jobs", match_all("python"))) == ["Python Developer", "Data Analyst"]
+    assert titles(search(db, "jobs", match_all("dev"))) == ["Python Developer"]
+    assert titles(search(db, "jobs", match_any(["C++"]))) == ["Embedded Engineer"]
+    assert titles(search(db, "courses", match_any(["machine learning", "excel"]))) == ["Machine Learning A-Z"]
+    assert search(db, "courses", match_any(["learning machine"])) == []  # phrases keep word order
+    assert match_all(" ,; ") is None and search(db, "jobs", None) == []
+
+
+def test_index_follows_updates_and_deletes(db):
+    with connect(db.path) as conn:
+        conn.execute("UPDATE jobs SET title = 'Rust Developer' WHERE title = 'Python Developer'")
+        conn.execute("DELETE FROM jobs WHERE title = 'Data Analyst'")
+        conn.execute("INSERT INTO courses (title, category) VALUES ('Rust in Action', 'Programming')")
+    assert titles(search(db, "jobs", match_all("python"))) == ["Rust Developer"]  # still listed in required_skills
+    assert titles(search(db, "jobs", match_all("rust"))) == ["Rust Developer"]
+    assert search(db, "jobs", match_all("reports")) == []
+    assert titles(search(db, "courses", match_all("rust"))) == ["Rust in Action"]
+
+
+def test_search_endpoint(db):
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(SearchAPI(db).blueprint)
+    client = app.test_client()
+    assert client.get("/search?q=sql").status_code == 401
+    with client.session_transaction() as s:
+        s["role"] = "student"
+    data = client.get("/search?q=sql da").json
+    assert [j["title"] for j in data["jobs"]] == ["Data Analyst"]
+    assert [c["title"] for c in data["courses"]] == ["SQL Database Mastery"]
+    assert set(client.get("/search?q=sql&type=courses").json) == {"query", "courses"}
+    assert client.get("/search?q=").status_code == 400
+    assert client.get("/search?q=sql&type=videos").status_code == 400
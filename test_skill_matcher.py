@@ -0,0 +1,121 @@
+"""
+Parity check: the compiled skill matcher and the batch (whole catalogue)
+path must reproduce calculate_skill_match_score (score and reason) on the
+bundled jobs.csv, including through the catalogue 1.py scores with.
+
+Run: python -m pytest test_skill_matcher.py
+"""
+
+import os
+import csv
+import random
+import threading
+import time
+import importlib
+import pytest
+from skill_matcher import SkillCatalogue, SkillMatcher, calculate_skill_match_score
+
+JOBS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jobs.csv")
+
+# Exact names from jobs.csv plus partial/overlapping ones to exercise substring matching
+PROFILE_SKILLS = ["Python", "SQL", "Java", "JavaScript", "Docker", "React", "React Native", "Linux",
+                  "Git", "GitHub", "AWS", "TensorFlow", "HTML", "HTML5", "CSS", "Flask", "Django",
+                  "Pandas", "C", "C++", "Node", "Node.js", "Kubernetes", "Go", "REST", "Azure", "ML"]
+
+
+def load_jobs():
+    with open(JOBS_CSV, newline="", encoding="utf-8") as f:
+        return [(row["requirements"], row["min_experience_years"]) for row in csv.DictReader(f)]
+
+
+def random_profiles(n, seed=0):
+    rnd = random.Random(seed)
+    profiles = []
+    for _ in range(n):
+        skills = rnd.sample(PROFILE_SKILLS, rnd.randint(1, 10))
+        if rnd.random() < 0.2:
+            skills.append(rnd.choice(skills).upper())  # duplicate after lower-casing
+        ratings = [str(rnd.randint(0, 5)) for _ in skills[:rnd.randint(0, len(skills))]]
+        experience = rnd.choice([None, "0", "1", "2.5", "5", "ten"])
+        profiles.append((", ".join(skills), ",".join(ratings), experience))
+    profiles += [("", "", None), ("Python", "", "2"), ("Python, SQL", "4", None)]
+    return profiles
+
+
+def test_compiled_matches_scalar_on_jobs_csv():
+    jobs = load_jobs() + [("", "1"), (";;", "0"), ("Python; ;sql", None)]
+    catalogue = SkillCatalogue()
+    for skills, ratings, experience in random_profiles(300):
+        matcher = SkillMatcher(catalogue, skills, ratings)
+        for required, min_exp in jobs:
+            expected = calculate_skill_match_score(skills, ratings, required, experience, min_exp)
+            assert matcher.score(catalogue.compile(required), experience, min_exp) == expected
+
+
+def test_batch_matches_scalar_on_jobs_csv():
+    jobs = load_jobs() + [("", "1"), (";;", "0"), ("Python; ;sql;python", None), ("Go", "admin")]
+    catalogue = SkillCatalogue()
+    job_skills = catalogue.job_matrix([required for required, _ in jobs])
+    min_exp = [m for _, m in jobs]
+    for skills, ratings, experience in random_profiles(300, seed=1):
+        batch = SkillMatcher(catalogue, skills, ratings).score_all(job_skills, experience, min_exp)
+        for idx, (required, m) in enumerate(jobs):
+            expected = calculate_skill_match_score(skills, ratings, required, experience, m)
+            assert (batch.final[idx], batch.reason(idx)) == expected
+
+
+@pytest.fixture(scope="module")
+def portal():
+    """1.py on the in-memory store, never the checked-in data.db"""
+    os.environ.setdefault("FLASK_STORAGE", "memory")
+    return importlib.import_module("1")
+
+
+def test_portal_catalogue_matches_scalar_on_jobs_csv(portal):
+    # Jobs as jobs.csv stores them and comma-joined as populate_data.py stores them
+    jobs = load_jobs()
+    jobs += [(required.replace(";", ", "), m) for required, m in jobs]
+    job_skills = portal.skill_catalogue.job_matrix([required for required, _ in jobs])
+    min_exp = [m for _, m in jobs]
+    for skills, ratings, experience in random_profiles(100, seed=2):
+        batch = SkillMatcher(portal.skill_catalogue, skills, ratings).score_all(job_skills, experience, min_exp)
+        for idx, (required, m) in enumerate(jobs):
+            expected = calculate_skill_match_score(skills, ratings, required, experience, m)
+            assert (batch.final[idx], batch.reason(idx)) == expected
+
+
+def test_catalogue_interns_each_skill_once():
+    catalogue = SkillCatalogue()
+    a = catalogue.compile("Python;SQL;Docker")
+    b = catalogue.compile("docker; python")
+    assert b == (a[2], a[0])
+    assert catalogue.weights[a[0]] == 2.0
+    assert catalogue.compile("") is None
+
+
+class YieldingList(list):
+    """A list whose len() lets other threads run, widening any check-then-append race"""
+
+    def __len__(self):
+        time.sleep(0.0001)
+        return super().__len__()
+
+
+def test_concurrent_interning_keeps_ids_consistent():
+    catalogue = SkillCatalogue()
+    catalogue.names = YieldingList()
+    strings = [";".join(f"skill{(i * 7 + j) % 300}" for j in range(5)) for i in range(600)]
+
+    def work(offset):
+        for s in strings[offset:] + strings[:offset]:
+            catalogue.compile(s)
+
+    threads = [threading.Thread(target=work, args=(n * 75,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(catalogue.names) == len(set(catalogue.names)) == len(catalogue.weights) == 300
+    assert all(catalogue.names[skill_id] == name for name, skill_id in catalogue.ids.items())
+    for s in strings:
+        assert [catalogue.names[i] for i in catalogue.compile(s)] == s.split(";")
@@ -0,0 +1,56 @@
+"""
+Storage backends: the memory engine is loaded from the bundled CSVs, scales
+deterministically, stays private to its instance and never touches disk.
+
+Run: python -m pytest test_storage.py
+"""
+
+import os
+import pytest
+from migrations import LATEST_VERSION, current_version
+from db import connect
+from storage import MemoryStorage, SQLiteStorage, open_storage
+
+
+def test_memory_storage_loads_bundled_csvs():
+    storage = MemoryStorage()
+    try:
+        assert storage.counts == {"jobs": 50, "students": 150, "recommendations": 300}
+        with storage.pool.connection() as conn:
+            assert current_version(conn) == LATEST_VERSION
+        profile = storage.fetchall("SELECT full_name, skills, skill_ratings FROM student_profile WHERE user_id = 1")
+        assert profile == [("Arjun Sharma", "TensorFlow, Azure, Java, Python", "2,3,3,2")]
+        assert storage.fetchall("SELECT required_skills FROM jobs WHERE id = 1") == [("Docker, REST, CSS, Flask, Linux, GraphQL",)]
+    finally:
+        storage.close()
+
+
+def test_scale_is_repeatable_and_instances_are_isolated():
+    a, b = MemoryStorage(scale=3, seed=7), MemoryStorage(scale=3, seed=7)
+    try:
+        assert a.counts["jobs"] == 150 and a.counts["students"] == 450
+        query = "SELECT id, required_skills FROM jobs ORDER BY id"
+        assert a.fetchall(query) == b.fetchall(query)
+        a.execute("DELETE FROM jobs")
+        assert len(b.fetchall(query)) == 150
+        # Other modules open the same database by its URI
+        with connect(a.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone() == (0,)
+    finally:
+        a.close()
+        b.close()
+
+
+def test_artifacts_stay_out_of_models_dir(tmp_path):
+    memory = MemoryStorage()
+    path = memory.artifact_path(os.path.join("models", "job_vectors.pkl"))
+    assert not path.startswith("models") and os.path.isdir(os.path.dirname(path))
+    memory.close()
+    assert not os.path.exists(os.path.dirname(path))
+
+    db = str(tmp_path / "file.db")
+    storage = open_storage("sqlite", db)
+    assert isinstance(storage, SQLiteStorage) and storage.artifact_path("models/x.pkl") == "models/x.pkl"
+    storage.close()
+    with pytest.raises(ValueError):
+        open_storage("postgres")
@@ -0,0 +1,92 @@
+"""
+Background task queue: deduplication, one running task per key, retries
+with backoff, lease expiry and the worker loop.
+
+Run: python -m pytest test_task_queue.py
+"""
+
+import time
+import sqlite3
+import threading
+from migrations import migrate
+from task_queue import TaskQueue, Worker
+
+
+def make_queue(tmp_path, **kwargs):
+    db = str(tmp_path / "tasks.db")
+    migrate(db)
+    return TaskQueue(db, **kwargs)
+
+
+def test_queued_task_is_deduplicated_per_key(tmp_path):
+    q = make_queue(tmp_path)
+    assert q.enqueue("rescore_user", 7, {"user_id": 7})
+    assert not q.enqueue("rescore_user", 7, {"user_id": 7})
+    assert q.enqueue("rescore_user", 8, {"user_id": 8})
+    task = q.claim()
+    assert task["payload"] == {"user_id": 7} and task["attempts"] == 1
+    # Once running, a newer save must queue a fresh rescore
+    assert q.enqueue("rescore_user", 7, {"user_id": 7})
+    assert q.pending("rescore_user", 7)
+
+
+def test_key_waits_while_its_task_runs(tmp_path):
+    q = make_queue(tmp_path)
+    started, release, runs = threading.Event(), threading.Event(), []
+
+    def handler(payload):
+        runs.append(payload["n"])
+        if payload["n"] == 1:
+            started.set()
+            release.wait(5)
+
+    first, second = Worker(q, {"rescore_user": handler}), Worker(q, {"rescore_user": handler})
+    q.enqueue("rescore_user", 7, {"n": 1})
+    running = threading.Thread(target=first.run_once)
+    running.start()
+    assert started.wait(5)
+    q.enqueue("rescore_user", 7, {"n": 2})
+    q.enqueue("rescore_user", 8, {"n": 3})
+    # The second worker takes the other key but leaves user 7's newer rescore queued
+    assert second.run_once() and runs == [1, 3]
+    assert not second.run_once()
+    release.set()
+    running.join(5)
+    assert second.run_once() and runs == [1, 3, 2]
+    assert not q.pending("rescore_user", 7)
+
+
+def test_failed_task_retries_with_backoff_then_gives_up(tmp_path):
+    q = make_queue(tmp_path, max_attempts=2, backoff_seconds=0.05)
+    q.enqueue("rescore_user", 1)
+    q.fail(q.claim(), "boom")
+    assert q.claim() is None  # still backing off
+    time.sleep(0.06)
+    task = q.claim()
+    assert task["attempts"] == 2
+    q.fail(task, "boom again")
+    assert q.claim() is None
+    assert not q.pending("rescore_user", 1)
+    with sqlite3.connect(q.db_path) as conn:
+        assert conn.execute("SELECT status, last_error FROM tasks").fetchall() == [("failed", "boom again")]
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    q = make_queue(tmp_path, lease_seconds=0)
+    q.enqueue("rescore_user", 1)
+    first = q.claim()
+    time.sleep(0.01)
+    again = q.claim()
+    assert again["id"] == first["id"] and again["attempts"] == 2
+
+
+def test_worker_runs_handlers(tmp_path):
+    q = make_queue(tmp_path)
+    seen = []
+    worker = Worker(q, {"rescore_user": lambda payload: seen.append(payload["user_id"])})
+    q.enqueue("rescore_user", 3, {"user_id": 3})
+    q.enqueue("unknown", 1)
+    assert worker.run_once() and worker.run_once()
+    assert not worker.run_once()
+    assert seen == [3]
+    assert not q.pending("rescore_user", 3)